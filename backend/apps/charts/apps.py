@@ -6,3 +6,9 @@ class ChartsConfig(AppConfig):
     name = "apps.charts"
     verbose_name = "Charts"
 
+    def ready(self) -> None:
+        from apps.charts import signals  # noqa: F401
+        from apps.charts.tasks import in_flight_charts
+        from apps.core import events
+
+        events.register_snapshot(in_flight_charts)
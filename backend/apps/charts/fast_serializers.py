@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import datetime as dt
+import decimal
+import functools
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import fields as drf_fields
+from rest_framework import relations, serializers
+from rest_framework.settings import api_settings
+
+from apps.charts.registry import celestial_bodies
+from apps.charts.serializers import CelestialBodyField, NatalChartSerializer
+
+Converter = Optional[Callable[[Any], Any]]
+
+PASS_THROUGH_FIELDS = (
+    drf_fields.CharField,
+    drf_fields.IntegerField,
+    drf_fields.BooleanField,
+    drf_fields.ChoiceField,
+    drf_fields.ReadOnlyField,
+)
+
+
+def _datetime_converter(field: drf_fields.DateTimeField) -> Converter:
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if output_format is None or output_format.lower() != drf_fields.ISO_8601 or field_timezone is None:
+        return field.to_representation
+
+    def convert(value: dt.datetime):
+        if timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    return convert
+
+
+def _decimal_converter(field: drf_fields.DecimalField) -> Converter:
+    coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+    if not coerce_to_string or field.localize or field.normalize_output or field.decimal_places is None:
+        return field.to_representation
+    exponent = decimal.Decimal(".1") ** field.decimal_places
+    rounding = field.rounding
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+
+    def convert(value):
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return "{:f}".format(value.quantize(exponent, rounding=rounding, context=context))
+
+    return convert
+
+
+def _converter(field: serializers.Field) -> Tuple[str, Converter]:
+    """
+    Map a DRF field to the ``values()`` column it reads and a converter for it.
+
+    ``None`` means the database value is already the representation.
+    """
+    if isinstance(field, CelestialBodyField):
+        return field.source, celestial_bodies.representation
+    if isinstance(field, drf_fields.DateTimeField):
+        return field.source, _datetime_converter(field)
+    if isinstance(field, drf_fields.DecimalField):
+        return field.source, _decimal_converter(field)
+    if isinstance(field, drf_fields.FloatField):
+        return field.source, float
+    if isinstance(field, drf_fields.JSONField):
+        return field.source, None if not field.binary else field.to_representation
+    if isinstance(field, relations.PrimaryKeyRelatedField) and field.pk_field is None:
+        return field.source, None
+    if isinstance(field, PASS_THROUGH_FIELDS) and not isinstance(field, relations.RelatedField):
+        return field.source, None
+    raise ImproperlyConfigured(
+        f"No fast representation for {type(field).__name__} '{field.field_name}'."
+    )
+
+
+class _RowsPlan:
+    """
+    Columns and converters for one nested list of computation rows.
+    """
+
+    def __init__(self, name: str, list_field: serializers.ListSerializer) -> None:
+        child = list_field.child
+        self.name = name
+        self.model = child.Meta.model
+        self.fields = [(field.field_name, *_converter(field)) for field in child._readable_fields]
+        self.columns = [column for _, column, _ in self.fields]
+
+    def fetch(self, computation_ids: Iterable[int]) -> Dict[int, List[dict]]:
+        rows_by_computation: Dict[int, List[dict]] = defaultdict(list)
+        queryset = self.model.objects.filter(computation_id__in=computation_ids).values(
+            "computation_id", *self.columns
+        )
+        for row in queryset:
+            rows_by_computation[row["computation_id"]].append(_represent(row, self.fields))
+        return rows_by_computation
+
+
+def _represent(row: dict, fields) -> dict:
+    data = {}
+    for name, column, convert in fields:
+        value = row[column]
+        data[name] = value if value is None or convert is None else convert(value)
+    return data
+
+
+def _event_location_detail(row: dict) -> dict:
+    return {
+        "id": row["event_location"],
+        "name": row["event_location__name"],
+        "city": row["event_location__city"],
+        "state": row["event_location__state"],
+        "country": row["event_location__country"],
+        "timezone": row["event_location__timezone"],
+    }
+
+
+def _profile_detail(row: dict) -> Optional[dict]:
+    if row["profile"] is None:
+        return None
+    return {
+        "id": row["profile"],
+        "birth_datetime": row["profile__birth_datetime"],
+        "timezone": row["profile__timezone"],
+    }
+
+
+class NatalChartFastSerializer:
+    """
+    Read-only twin of ``NatalChartSerializer`` built on ``values()``.
+
+    Charts and each kind of computed row are read with one ``values()`` query
+    apiece, bodies come from the in-process registry, and every column goes
+    through a converter derived from the matching DRF field, so the output is
+    the same as the DRF serializer's without instantiating models or nested
+    serializers. ``manage.py benchmark_chart_serialization --check`` compares
+    the two byte for byte.
+    """
+
+    serializer_class = NatalChartSerializer
+    method_fields: Dict[str, Tuple[Tuple[str, ...], Callable[[dict], Any]]] = {
+        "event_location_detail": (
+            (
+                "event_location",
+                "event_location__name",
+                "event_location__city",
+                "event_location__state",
+                "event_location__country",
+                "event_location__timezone",
+            ),
+            _event_location_detail,
+        ),
+        "profile_detail": (
+            ("profile", "profile__birth_datetime", "profile__timezone"),
+            _profile_detail,
+        ),
+    }
+
+    def __init__(self, context: Optional[dict] = None) -> None:
+        self.context = context or {}
+
+    def serialize(self, queryset) -> List[dict]:
+        """
+        Representations of the charts in ``queryset``, in queryset order.
+        """
+        return [data for _, data in self._serialize(queryset)]
+
+    def serialize_by_id(self, queryset) -> Dict[int, dict]:
+        """
+        Representations keyed by chart id, even when ``?fields=`` leaves ``id`` out.
+        """
+        return dict(self._serialize(queryset))
+
+    def _serialize(self, queryset) -> List[Tuple[int, dict]]:
+        fields, nested = _plan(self.serializer_class, timezone.get_current_timezone())
+        selected = self.serializer_class.selected_fields(self.context.get("request"))
+
+        columns = {"id", "current_computation"}
+        output: List[Tuple[str, str, Any]] = []
+        for name in self.serializer_class.Meta.fields:
+            if selected is not None and name not in selected:
+                continue
+            if name in nested:
+                output.append(("rows", name, nested[name]))
+            elif name in self.method_fields:
+                method_columns, builder = self.method_fields[name]
+                columns.update(method_columns)
+                output.append(("method", name, builder))
+            else:
+                _, column, convert = fields[name]
+                columns.add(column)
+                output.append(("scalar", name, (column, convert)))
+
+        chart_rows = list(queryset.prefetch_related(None).values(*columns))
+        computation_ids = [row["current_computation"] for row in chart_rows if row["current_computation"]]
+        rows = {
+            name: plan.fetch(computation_ids) if computation_ids else {}
+            for kind, name, plan in output
+            if kind == "rows"
+        }
+
+        results = []
+        for row in chart_rows:
+            data = {}
+            for kind, name, extra in output:
+                if kind == "scalar":
+                    column, convert = extra
+                    value = row[column]
+                    data[name] = value if value is None or convert is None else convert(value)
+                elif kind == "method":
+                    data[name] = extra(row)
+                else:
+                    data[name] = rows[name].get(row["current_computation"], [])
+            results.append((row["id"], data))
+        return results
+
+
+@functools.lru_cache(maxsize=16)
+def _plan(serializer_class, current_timezone) -> Tuple[Dict[str, tuple], Dict[str, _RowsPlan]]:
+    """
+    Field converters for ``serializer_class``, built once per active timezone.
+    """
+    with timezone.override(current_timezone):
+        serializer = serializer_class()
+        fields, nested = {}, {}
+        for name, field in serializer.fields.items():
+            if isinstance(field, serializers.ListSerializer):
+                nested[name] = _RowsPlan(name, field)
+            elif not isinstance(field, serializers.SerializerMethodField):
+                fields[name] = (name, *_converter(field))
+    return fields, nested
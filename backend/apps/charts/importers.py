@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from rest_framework import serializers
+
+from apps.charts.models import NatalChart
+from apps.charts.tasks import compute_natal_charts_batch_async
+from apps.core.models import Location
+
+logger = structlog.get_logger(__name__)
+
+FORMAT_CSV = "csv"
+FORMAT_NDJSON = "ndjson"
+
+CONTENT_TYPE_FORMATS = {
+    "text/csv": FORMAT_CSV,
+    "application/csv": FORMAT_CSV,
+    "application/x-ndjson": FORMAT_NDJSON,
+    "application/ndjson": FORMAT_NDJSON,
+    "application/jsonl": FORMAT_NDJSON,
+}
+
+COORDINATE_QUANT = Decimal("0.000001")
+
+
+class NatalChartImportRowSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=128, required=False, default="Natal Chart")
+    event_datetime = serializers.DateTimeField()
+    location_id = serializers.IntegerField(required=False, allow_null=True)
+    city = serializers.CharField(max_length=128, required=False, allow_blank=True)
+    state = serializers.CharField(max_length=128, required=False, allow_blank=True, default="")
+    country = serializers.CharField(max_length=128, required=False, allow_blank=True)
+    latitude = serializers.DecimalField(
+        max_digits=9, decimal_places=6, min_value=-90, max_value=90, required=False, allow_null=True
+    )
+    longitude = serializers.DecimalField(
+        max_digits=9, decimal_places=6, min_value=-180, max_value=180, required=False, allow_null=True
+    )
+    house_system = serializers.CharField(max_length=32, required=False, default="placidus")
+    notes = serializers.CharField(required=False, allow_blank=True, default="")
+
+    def to_internal_value(self, data):
+        # CSV cells are always strings; treat empty cells as missing values.
+        data = {key: value for key, value in data.items() if key and value not in ("", None)}
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        has_id = attrs.get("location_id") is not None
+        has_coordinates = attrs.get("latitude") is not None and attrs.get("longitude") is not None
+        has_place = bool(attrs.get("city") and attrs.get("country"))
+        if not (has_id or has_coordinates or has_place):
+            raise serializers.ValidationError(
+                "Укажите location_id, координаты (latitude/longitude) или city и country."
+            )
+        return attrs
+
+
+@dataclass
+class ChartImportReport:
+    created: int = 0
+    failed: int = 0
+    chart_ids: List[int] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    errors_truncated: bool = False
+
+    def add_error(self, row: int, errors: Any) -> None:
+        self.failed += 1
+        if len(self.errors) >= settings.CHART_IMPORT_MAX_REPORTED_ERRORS:
+            self.errors_truncated = True
+            return
+        self.errors.append({"row": row, "errors": errors})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "created": self.created,
+            "failed": self.failed,
+            "chart_ids": self.chart_ids,
+            "errors": self.errors,
+            "errors_truncated": self.errors_truncated,
+        }
+
+
+def resolve_format(content_type: str = "", filename: str = "", explicit: str = "") -> Optional[str]:
+    if explicit:
+        explicit = explicit.lower()
+        return explicit if explicit in (FORMAT_CSV, FORMAT_NDJSON) else None
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in CONTENT_TYPE_FORMATS:
+        return CONTENT_TYPE_FORMATS[media_type]
+    lowered = filename.lower()
+    if lowered.endswith(".csv"):
+        return FORMAT_CSV
+    if lowered.endswith((".ndjson", ".jsonl")):
+        return FORMAT_NDJSON
+    return None
+
+
+def iter_records(lines: Iterable[bytes], fmt: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Lazily decode ``lines`` into ``(row_number, record)`` pairs.
+
+    Records that cannot be decoded are yielded as ``ValueError`` instances so
+    the caller can report them per row without aborting the stream.
+    """
+    text_lines = codecs.iterdecode(lines, "utf-8-sig")
+    if fmt == FORMAT_CSV:
+        reader = csv.DictReader(text_lines)
+        for record in reader:
+            if None in record:
+                yield reader.line_num, ValueError("Лишние значения в строке CSV.")
+                continue
+            yield reader.line_num, record
+        return
+
+    for row_number, line in enumerate(text_lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield row_number, ValueError(f"Некорректный JSON: {exc}")
+            continue
+        if not isinstance(record, dict):
+            yield row_number, ValueError("Ожидался JSON-объект.")
+            continue
+        yield row_number, record
+
+
+def import_natal_charts(
+    owner,
+    records: Iterable[Tuple[int, Any]],
+    chunk_size: Optional[int] = None,
+) -> ChartImportReport:
+    """
+    Create charts for ``owner`` from a stream of parsed records.
+
+    Records are consumed chunk by chunk: each chunk resolves its locations
+    against existing ``Location`` rows with a single query, inserts charts with
+    ``bulk_create`` and schedules computation in chunked Celery tasks once the
+    chunk is committed. Geocoding providers are never called.
+    """
+    chunk_size = chunk_size or settings.CHART_IMPORT_CHUNK_SIZE
+    report = ChartImportReport()
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        _import_chunk(owner, chunk, report)
+    logger.info(
+        "charts.import_natal_charts.completed",
+        owner_id=owner.id,
+        created=report.created,
+        failed=report.failed,
+    )
+    return report
+
+
+def _import_chunk(owner, chunk: List[Tuple[int, Any]], report: ChartImportReport) -> None:
+    valid: List[Tuple[int, dict]] = []
+    for row_number, record in chunk:
+        if isinstance(record, Exception):
+            report.add_error(row_number, [str(record)])
+            continue
+        serializer = NatalChartImportRowSerializer(data=record)
+        if not serializer.is_valid():
+            report.add_error(row_number, serializer.errors)
+            continue
+        valid.append((row_number, serializer.validated_data))
+
+    if not valid:
+        return
+
+    resolver = _LocationResolver([attrs for _, attrs in valid])
+    charts: List[NatalChart] = []
+    for row_number, attrs in valid:
+        location = resolver.resolve(attrs)
+        if location is None:
+            report.add_error(row_number, {"location": ["Местоположение не найдено."]})
+            continue
+        charts.append(
+            NatalChart(
+                owner=owner,
+                title=attrs["title"],
+                event_datetime=attrs["event_datetime"],
+                event_location=location,
+                house_system=attrs["house_system"],
+                notes=attrs["notes"],
+            )
+        )
+
+    if not charts:
+        return
+
+    with transaction.atomic():
+        created = NatalChart.objects.bulk_create(charts)
+        chart_ids = [chart.id for chart in created]
+        transaction.on_commit(lambda: _schedule_computation(chart_ids))
+    report.created += len(chart_ids)
+    report.chart_ids.extend(chart_ids)
+
+
+def _schedule_computation(chart_ids: List[int]) -> None:
+    task_chunk = settings.CHART_IMPORT_TASK_CHUNK_SIZE
+    for start in range(0, len(chart_ids), task_chunk):
+        compute_natal_charts_batch_async.delay(chart_ids=chart_ids[start : start + task_chunk])
+
+
+class _LocationResolver:
+    """
+    Batch lookup of existing locations for one import chunk.
+    """
+
+    def __init__(self, rows: List[dict]) -> None:
+        ids = set()
+        coordinates = set()
+        places = set()
+        for attrs in rows:
+            if attrs.get("location_id") is not None:
+                ids.add(attrs["location_id"])
+            elif attrs.get("latitude") is not None and attrs.get("longitude") is not None:
+                coordinates.add(self._coordinate_key(attrs))
+            else:
+                places.add(self._place_key(attrs))
+
+        query = Q(pk__in=ids) if ids else Q()
+        for latitude, longitude in coordinates:
+            query |= Q(latitude=latitude, longitude=longitude)
+        for city, state, country in places:
+            place_query = Q(city__iexact=city, country__iexact=country)
+            if state:
+                place_query &= Q(state__iexact=state)
+            query |= place_query
+
+        self._by_id: Dict[int, Location] = {}
+        self._by_coordinates: Dict[Tuple[Decimal, Decimal], Location] = {}
+        self._by_place: Dict[Tuple[str, str, str], Location] = {}
+        self._by_city: Dict[Tuple[str, str], Location] = {}
+        if not query:
+            return
+        for location in Location.objects.filter(query).order_by("id"):
+            self._by_id[location.id] = location
+            self._by_coordinates.setdefault(
+                (location.latitude.quantize(COORDINATE_QUANT), location.longitude.quantize(COORDINATE_QUANT)),
+                location,
+            )
+            self._by_place.setdefault(
+                (location.city.lower(), location.state.lower(), location.country.lower()), location
+            )
+            self._by_city.setdefault((location.city.lower(), location.country.lower()), location)
+
+    def resolve(self, attrs: dict) -> Optional[Location]:
+        if attrs.get("location_id") is not None:
+            return self._by_id.get(attrs["location_id"])
+        if attrs.get("latitude") is not None and attrs.get("longitude") is not None:
+            return self._by_coordinates.get(self._coordinate_key(attrs))
+        city, state, country = self._place_key(attrs)
+        if state:
+            return self._by_place.get((city, state, country))
+        return self._by_city.get((city, country))
+
+    @staticmethod
+    def _coordinate_key(attrs: dict) -> Tuple[Decimal, Decimal]:
+        return (
+            attrs["latitude"].quantize(COORDINATE_QUANT),
+            attrs["longitude"].quantize(COORDINATE_QUANT),
+        )
+
+    @staticmethod
+    def _place_key(attrs: dict) -> Tuple[str, str, str]:
+        return (
+            attrs.get("city", "").lower(),
+            attrs.get("state", "").lower(),
+            attrs.get("country", "").lower(),
+        )
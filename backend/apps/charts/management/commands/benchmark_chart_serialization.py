@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.charts.fast_serializers import NatalChartFastSerializer
+from apps.charts.models import NatalChart
+from apps.charts.serializers import NatalChartSerializer
+from apps.charts.views import COMPUTATION_PREFETCHES
+
+
+class Command(BaseCommand):
+    help = (
+        "Render computed charts with NatalChartSerializer and NatalChartFastSerializer, "
+        "check that the JSON is identical and compare timings."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--charts", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare outputs; exit with an error on the first mismatch.",
+        )
+
+    def handle(self, *args, **options):
+        chart_ids = list(
+            NatalChart.objects.filter(current_computation__isnull=False)
+            .order_by("-id")
+            .values_list("id", flat=True)[: options["charts"]]
+        )
+        if not chart_ids:
+            raise CommandError("No computed charts to render.")
+
+        renderer = JSONRenderer()
+        mismatches = 0
+        for chart_id in chart_ids:
+            if renderer.render(self._drf(chart_id)) != renderer.render(self._fast(chart_id)):
+                mismatches += 1
+                self.stderr.write(f"chart {chart_id}: fast representation differs")
+        if mismatches:
+            raise CommandError(f"{mismatches} of {len(chart_ids)} charts differ.")
+        self.stdout.write(f"{len(chart_ids)} charts: identical JSON")
+        if options["check"]:
+            return
+
+        for name, render in (("serializer", self._drf), ("fast", self._fast)):
+            timings = []
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                for chart_id in chart_ids:
+                    renderer.render(render(chart_id))
+                timings.append(time.perf_counter() - started)
+            best = min(timings)
+            self.stdout.write(
+                f"{name:>12}: best {best * 1000:.1f} ms, {best * 1000 / len(chart_ids):.2f} ms/chart"
+            )
+
+    @staticmethod
+    def _drf(chart_id: int) -> dict:
+        chart = (
+            NatalChart.objects.select_related("event_location", "profile", "current_computation")
+            .prefetch_related(*COMPUTATION_PREFETCHES.values())
+            .get(pk=chart_id)
+        )
+        return NatalChartSerializer(chart).data
+
+    @staticmethod
+    def _fast(chart_id: int) -> dict:
+        return NatalChartFastSerializer().serialize(NatalChart.objects.filter(pk=chart_id))[0]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import datetime as dt
+import time
+from decimal import Decimal
+from itertools import chain
+
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.core.management.base import BaseCommand
+
+from apps.charts.models import ChartComputation, NatalChart
+from apps.charts.persistence import (
+    DERIVED_MODELS,
+    BulkCreateWriter,
+    PostgresCopyWriter,
+    get_row_writer,
+)
+from apps.charts.services import _run_bioastro_pipeline
+from apps.core.models import Location
+from apps.integrations.ephemeris import StubEphemerisClient
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rows/s of the chart row writers on the current database. "
+        "All data is written inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--charts", type=int, default=500)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        writers = [BulkCreateWriter(using=using)]
+        if isinstance(get_row_writer(using), PostgresCopyWriter):
+            writers.append(PostgresCopyWriter(using=using))
+        else:
+            self.stdout.write(
+                f"COPY writer unavailable on {connections[using].vendor}; benchmarking bulk_create only."
+            )
+
+        with transaction.atomic(using=using):
+            rows = self._build_rows(options["charts"], using)
+            self.stdout.write(f"{len(rows)} rows for {options['charts']} charts")
+            for writer in writers:
+                timings = []
+                for _ in range(options["repeat"]):
+                    for model in DERIVED_MODELS:
+                        model.objects.using(using).filter(chart__title="benchmark").delete()
+                    for row in rows:
+                        row.pk = None
+                    started = time.perf_counter()
+                    writer.write(rows)
+                    timings.append(time.perf_counter() - started)
+                best = min(timings)
+                self.stdout.write(
+                    f"{writer.name:>12}: best {best * 1000:.1f} ms, {len(rows) / best:,.0f} rows/s"
+                )
+            transaction.set_rollback(True, using=using)
+
+    def _build_rows(self, count: int, using: str):
+        owner = get_user_model().objects.db_manager(using).create_user(
+            username=f"benchmark-{time.time_ns()}"
+        )
+        location = Location.objects.using(using).create(
+            name="Benchmark",
+            city="Benchmark",
+            country="Benchmark",
+            latitude=Decimal("0.000000"),
+            longitude=Decimal("0.000000"),
+            timezone="UTC",
+        )
+        start = dt.datetime(1950, 1, 1, tzinfo=dt.timezone.utc)
+        charts = NatalChart.objects.using(using).bulk_create(
+            NatalChart(
+                owner=owner,
+                title="benchmark",
+                event_datetime=start + dt.timedelta(days=idx * 7),
+                event_location=location,
+            )
+            for idx in range(count)
+        )
+        computations = ChartComputation.objects.using(using).bulk_create(
+            ChartComputation(chart=chart, calculation_version="benchmark") for chart in charts
+        )
+        stub = StubEphemerisClient()
+        rows = []
+        for chart, computation in zip(charts, computations):
+            result = _run_bioastro_pipeline(
+                chart=chart,
+                ephemeris=stub.get_natal_ephemeris(chart.event_datetime, location),
+            )
+            for row in chain(result.positions, result.aspects, result.strengths, result.indicators):
+                row.computation = computation
+                rows.append(row)
+        return rows
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.charts.models import NatalChart
+from apps.charts.serializers import NatalChartSerializer
+from apps.charts.views import COMPUTATION_PREFETCHES
+from apps.core.middleware import HAS_BROTLI, brotli
+from apps.core.renderers import HAS_CBOR, HAS_MSGPACK, CBORRenderer, MessagePackRenderer
+from apps.forecasts.models import ForecastBatch, ForecastEntry
+from apps.forecasts.serializers import ForecastEntrySerializer
+
+ENTRY_TEXT = (
+    "Транзит Сатурна к натальному Солнцу усиливает требования к дисциплине и ответственности. "
+    "Период подходит для завершения долгосрочных проектов и пересмотра обязательств."
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare bytes on the wire and server CPU time for JSON, MessagePack and CBOR, "
+        "each uncompressed, gzip and brotli, on a chart detail and the entries of a 30-year forecast batch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chart", type=int, help="Chart id; defaults to the latest computed chart.")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        renderers = [JSONRenderer()]
+        renderers += [MessagePackRenderer()] if HAS_MSGPACK else []
+        renderers += [CBORRenderer()] if HAS_CBOR else []
+        encoders = [
+            ("identity", lambda body: body),
+            ("gzip", lambda body: gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)),
+        ]
+        if HAS_BROTLI:
+            encoders.append(
+                ("br", lambda body: brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY))
+            )
+
+        with transaction.atomic():
+            chart = self._chart(options["chart"])
+            payloads = [
+                ("chart detail", NatalChartSerializer(chart).data),
+                ("30-year forecast", ForecastEntrySerializer(self._forecast(chart).entries.all(), many=True).data),
+            ]
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{'payload':<18}{'format':<10}{'encoding':<10}{'bytes':>10}{'render ms':>12}{'encode ms':>12}")
+        for label, data in payloads:
+            for renderer in renderers:
+                body, render_ms = self._cpu(lambda: renderer.render(data), options["repeat"])
+                for encoding, encode in encoders:
+                    encoded, encode_ms = self._cpu(lambda: encode(body), options["repeat"])
+                    self.stdout.write(
+                        f"{label:<18}{renderer.format:<10}{encoding:<10}{len(encoded):>10,}"
+                        f"{render_ms:>12.2f}{encode_ms:>12.2f}"
+                    )
+
+    @staticmethod
+    def _cpu(func, repeat: int):
+        best = None
+        for _ in range(repeat):
+            started = time.process_time()
+            result = func()
+            elapsed = (time.process_time() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return result, best
+
+    @staticmethod
+    def _chart(chart_id):
+        queryset = (
+            NatalChart.objects.filter(current_computation__isnull=False)
+            .select_related("event_location", "profile", "current_computation")
+            .prefetch_related(*COMPUTATION_PREFETCHES.values())
+            .order_by("-id")
+        )
+        chart = queryset.filter(pk=chart_id).first() if chart_id else queryset.first()
+        if chart is None:
+            raise CommandError("No computed chart to benchmark.")
+        return chart
+
+    @staticmethod
+    def _forecast(chart) -> ForecastBatch:
+        # Weekly entries over thirty years, written inside the rolled-back transaction.
+        start = timezone.now().date()
+        batch = ForecastBatch.objects.create(
+            chart=chart,
+            horizon=ForecastBatch.Horizon.THIRTY_YEARS,
+            start_date=start,
+            end_date=start + dt.timedelta(days=30 * 365),
+            status="ready",
+        )
+        begin = dt.datetime.combine(start, dt.time(), tzinfo=dt.timezone.utc)
+        ForecastEntry.objects.bulk_create(
+            ForecastEntry(
+                batch=batch,
+                title=f"Неделя {week + 1}",
+                timeframe_start=begin + dt.timedelta(weeks=week),
+                timeframe_end=begin + dt.timedelta(weeks=week + 1),
+                summary=ENTRY_TEXT,
+                opportunities=ENTRY_TEXT,
+                challenges=ENTRY_TEXT,
+                recommendations=ENTRY_TEXT,
+                metadata={"technique": "transit", "bodies": ["saturn", "sun"], "aspect": "square"},
+            )
+            for week in range(30 * 52)
+        )
+        return batch
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.charts.importers import import_natal_charts, iter_records, resolve_format
+
+
+class Command(BaseCommand):
+    help = "Stream natal charts from a CSV or NDJSON file and queue their computation."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to a .csv or .ndjson file.")
+        parser.add_argument("--owner", required=True, help="Username of the chart owner.")
+        parser.add_argument("--format", dest="fmt", default="", help="csv or ndjson (default: by extension).")
+        parser.add_argument("--chunk-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        fmt = resolve_format(filename=options["path"], explicit=options["fmt"])
+        if fmt is None:
+            raise CommandError("Не удалось определить формат файла: укажите --format csv|ndjson.")
+
+        User = get_user_model()
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist as exc:
+            raise CommandError(f"Пользователь {options['owner']!r} не найден.") from exc
+
+        started = time.monotonic()
+        with open(options["path"], "rb") as stream:
+            report = import_natal_charts(
+                owner=owner,
+                records=iter_records(stream, fmt),
+                chunk_size=options["chunk_size"],
+            )
+        elapsed = time.monotonic() - started
+
+        for error in report.errors:
+            self.stderr.write(json.dumps(error, ensure_ascii=False))
+        rate = report.created / elapsed * 60 if elapsed else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {report.created} charts, failed {report.failed} rows "
+                f"in {elapsed:.1f}s ({rate:.0f} charts/min)."
+            )
+        )
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charts', '0002_seed_celestial_bodies'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChartComputation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('calculation_version', models.CharField(max_length=32)),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+                ('chart', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='computations', to='charts.natalchart')),
+            ],
+            options={
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.AddField(
+            model_name='aspect',
+            name='computation',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='aspects', to='charts.chartcomputation'),
+        ),
+        migrations.AddField(
+            model_name='integralindicator',
+            name='computation',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='integral_indicators', to='charts.chartcomputation'),
+        ),
+        migrations.AddField(
+            model_name='natalchart',
+            name='current_computation',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='charts.chartcomputation'),
+        ),
+        migrations.AddField(
+            model_name='planetposition',
+            name='computation',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='planet_positions', to='charts.chartcomputation'),
+        ),
+        migrations.AddField(
+            model_name='planetstrength',
+            name='computation',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='strength_metrics', to='charts.chartcomputation'),
+        ),
+        migrations.AddIndex(
+            model_name='chartcomputation',
+            index=models.Index(fields=['chart', 'calculation_version', '-created_at'], name='charts_char_chart_i_6a3d7b_idx'),
+        ),
+    ]
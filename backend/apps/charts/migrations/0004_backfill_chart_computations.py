@@ -0,0 +1,44 @@
+from django.db import migrations
+
+DERIVED_MODELS = ("PlanetPosition", "Aspect", "PlanetStrength", "IntegralIndicator")
+
+
+def backfill_computations(apps, schema_editor):
+    NatalChart = apps.get_model("charts", "NatalChart")
+    ChartComputation = apps.get_model("charts", "ChartComputation")
+    PlanetPosition = apps.get_model("charts", "PlanetPosition")
+    derived = [apps.get_model("charts", name) for name in DERIVED_MODELS]
+
+    # Every chart with any derived row, so none is left without a computation
+    # once 0005 makes the column required.
+    chart_ids = set()
+    for model in derived:
+        chart_ids.update(model.objects.filter(computation__isnull=True).values_list("chart_id", flat=True).distinct())
+    positioned = set(
+        PlanetPosition.objects.filter(chart_id__in=chart_ids, computation__isnull=True)
+        .values_list("chart_id", flat=True)
+        .distinct()
+    )
+    for chart in NatalChart.objects.filter(pk__in=chart_ids).iterator():
+        computation = ChartComputation.objects.create(
+            chart=chart,
+            calculation_version=chart.calculation_version,
+            metadata=chart.metadata,
+        )
+        for model in derived:
+            model.objects.filter(chart=chart, computation__isnull=True).update(computation=computation)
+        # Rows without positions are no usable chart: they stay non-current,
+        # so 0007 marks them superseded and they are collected.
+        if chart.pk in positioned:
+            NatalChart.objects.filter(pk=chart.pk).update(current_computation=computation)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("charts", "0003_chart_computations"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_computations, migrations.RunPython.noop),
+    ]
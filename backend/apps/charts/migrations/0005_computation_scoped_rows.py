@@ -0,0 +1,66 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charts', '0004_backfill_chart_computations'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='aspect',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='integralindicator',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='planetposition',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='planetstrength',
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name='aspect',
+            name='computation',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aspects', to='charts.chartcomputation'),
+        ),
+        migrations.AlterField(
+            model_name='integralindicator',
+            name='computation',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='integral_indicators', to='charts.chartcomputation'),
+        ),
+        migrations.AlterField(
+            model_name='planetposition',
+            name='computation',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='planet_positions', to='charts.chartcomputation'),
+        ),
+        migrations.AlterField(
+            model_name='planetstrength',
+            name='computation',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='strength_metrics', to='charts.chartcomputation'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='aspect',
+            unique_together={('computation', 'source_body', 'target_body', 'aspect_type')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='integralindicator',
+            unique_together={('computation', 'name', 'category')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='planetposition',
+            unique_together={('computation', 'body')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='planetstrength',
+            unique_together={('computation', 'body', 'metric_name')},
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('charts', '0005_computation_scoped_rows'),
+        ('core', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='natalchart',
+            index=models.Index(fields=['owner', '-event_datetime', '-id'], name='charts_nata_owner_i_f8e7d0_idx'),
+        ),
+    ]
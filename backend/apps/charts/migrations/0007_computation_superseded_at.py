@@ -0,0 +1,29 @@
+# Generated by Django 5.1.2 on 2026-10-19 17:02
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def mark_superseded(apps, schema_editor):
+    # When existing non-current sets were superseded is unknown; give them a full grace period.
+    NatalChart = apps.get_model("charts", "NatalChart")
+    ChartComputation = apps.get_model("charts", "ChartComputation")
+    ChartComputation.objects.exclude(
+        id__in=NatalChart.objects.filter(current_computation__isnull=False).values("current_computation_id")
+    ).update(superseded_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charts', '0006_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chartcomputation',
+            name='superseded_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_superseded, migrations.RunPython.noop),
+    ]
@@ -51,18 +51,79 @@ class NatalChart(TimeStampedModel):
     notes = models.TextField(blank=True)
     calculation_version = models.CharField(max_length=32, default="bioastro-2.0")
     metadata = models.JSONField(default=dict, blank=True)
+    current_computation = models.ForeignKey(
+        "ChartComputation",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
 
     class Meta:
         ordering = ("-event_datetime",)
+        indexes = [models.Index(fields=["owner", "-event_datetime", "-id"])]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.event_datetime:%Y-%m-%d})"
 
+    @property
+    def current_planet_positions(self):
+        return self._current_rows("planet_positions")
+
+    @property
+    def current_aspects(self):
+        return self._current_rows("aspects")
+
+    @property
+    def current_strength_metrics(self):
+        return self._current_rows("strength_metrics")
+
+    @property
+    def current_integral_indicators(self):
+        return self._current_rows("integral_indicators")
+
+    def _current_rows(self, related_name: str):
+        """
+        Rows of the active computation set; empty until the first computation.
+        """
+        if self.current_computation_id is None:
+            return getattr(self, related_name).none()
+        return getattr(self.current_computation, related_name).all()
+
+
+class ChartComputation(TimeStampedModel):
+    """
+    One immutable set of pipeline results for a chart.
+
+    Recomputes write a new set next to the existing ones and then move
+    ``NatalChart.current_computation`` to it; superseded sets are removed by
+    ``collect_stale_computations`` once a grace period has passed since
+    ``superseded_at``.
+    """
+
+    chart = models.ForeignKey(
+        NatalChart, on_delete=models.CASCADE, related_name="computations"
+    )
+    calculation_version = models.CharField(max_length=32)
+    metadata = models.JSONField(default=dict, blank=True)
+    # When the chart pointer moved off this set; the GC grace period counts from here.
+    superseded_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [models.Index(fields=["chart", "calculation_version", "-created_at"])]
+
+    def __str__(self) -> str:
+        return f"{self.chart_id}:{self.calculation_version} ({self.created_at:%Y-%m-%d %H:%M})"
+
 
 class PlanetPosition(TimeStampedModel):
     chart = models.ForeignKey(
         NatalChart, on_delete=models.CASCADE, related_name="planet_positions"
     )
+    computation = models.ForeignKey(
+        ChartComputation, on_delete=models.CASCADE, related_name="planet_positions"
+    )
     body = models.ForeignKey(
         CelestialBody, on_delete=models.CASCADE, related_name="positions"
     )
@@ -73,7 +134,7 @@ class PlanetPosition(TimeStampedModel):
     speed = models.DecimalField(max_digits=8, decimal_places=5, null=True, blank=True)
 
     class Meta:
-        unique_together = ("chart", "body")
+        unique_together = ("computation", "body")
         ordering = ("chart", "body")
 
     def __str__(self) -> str:
@@ -96,6 +157,9 @@ class Aspect(TimeStampedModel):
     chart = models.ForeignKey(
         NatalChart, on_delete=models.CASCADE, related_name="aspects"
     )
+    computation = models.ForeignKey(
+        ChartComputation, on_delete=models.CASCADE, related_name="aspects"
+    )
     source_body = models.ForeignKey(
         CelestialBody,
         on_delete=models.CASCADE,
@@ -111,7 +175,7 @@ class Aspect(TimeStampedModel):
     intensity = models.DecimalField(max_digits=5, decimal_places=2)
 
     class Meta:
-        unique_together = ("chart", "source_body", "target_body", "aspect_type")
+        unique_together = ("computation", "source_body", "target_body", "aspect_type")
         ordering = ("chart", "source_body__name")
 
     def __str__(self) -> str:
@@ -122,6 +186,9 @@ class PlanetStrength(TimeStampedModel):
     chart = models.ForeignKey(
         NatalChart, on_delete=models.CASCADE, related_name="strength_metrics"
     )
+    computation = models.ForeignKey(
+        ChartComputation, on_delete=models.CASCADE, related_name="strength_metrics"
+    )
     body = models.ForeignKey(
         CelestialBody, on_delete=models.CASCADE, related_name="strength_metrics"
     )
@@ -131,7 +198,7 @@ class PlanetStrength(TimeStampedModel):
     metadata = models.JSONField(default=dict, blank=True)
 
     class Meta:
-        unique_together = ("chart", "body", "metric_name")
+        unique_together = ("computation", "body", "metric_name")
         ordering = ("chart", "body", "-score")
 
 
@@ -139,12 +206,15 @@ class IntegralIndicator(TimeStampedModel):
     chart = models.ForeignKey(
         NatalChart, on_delete=models.CASCADE, related_name="integral_indicators"
     )
+    computation = models.ForeignKey(
+        ChartComputation, on_delete=models.CASCADE, related_name="integral_indicators"
+    )
     name = models.CharField(max_length=64)
     category = models.CharField(max_length=32)
     value = models.DecimalField(max_digits=6, decimal_places=3)
     metadata = models.JSONField(default=dict, blank=True)
 
     class Meta:
-        unique_together = ("chart", "name", "category")
+        unique_together = ("computation", "name", "category")
         ordering = ("chart", "category", "name")
 
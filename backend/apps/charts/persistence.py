@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Type
+
+import structlog
+from django.db import connections, models
+
+from apps.charts.models import Aspect, IntegralIndicator, PlanetPosition, PlanetStrength
+
+logger = structlog.get_logger(__name__)
+
+try:
+    import psycopg  # type: ignore
+
+    HAS_PSYCOPG3 = True
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    psycopg = None
+    HAS_PSYCOPG3 = False
+
+DERIVED_MODELS: Sequence[Type[models.Model]] = (
+    PlanetPosition,
+    Aspect,
+    PlanetStrength,
+    IntegralIndicator,
+)
+
+_TYPE_MODIFIER = re.compile(r"\(.*\)")
+
+
+class ChartRowWriter:
+    """
+    Persists pipeline output rows (positions, aspects, strengths, indicators).
+
+    Writers only insert, always under a fresh computation; the caller owns the
+    surrounding transaction, and superseded computations are removed with
+    their rows by ``collect_stale_computations`` once ``superseded_at`` is old
+    enough.
+    """
+
+    name = "base"
+
+    def __init__(self, using: str = "default") -> None:
+        self.using = using
+
+    def write(self, rows: Iterable[models.Model]) -> int:
+        grouped: Dict[Type[models.Model], List[models.Model]] = defaultdict(list)
+        for row in rows:
+            grouped[type(row)].append(row)
+        written = 0
+        for model in DERIVED_MODELS:
+            objs = grouped.pop(model, None)
+            if objs:
+                written += self._write_model(model, objs)
+        for model, objs in grouped.items():
+            written += self._write_model(model, objs)
+        return written
+
+    def _write_model(self, model: Type[models.Model], objs: List[models.Model]) -> int:
+        raise NotImplementedError
+
+
+class BulkCreateWriter(ChartRowWriter):
+    name = "bulk_create"
+    batch_size = 1000
+
+    def _write_model(self, model: Type[models.Model], objs: List[models.Model]) -> int:
+        model.objects.using(self.using).bulk_create(objs, batch_size=self.batch_size)
+        return len(objs)
+
+
+class PostgresCopyWriter(ChartRowWriter):
+    """
+    Streams rows through ``COPY ... FROM STDIN (FORMAT BINARY)``.
+
+    Primary keys are not returned, so the written instances keep ``pk=None``;
+    nothing downstream of the pipeline reads them back.
+    """
+
+    name = "copy"
+
+    def _write_model(self, model: Type[models.Model], objs: List[models.Model]) -> int:
+        connection = connections[self.using]
+        fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        types = [_TYPE_MODIFIER.sub("", field.db_type(connection)).strip() for field in fields]
+        sql = (
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) "
+            "FROM STDIN (FORMAT BINARY)"
+        )
+        with connection.cursor() as cursor:
+            with cursor.cursor.copy(sql) as copy:
+                copy.set_types(types)
+                for obj in objs:
+                    copy.write_row(
+                        [
+                            field.get_db_prep_save(field.pre_save(obj, add=True), connection)
+                            for field in fields
+                        ]
+                    )
+        return len(objs)
+
+
+def get_row_writer(using: str = "default") -> ChartRowWriter:
+    connection = connections[using]
+    if connection.vendor == "postgresql" and HAS_PSYCOPG3 and _uses_psycopg3(connection):
+        return PostgresCopyWriter(using=using)
+    return BulkCreateWriter(using=using)
+
+
+def _uses_psycopg3(connection) -> bool:
+    return getattr(connection.Database, "__name__", "") == "psycopg"
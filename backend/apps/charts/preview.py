@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import datetime as dt
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+import structlog
+from django.conf import settings
+from django.db import connections
+
+from apps.charts.models import Aspect, IntegralIndicator, NatalChart, PlanetPosition
+from apps.charts.registry import celestial_bodies
+from apps.charts.services import (
+    _build_positions,
+    _calculate_aspects,
+    _calculate_integral_indicators,
+)
+from apps.core.models import Location
+from apps.integrations.ephemeris import EphemerisClient
+
+logger = structlog.get_logger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_slots: Optional[threading.BoundedSemaphore] = None
+_executor_lock = threading.Lock()
+
+
+class PreviewBusy(Exception):
+    """
+    Every preview worker is taken; the request is refused instead of queued.
+    """
+
+
+@dataclass
+class ChartPreview:
+    """
+    Unsaved pipeline output for an ad-hoc moment and place.
+    """
+
+    event_datetime: dt.datetime
+    latitude: Decimal
+    longitude: Decimal
+    house_system: str
+    houses: dict
+    planet_positions: List[PlanetPosition]
+    integral_indicators: List[IntegralIndicator] = field(default_factory=list)
+    aspects: List[Aspect] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped)
+
+
+def build_chart_preview(
+    event_datetime: dt.datetime,
+    latitude: Decimal,
+    longitude: Decimal,
+    house_system: str = "placidus",
+    budget_ms: Optional[int] = None,
+    complete: bool = False,
+) -> ChartPreview:
+    """
+    Run the ephemeris and the pipeline in-process without touching the database.
+
+    Positions are always computed. Indicators and aspects follow only while the
+    elapsed time stays within ``budget_ms`` (or always with ``complete``);
+    stages left out are listed in ``skipped`` so clients can tell a reduced
+    preview from a full one.
+    """
+    started = time.perf_counter()
+    budget = (budget_ms if budget_ms is not None else settings.CHART_PREVIEW_BUDGET_MS) / 1000
+
+    location = Location(latitude=latitude, longitude=longitude, timezone="UTC")
+    chart = NatalChart(event_datetime=event_datetime, event_location=location, house_system=house_system)
+    ephemeris = EphemerisClient().get_natal_ephemeris(dt_utc=event_datetime, location=location)
+    houses = ephemeris.get("houses", {})
+    positions, raw_positions = _build_positions(chart, ephemeris.get("bodies", {}))
+
+    preview = ChartPreview(
+        event_datetime=event_datetime,
+        latitude=latitude,
+        longitude=longitude,
+        house_system=house_system,
+        houses={
+            "cusps": [round(cusp, 3) for cusp in houses.get("cusps", [])],
+            "angles": {key: round(value, 3) for key, value in houses.get("angles", {}).items()},
+        },
+        planet_positions=positions,
+    )
+    stages = (
+        ("integral_indicators", _calculate_integral_indicators),
+        ("aspects", _calculate_aspects),
+    )
+    for name, stage in stages:
+        if not complete and time.perf_counter() - started > budget:
+            preview.skipped.append(name)
+            continue
+        setattr(preview, name, stage(chart, raw_positions))
+
+    preview.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+    if preview.partial:
+        logger.info(
+            "charts.preview.degraded",
+            skipped=preview.skipped,
+            elapsed_ms=preview.elapsed_ms,
+            budget_ms=budget * 1000,
+        )
+    return preview
+
+
+def run_chart_preview(timeout_ms: Optional[int] = None, **kwargs) -> ChartPreview:
+    """
+    ``build_chart_preview`` with a hard deadline.
+
+    Raises ``PreviewBusy`` straight away when every worker already holds a
+    computation, and ``concurrent.futures.TimeoutError`` when no result is ready
+    within ``timeout_ms``. A timed-out computation is cancelled if it has not
+    started yet; one already running keeps its worker slot until it returns.
+    """
+    timeout = (timeout_ms if timeout_ms is not None else settings.CHART_PREVIEW_TIMEOUT_MS) / 1000
+    # Load the body registry on the calling thread so workers never need a DB connection.
+    celestial_bodies.all()
+    executor, slots = _get_executor()
+    if not slots.acquire(blocking=False):
+        raise PreviewBusy()
+    try:
+        future = executor.submit(_build_in_worker, kwargs)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def _build_in_worker(kwargs: dict) -> ChartPreview:
+    try:
+        return build_chart_preview(**kwargs)
+    finally:
+        connections.close_all()
+
+
+def _get_executor() -> Tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+    global _executor, _slots
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # One slot per worker, so submitted previews never wait in the queue.
+                _slots = threading.BoundedSemaphore(settings.CHART_PREVIEW_WORKERS)
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.CHART_PREVIEW_WORKERS,
+                    thread_name_prefix="chart-preview",
+                )
+    return _executor, _slots
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import structlog
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.charts.models import CelestialBody
+
+logger = structlog.get_logger(__name__)
+
+VERSION_CACHE_KEY = "charts:celestial_bodies:version"
+
+
+class CelestialBodyRegistry:
+    """
+    Process-wide in-memory index of ``CelestialBody`` rows.
+
+    Bodies are static seed data, so they are loaded once per process and
+    resolved by id or slug without touching the database. Every change to the
+    table bumps a shared version key (see ``apps.charts.signals``); other
+    processes notice the new version on their next freshness check and reload.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_id: Dict[int, CelestialBody] = {}
+        self._by_slug: Dict[str, CelestialBody] = {}
+        self._representations: Dict[int, dict] = {}
+        self._version: Optional[int] = None
+        self._loaded = False
+        self._checked_at = 0.0
+
+    @property
+    def version(self) -> Optional[int]:
+        self._ensure_fresh()
+        return self._version
+
+    def get(self, body_id: int) -> Optional[CelestialBody]:
+        self._ensure_fresh()
+        return self._by_id.get(body_id)
+
+    def get_by_slug(self, slug: str) -> Optional[CelestialBody]:
+        self._ensure_fresh()
+        return self._by_slug.get(slug)
+
+    def by_slugs(self, slugs: Iterable[str]) -> Dict[str, CelestialBody]:
+        self._ensure_fresh()
+        return {slug: self._by_slug[slug] for slug in slugs if slug in self._by_slug}
+
+    def all(self) -> List[CelestialBody]:
+        self._ensure_fresh()
+        return list(self._by_id.values())
+
+    def representation(self, body_id: int) -> Optional[dict]:
+        """
+        Return the ``CelestialBodySerializer`` payload for ``body_id``.
+        """
+        self._ensure_fresh()
+        payload = self._representations.get(body_id)
+        if payload is None:
+            body = self._by_id.get(body_id)
+            if body is None:
+                return None
+            from apps.charts.serializers import CelestialBodySerializer
+
+            payload = dict(CelestialBodySerializer(body).data)
+            self._representations[body_id] = payload
+        return dict(payload)
+
+    def invalidate(self) -> None:
+        """
+        Drop the local index and publish a new version for other processes.
+        """
+        version = time.time_ns()
+        cache.set(VERSION_CACHE_KEY, version, timeout=None)
+        with self._lock:
+            self._loaded = False
+        logger.info("charts.celestial_body_registry.invalidated", version=version)
+
+    def _ensure_fresh(self) -> None:
+        now = time.monotonic()
+        interval = getattr(settings, "CELESTIAL_BODY_REGISTRY_CHECK_INTERVAL", 30)
+        if self._loaded and now - self._checked_at < interval:
+            return
+        with self._lock:
+            if self._loaded and now - self._checked_at < interval:
+                return
+            version = cache.get(VERSION_CACHE_KEY)
+            if not self._loaded or version != self._version:
+                self._load(version)
+            self._checked_at = now
+
+    def _load(self, version: Optional[int]) -> None:
+        bodies = list(CelestialBody.objects.all())
+        self._by_id = {body.id: body for body in bodies}
+        self._by_slug = {body.slug: body for body in bodies}
+        self._representations = {}
+        self._version = version
+        self._loaded = True
+        logger.debug("charts.celestial_body_registry.loaded", bodies=len(bodies), version=version)
+
+
+celestial_bodies = CelestialBodyRegistry()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import secrets
+from typing import Iterable, Optional
+
+import structlog
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from apps.charts.registry import celestial_bodies
+
+logger = structlog.get_logger(__name__)
+
+MAX_VARIANTS_PER_CHART = 8
+
+
+def _version_key(chart_id: int) -> str:
+    return f"charts:detail:{settings.CHART_REPRESENTATION_VERSION}:{chart_id}:generation"
+
+
+def _variant_key(chart_id: int, generation: int, variant: str) -> str:
+    return f"charts:detail:{settings.CHART_REPRESENTATION_VERSION}:{chart_id}:{generation}:{variant}"
+
+
+def _count_key(chart_id: int, generation: int) -> str:
+    return f"charts:detail:{settings.CHART_REPRESENTATION_VERSION}:{chart_id}:{generation}:variants"
+
+
+def variant_key(request) -> str:
+    """
+    Identify one representation of a chart: path, query string and negotiation headers.
+    """
+    parts = (
+        request.get_full_path(),
+        request.META.get("HTTP_ACCEPT", ""),
+        request.META.get("HTTP_ACCEPT_ENCODING", ""),
+    )
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:24]
+
+
+def generation(chart_id: int) -> int:
+    """
+    Current cache generation of a chart; every invalidation moves it on.
+
+    A missing counter (never set or evicted) starts at a random value, so
+    variants stored under an earlier counter can never be reached again.
+    """
+    key = _version_key(chart_id)
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, secrets.randbits(48), timeout=None)
+        value = cache.get(key)
+    return value
+
+
+def get_response(request, chart_id: int, generation: int, variant: str) -> Optional[HttpResponse]:
+    """
+    Serve a cached chart detail for ``request`` without touching the ORM.
+
+    Returns ``None`` on a miss or when the cached chart belongs to another user.
+    """
+    payload = cache.get(_variant_key(chart_id, generation, variant))
+    if payload is None or payload["owner_id"] != request.user.pk:
+        return None
+    if payload["bodies_version"] != celestial_bodies.version:
+        return None
+
+    response = get_conditional_response(
+        request, etag=payload["etag"], last_modified=payload["last_modified"]
+    )
+    if response is None:
+        response = HttpResponse(payload["body"], content_type=payload["content_type"])
+    for header in ("ETag", "Last-Modified"):
+        if payload["headers"].get(header):
+            response[header] = payload["headers"][header]
+    response["X-Representation-Cache"] = "hit"
+    return response
+
+
+def store_response(chart_id: int, generation: int, variant: str, owner_id: int, response) -> None:
+    """
+    Cache a chart detail rendered while ``generation`` was current.
+
+    Each variant has its own key under the generation, so an invalidation
+    landing mid-render leaves the write where no reader will look.
+    """
+    if response.status_code != 200 or not response.get("ETag"):
+        return
+    count_key = _count_key(chart_id, generation)
+    cache.add(count_key, 0, timeout=settings.CHART_DETAIL_CACHE_TIMEOUT)
+    try:
+        if cache.incr(count_key) > MAX_VARIANTS_PER_CHART:
+            return
+    except ValueError:
+        return
+    last_modified = response.get("Last-Modified")
+    cache.set(
+        _variant_key(chart_id, generation, variant),
+        {
+            "owner_id": owner_id,
+            "bodies_version": celestial_bodies.version,
+            "content_type": response["Content-Type"],
+            "body": response.content,
+            "etag": response["ETag"],
+            "last_modified": _parse_http_date(last_modified),
+            "headers": {"ETag": response["ETag"], "Last-Modified": last_modified},
+        },
+        timeout=settings.CHART_DETAIL_CACHE_TIMEOUT,
+    )
+
+
+def invalidate(chart_ids: Iterable[int]) -> None:
+    """
+    Move each chart to a new generation, orphaning its cached variants and
+    any render still in flight.
+    """
+    chart_ids = list(chart_ids)
+    if not chart_ids:
+        return
+    for chart_id in chart_ids:
+        try:
+            cache.incr(_version_key(chart_id))
+        except ValueError:
+            # No counter yet: the next reader starts a fresh random generation.
+            pass
+    logger.debug("charts.representation_cache.invalidated", chart_ids=chart_ids)
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    return parse_http_date_safe(value) if value else None
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+import structlog
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.charts.models import NatalChart
+from apps.charts.preview import ChartPreview, build_chart_preview
+from apps.charts.serializers import ChartReturnSerializer
+from apps.core.models import Location
+from apps.integrations import solver
+from apps.integrations.ephemeris import datetime_from_julian_day, julian_day, longitude_series
+
+logger = structlog.get_logger(__name__)
+
+RETURN_BODIES = {
+    "solar": "sun",
+    "lunar": "moon",
+}
+# The Moon moves ~3.3° in six hours, well inside one bracket.
+SEARCH_STEP_HOURS = 6.0
+MIN_YEAR = 1900
+MAX_YEAR = 2200
+
+
+@dataclass
+class ChartReturn:
+    kind: str
+    exact: dt.datetime
+    chart: ChartPreview
+
+
+def find_returns(slug: str, natal_longitude: float, start: dt.datetime, end: dt.datetime) -> List[dt.datetime]:
+    """
+    Every moment in ``[start, end)`` when ``slug`` is back at ``natal_longitude``.
+    """
+    series = longitude_series((slug,), start, end, SEARCH_STEP_HOURS)
+    offset = solver.signed_separation(series.longitudes[slug], natal_longitude)
+    # The Sun and the Moon never retrograde, so a return is an upward zero crossing;
+    # the downward jump is the point opposite the natal one.
+    rows = np.nonzero((offset[:-1] < 0) & (offset[1:] >= 0))[0]
+    moments = solver.exact_times(
+        series,
+        slug,
+        np.full(len(rows), natal_longitude),
+        series.times[rows],
+        series.times[rows + 1],
+    )
+    last = julian_day(end)
+    return [datetime_from_julian_day(moment) for moment in moments.tolist() if moment < last]
+
+
+def return_location(chart: NatalChart) -> Location:
+    """
+    Returns are cast where the person lives now, falling back to the birth place.
+    """
+    profile = chart.profile
+    if profile is not None and profile.current_location is not None:
+        return profile.current_location
+    return chart.event_location
+
+
+def build_year_returns(chart: NatalChart, year: int, location: Location) -> List[ChartReturn]:
+    natal: Dict[str, float] = {
+        position.body.slug: float(position.absolute_degree)
+        for position in chart.current_planet_positions.select_related("body")
+        if position.body.slug in RETURN_BODIES.values()
+    }
+    start = dt.datetime(year, 1, 1, tzinfo=dt.timezone.utc)
+    end = dt.datetime(year + 1, 1, 1, tzinfo=dt.timezone.utc)
+    returns: List[ChartReturn] = []
+    for kind, slug in RETURN_BODIES.items():
+        if slug not in natal:
+            continue
+        for moment in find_returns(slug, natal[slug], start, end):
+            returns.append(
+                ChartReturn(
+                    kind=kind,
+                    exact=moment,
+                    chart=build_chart_preview(
+                        event_datetime=moment,
+                        latitude=location.latitude,
+                        longitude=location.longitude,
+                        house_system=chart.house_system,
+                        complete=True,
+                    ),
+                )
+            )
+    return returns
+
+
+def year_returns_key(chart: NatalChart, year: int, location: Location) -> str:
+    # The natal computation and the place are part of the key, so recomputing
+    # the chart or moving simply misses the old entry.
+    return f"chart-returns:v1:{chart.pk}:{chart.current_computation_id}:{location.pk}:{year}"
+
+
+def get_year_returns(chart: NatalChart, year: int) -> dict:
+    """
+    Serialized solar and lunar returns of a calendar year, cached per (chart, year).
+    """
+    location = return_location(chart)
+    key = year_returns_key(chart, year, location)
+    payload = cache.get(key)
+    if payload is not None:
+        return payload
+
+    returns = build_year_returns(chart, year, location)
+    payload = {
+        "year": year,
+        "location": {"id": location.id, "name": location.name},
+        "solar": ChartReturnSerializer([item for item in returns if item.kind == "solar"], many=True).data,
+        "lunar": ChartReturnSerializer([item for item in returns if item.kind == "lunar"], many=True).data,
+    }
+    cache.set(key, payload, timeout=settings.CHART_RETURNS_CACHE_TIMEOUT)
+    logger.info("charts.returns.computed", chart_id=chart.pk, year=year, returns=len(returns))
+    return payload
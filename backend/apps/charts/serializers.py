@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from rest_framework import serializers
 
 from apps.charts.models import (
@@ -8,6 +10,8 @@ from apps.charts.models import (
     PlanetPosition,
     PlanetStrength,
 )
+from apps.charts.registry import celestial_bodies
+from apps.core.serializers import SparseFieldsetsMixin
 
 
 class CelestialBodySerializer(serializers.ModelSerializer):
@@ -16,8 +20,21 @@ class CelestialBodySerializer(serializers.ModelSerializer):
         fields = ("id", "name", "slug", "body_type", "symbol", "is_retrograde_capable")
 
 
+class CelestialBodyField(serializers.Field):
+    """
+    Render a body foreign key from the in-process registry instead of a join.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return celestial_bodies.representation(value)
+
+
 class PlanetPositionSerializer(serializers.ModelSerializer):
-    body = CelestialBodySerializer()
+    body = CelestialBodyField(source="body_id")
 
     class Meta:
         model = PlanetPosition
@@ -34,8 +51,8 @@ class PlanetPositionSerializer(serializers.ModelSerializer):
 
 
 class AspectSerializer(serializers.ModelSerializer):
-    source_body = CelestialBodySerializer()
-    target_body = CelestialBodySerializer()
+    source_body = CelestialBodyField(source="source_body_id")
+    target_body = CelestialBodyField(source="target_body_id")
 
     class Meta:
         model = Aspect
@@ -51,7 +68,7 @@ class AspectSerializer(serializers.ModelSerializer):
 
 
 class PlanetStrengthSerializer(serializers.ModelSerializer):
-    body = CelestialBodySerializer()
+    body = CelestialBodyField(source="body_id")
 
     class Meta:
         model = PlanetStrength
@@ -79,11 +96,17 @@ class IntegralIndicatorSerializer(serializers.ModelSerializer):
         )
 
 
-class NatalChartSerializer(serializers.ModelSerializer):
-    planet_positions = PlanetPositionSerializer(many=True, read_only=True)
-    aspects = AspectSerializer(many=True, read_only=True)
-    strength_metrics = PlanetStrengthSerializer(many=True, read_only=True)
-    integral_indicators = IntegralIndicatorSerializer(many=True, read_only=True)
+class NatalChartSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
+    planet_positions = PlanetPositionSerializer(
+        many=True, read_only=True, source="current_planet_positions"
+    )
+    aspects = AspectSerializer(many=True, read_only=True, source="current_aspects")
+    strength_metrics = PlanetStrengthSerializer(
+        many=True, read_only=True, source="current_strength_metrics"
+    )
+    integral_indicators = IntegralIndicatorSerializer(
+        many=True, read_only=True, source="current_integral_indicators"
+    )
     event_location_detail = serializers.SerializerMethodField(read_only=True)
     profile_detail = serializers.SerializerMethodField(read_only=True)
 
@@ -122,6 +145,7 @@ class NatalChartSerializer(serializers.ModelSerializer):
             "house_system",
             "notes",
             "calculation_version",
+            "current_computation",
             "metadata",
             "planet_positions",
             "aspects",
@@ -133,8 +157,77 @@ class NatalChartSerializer(serializers.ModelSerializer):
         read_only_fields = (
             "owner",
             "calculation_version",
+            "current_computation",
             "metadata",
             "created_at",
             "updated_at",
         )
 
+
+class NatalChartSummarySerializer(NatalChartSerializer):
+    """
+    List representation: computed rows and metadata only on ``?expand=``.
+    """
+
+    class Meta(NatalChartSerializer.Meta):
+        expandable_fields = (
+            "metadata",
+            "planet_positions",
+            "aspects",
+            "strength_metrics",
+            "integral_indicators",
+        )
+
+
+def _without_identity(fields):
+    return tuple(name for name in fields if name not in ("id", "created_at"))
+
+
+class PreviewPlanetPositionSerializer(PlanetPositionSerializer):
+    class Meta(PlanetPositionSerializer.Meta):
+        fields = _without_identity(PlanetPositionSerializer.Meta.fields)
+
+
+class PreviewAspectSerializer(AspectSerializer):
+    class Meta(AspectSerializer.Meta):
+        fields = _without_identity(AspectSerializer.Meta.fields)
+
+
+class PreviewIntegralIndicatorSerializer(IntegralIndicatorSerializer):
+    class Meta(IntegralIndicatorSerializer.Meta):
+        fields = _without_identity(IntegralIndicatorSerializer.Meta.fields)
+
+
+class ChartPreviewRequestSerializer(serializers.Serializer):
+    event_datetime = serializers.DateTimeField()
+    latitude = serializers.DecimalField(
+        max_digits=9, decimal_places=6, min_value=Decimal("-90"), max_value=Decimal("90")
+    )
+    longitude = serializers.DecimalField(
+        max_digits=9, decimal_places=6, min_value=Decimal("-180"), max_value=Decimal("180")
+    )
+    house_system = serializers.CharField(max_length=32, default="placidus")
+
+
+class ChartPreviewSerializer(serializers.Serializer):
+    """
+    Stateless preview: unsaved rows, so no ids or timestamps.
+    """
+
+    event_datetime = serializers.DateTimeField()
+    latitude = serializers.DecimalField(max_digits=9, decimal_places=6)
+    longitude = serializers.DecimalField(max_digits=9, decimal_places=6)
+    house_system = serializers.CharField()
+    houses = serializers.DictField()
+    planet_positions = PreviewPlanetPositionSerializer(many=True)
+    aspects = PreviewAspectSerializer(many=True)
+    integral_indicators = PreviewIntegralIndicatorSerializer(many=True)
+    partial = serializers.BooleanField()
+    skipped = serializers.ListField(child=serializers.CharField())
+    elapsed_ms = serializers.FloatField()
+
+
+class ChartReturnSerializer(serializers.Serializer):
+    kind = serializers.CharField()
+    exact = serializers.DateTimeField()
+    chart = ChartPreviewSerializer()
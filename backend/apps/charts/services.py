@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import datetime as dt
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
 from math import fabs
-from typing import Dict, Iterable, List
+from itertools import chain
+from typing import Dict, Iterable, List, Tuple
 
 import structlog
 from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
 
 from apps.charts.models import (
-    CelestialBody,
+    ChartComputation,
     NatalChart,
     PlanetPosition,
     PlanetStrength,
     Aspect,
     IntegralIndicator,
 )
+from apps.charts import representation_cache
+from apps.charts.persistence import get_row_writer
+from apps.charts.registry import celestial_bodies
 from apps.integrations.ephemeris import EphemerisClient
 from apps.charts.interpretation import (
     generate_integral_insights,
@@ -108,38 +115,172 @@ class ChartComputationResult:
     metadata: dict
 
 
-def calculate_natal_chart(chart: NatalChart, force: bool = False) -> None:
+def calculate_natal_chart(
+    chart: NatalChart,
+    force: bool = False,
+    calculation_version: str | None = None,
+    activate: bool = True,
+) -> ChartComputation | None:
     """
     Pull ephemeris data, compute positions and derived metrics, populate storage.
+
+    Results are stored as a new computation set next to the existing ones. With
+    ``activate`` the chart is switched to it atomically; otherwise the set is kept
+    aside (e.g. to compare another ``calculation_version``).
     """
     logger.info("charts.calculate_natal_chart.started", chart_id=chart.id, force=force)
 
-    if chart.planet_positions.exists() and not force:
+    if chart.current_computation_id is not None and not force:
         logger.info("charts.calculate_natal_chart.skipped", chart_id=chart.id)
-        return
+        return None
+
+    computation = _compute_chart(chart)
+    (stored,) = _persist_computations(
+        [(chart, computation)],
+        calculation_version=calculation_version,
+        activate=activate,
+    )
+
+    logger.info(
+        "charts.calculate_natal_chart.completed",
+        chart_id=chart.id,
+        computation_id=stored.id,
+        activated=activate,
+    )
+    return stored
+
+
+def calculate_natal_charts(charts: Iterable[NatalChart], force: bool = False) -> List[int]:
+    """
+    Compute many charts and persist all of their rows in a single writer pass.
+
+    Returns ids of charts whose computation failed; they are left untouched.
+    """
+    charts = list(charts)
+    if not force:
+        charts = [chart for chart in charts if chart.current_computation_id is None]
+
+    results: List[Tuple[NatalChart, ChartComputationResult]] = []
+    failed: List[int] = []
+    for chart in charts:
+        try:
+            results.append((chart, _compute_chart(chart)))
+        except Exception as exc:
+            logger.exception("charts.calculate_natal_charts.chart_failed", chart_id=chart.id, error=str(exc))
+            failed.append(chart.id)
+
+    if results:
+        _persist_computations(results)
+    logger.info("charts.calculate_natal_charts.completed", charts=len(results), failed=len(failed))
+    return failed
+
+
+def collect_stale_computations(grace_period: dt.timedelta, batch_size: int = 500) -> int:
+    """
+    Delete computation sets that no chart points to any more.
 
+    The newest set per (chart, calculation_version) is always kept so that
+    alternative pipeline versions stay available side by side. ``grace_period``
+    protects sets that a concurrent reader may still be serializing: it runs
+    from the moment a set stopped being current, or from its creation for
+    sets that never were.
+    """
+    cutoff = timezone.now() - grace_period
+    latest_per_version = (
+        ChartComputation.objects.filter(
+            chart=OuterRef("chart"),
+            calculation_version=OuterRef("calculation_version"),
+        )
+        .order_by("-created_at", "-id")
+        .values("id")[:1]
+    )
+    stale = (
+        ChartComputation.objects.filter(
+            Q(superseded_at__lt=cutoff) | Q(superseded_at__isnull=True, created_at__lt=cutoff)
+        )
+        .exclude(
+            id__in=NatalChart.objects.filter(current_computation__isnull=False).values(
+                "current_computation_id"
+            )
+        )
+        .exclude(id=Subquery(latest_per_version))
+        .order_by("id")
+    )
+    deleted = 0
+    while True:
+        ids = list(stale.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        with transaction.atomic():
+            ChartComputation.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+    logger.info("charts.collect_stale_computations.completed", deleted=deleted)
+    return deleted
+
+
+def _compute_chart(chart: NatalChart) -> ChartComputationResult:
     ephemeris_client = EphemerisClient()
     data = ephemeris_client.get_natal_ephemeris(
         dt_utc=chart.event_datetime,
         location=chart.event_location,
     )
-    computation = _run_bioastro_pipeline(chart=chart, ephemeris=data)
+    return _run_bioastro_pipeline(chart=chart, ephemeris=data)
 
-    with transaction.atomic():
-        chart.planet_positions.all().delete()
-        chart.aspects.all().delete()
-        chart.strength_metrics.all().delete()
-        chart.integral_indicators.all().delete()
 
-        PlanetPosition.objects.bulk_create(computation.positions)
-        Aspect.objects.bulk_create(computation.aspects)
-        PlanetStrength.objects.bulk_create(computation.strengths)
-        IntegralIndicator.objects.bulk_create(computation.indicators)
+def _persist_computations(
+    results: List[Tuple[NatalChart, ChartComputationResult]],
+    calculation_version: str | None = None,
+    activate: bool = True,
+) -> List[ChartComputation]:
+    """
+    Write each result as a new computation set and optionally activate it.
 
-        chart.metadata = computation.metadata
-        chart.save(update_fields=["metadata", "updated_at"])
+    Existing sets are never modified, so readers keep serving the previous set
+    until the single-row pointer update commits.
+    """
+    writer = get_row_writer()
+    with transaction.atomic():
+        computations = ChartComputation.objects.bulk_create(
+            [
+                ChartComputation(
+                    chart=chart,
+                    calculation_version=calculation_version or chart.calculation_version,
+                    metadata=result.metadata,
+                )
+                for chart, result in results
+            ]
+        )
 
-    logger.info("charts.calculate_natal_chart.completed", chart_id=chart.id)
+        rows = []
+        for (_, result), computation in zip(results, computations):
+            for row in chain(result.positions, result.aspects, result.strengths, result.indicators):
+                row.computation = computation
+                rows.append(row)
+        writer.write(rows)
+
+        if activate:
+            now = timezone.now()
+            # Lock the pointers so concurrent recomputes supersede sets one at a time.
+            previous = dict(
+                NatalChart.objects.select_for_update()
+                .filter(pk__in=[chart.pk for chart, _ in results])
+                .values_list("pk", "current_computation_id")
+            )
+            ChartComputation.objects.filter(
+                pk__in=[pk for pk in previous.values() if pk is not None]
+            ).update(superseded_at=now)
+            for (chart, _), computation in zip(results, computations):
+                NatalChart.objects.filter(pk=chart.pk).update(
+                    current_computation=computation,
+                    metadata=computation.metadata,
+                    updated_at=now,
+                )
+                chart.current_computation = computation
+                chart.metadata = computation.metadata
+                chart.updated_at = now
+            chart_ids = [chart.id for chart, _ in results]
+            transaction.on_commit(lambda: representation_cache.invalidate(chart_ids))
+    return computations
 
 
 def _run_bioastro_pipeline(chart: NatalChart, ephemeris: dict) -> ChartComputationResult:
@@ -148,43 +289,7 @@ def _run_bioastro_pipeline(chart: NatalChart, ephemeris: dict) -> ChartComputati
     cusps = houses.get("cusps", [n * 30.0 for n in range(1, 13)])
     angles = houses.get("angles", {})
 
-    body_models = {
-        body.slug: body
-        for body in CelestialBody.objects.filter(slug__in=bodies_data.keys())
-    }
-
-    positions: List[PlanetPosition] = []
-    raw_positions: List[dict] = []
-
-    for slug, data in bodies_data.items():
-        body = body_models.get(slug)
-        if not body:
-            logger.warning("charts.bioastro_pipeline.body_missing", slug=slug)
-            continue
-        longitude = Decimal(str(data.get("longitude", 0.0))).quantize(Decimal("0.001"))
-        speed = data.get("speed")
-        positions.append(
-            PlanetPosition(
-                chart=chart,
-                body=body,
-                sign=data.get("sign", ""),
-                house=data.get("house", 1),
-                absolute_degree=longitude,
-                retrograde=data.get("retrograde", False),
-                speed=Decimal(str(speed)).quantize(Decimal("0.00001")) if speed is not None else None,
-            )
-        )
-        raw_positions.append(
-            {
-                "body": body,
-                "slug": slug,
-                "longitude": float(longitude),
-                "sign": data.get("sign", ""),
-                "house": data.get("house", 1),
-                "retrograde": data.get("retrograde", False),
-                "speed": speed or 0.0,
-            }
-        )
+    positions, raw_positions = _build_positions(chart, bodies_data)
 
     aspects = _calculate_aspects(chart, raw_positions)
     strengths = _calculate_strengths(chart, raw_positions)
@@ -231,6 +336,44 @@ def _run_bioastro_pipeline(chart: NatalChart, ephemeris: dict) -> ChartComputati
     )
 
 
+def _build_positions(chart: NatalChart, bodies_data: dict) -> Tuple[List[PlanetPosition], List[dict]]:
+    body_models = celestial_bodies.by_slugs(bodies_data.keys())
+
+    positions: List[PlanetPosition] = []
+    raw_positions: List[dict] = []
+
+    for slug, data in bodies_data.items():
+        body = body_models.get(slug)
+        if not body:
+            logger.warning("charts.bioastro_pipeline.body_missing", slug=slug)
+            continue
+        longitude = Decimal(str(data.get("longitude", 0.0))).quantize(Decimal("0.001"))
+        speed = data.get("speed")
+        positions.append(
+            PlanetPosition(
+                chart=chart,
+                body=body,
+                sign=data.get("sign", ""),
+                house=data.get("house", 1),
+                absolute_degree=longitude,
+                retrograde=data.get("retrograde", False),
+                speed=Decimal(str(speed)).quantize(Decimal("0.00001")) if speed is not None else None,
+            )
+        )
+        raw_positions.append(
+            {
+                "body": body,
+                "slug": slug,
+                "longitude": float(longitude),
+                "sign": data.get("sign", ""),
+                "house": data.get("house", 1),
+                "retrograde": data.get("retrograde", False),
+                "speed": speed or 0.0,
+            }
+        )
+    return positions, raw_positions
+
+
 def _calculate_aspects(chart: NatalChart, positions: List[dict]) -> List[Aspect]:
     results: List[Aspect] = []
     for i in range(len(positions)):
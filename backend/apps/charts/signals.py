@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.models import UserProfile
+from apps.charts import representation_cache
+from apps.charts.models import CelestialBody, NatalChart
+from apps.charts.registry import celestial_bodies
+from apps.core.models import Location
+
+
+@receiver(post_save, sender=CelestialBody)
+@receiver(post_delete, sender=CelestialBody)
+def invalidate_celestial_body_registry(sender, **kwargs) -> None:
+    transaction.on_commit(celestial_bodies.invalidate)
+
+
+@receiver(post_save, sender=NatalChart)
+@receiver(post_delete, sender=NatalChart)
+def invalidate_chart_representation(sender, instance, **kwargs) -> None:
+    chart_id = instance.pk
+    transaction.on_commit(lambda: representation_cache.invalidate([chart_id]))
+
+
+@receiver(post_save, sender=Location)
+def invalidate_location_charts(sender, instance, created, **kwargs) -> None:
+    if created:
+        return
+    chart_ids = list(instance.natal_charts.values_list("id", flat=True))
+    transaction.on_commit(lambda: representation_cache.invalidate(chart_ids))
+
+
+@receiver(post_save, sender=UserProfile)
+def invalidate_profile_charts(sender, instance, created, **kwargs) -> None:
+    if created:
+        return
+    chart_ids = list(instance.natal_charts.values_list("id", flat=True))
+    transaction.on_commit(lambda: representation_cache.invalidate(chart_ids))
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import datetime as dt
+
 import structlog
 from celery import shared_task
-from django.db import transaction
+from django.conf import settings
 
 from apps.charts.models import NatalChart
 from apps.charts import services
+from apps.core import events
 
 logger = structlog.get_logger(__name__)
 
@@ -13,8 +16,77 @@ logger = structlog.get_logger(__name__)
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
 def compute_natal_chart_async(self, chart_id: int, force: bool = False) -> None:
     logger.info("charts.compute_natal_chart_async.started", chart_id=chart_id, force=force)
-    with transaction.atomic():
-        chart = NatalChart.objects.select_for_update().get(pk=chart_id)
-        services.calculate_natal_chart(chart=chart, force=force)
+    # No row lock: results land in a fresh computation set and the chart
+    # pointer is switched in a short transaction inside the service.
+    chart = NatalChart.objects.select_related("event_location").get(pk=chart_id)
+    if chart.current_computation_id is not None and not force:
+        # Nothing will change, so subscribers get no transition either.
+        logger.info("charts.compute_natal_chart_async.skipped", chart_id=chart_id)
+        return
+    events.publish_status(chart.owner_id, "natal_chart", chart_id, "processing")
+    try:
+        computation = services.calculate_natal_chart(chart=chart, force=force)
+    except Exception:
+        events.publish_status(
+            chart.owner_id,
+            "natal_chart",
+            chart_id,
+            "failed",
+            retrying=self.request.retries < self.max_retries,
+        )
+        raise
+    if computation is not None:
+        events.publish_status(
+            chart.owner_id,
+            "natal_chart",
+            chart_id,
+            "ready",
+            computation_id=computation.id,
+        )
     logger.info("charts.compute_natal_chart_async.completed", chart_id=chart_id)
 
+
+@shared_task(bind=True)
+def compute_natal_charts_batch_async(self, chart_ids: list[int], force: bool = False) -> None:
+    logger.info("charts.compute_natal_charts_batch_async.started", charts=len(chart_ids), force=force)
+    charts = list(NatalChart.objects.select_related("event_location").filter(pk__in=chart_ids))
+    if not force:
+        # Already computed charts are skipped by the service; announce only real work.
+        charts = [chart for chart in charts if chart.current_computation_id is None]
+    for chart in charts:
+        events.publish_status(chart.owner_id, "natal_chart", chart.id, "processing")
+    failed = services.calculate_natal_charts(charts, force=force)
+    for chart in charts:
+        if chart.id not in failed:
+            events.publish_status(
+                chart.owner_id,
+                "natal_chart",
+                chart.id,
+                "ready",
+                computation_id=chart.current_computation_id,
+            )
+    # Failed charts fall back to the single-chart task, which retries with backoff.
+    for chart_id in failed:
+        compute_natal_chart_async.delay(chart_id=chart_id, force=force)
+    logger.info(
+        "charts.compute_natal_charts_batch_async.completed",
+        charts=len(chart_ids),
+        failed=len(failed),
+    )
+
+
+@shared_task
+def collect_stale_computations_async() -> int:
+    grace_period = dt.timedelta(seconds=settings.CHART_COMPUTATION_GC_GRACE_SECONDS)
+    return services.collect_stale_computations(grace_period=grace_period)
+
+
+async def in_flight_charts(user_id: int) -> list[dict]:
+    """
+    Charts of ``user_id`` still waiting for their first computation.
+    """
+    queryset = NatalChart.objects.filter(owner_id=user_id, current_computation__isnull=True)
+    return [
+        {"type": "natal_chart", "id": chart_id, "status": "pending"}
+        async for chart_id in queryset.values_list("id", flat=True)[:100]
+    ]
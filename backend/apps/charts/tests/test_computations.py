@@ -0,0 +1,32 @@
+import datetime as dt
+
+from django.utils import timezone
+
+from apps.charts.models import ChartComputation
+from apps.charts.services import calculate_natal_chart, collect_stale_computations
+
+GRACE = dt.timedelta(minutes=15)
+
+
+def test_old_set_gets_grace_period_from_being_superseded(chart):
+    first = chart.current_computation
+    # Created long ago, but current until the recompute below.
+    ChartComputation.objects.filter(pk=first.pk).update(created_at=timezone.now() - dt.timedelta(days=30))
+
+    second = calculate_natal_chart(chart, force=True)
+
+    first.refresh_from_db()
+    assert first.superseded_at is not None
+    assert ChartComputation.objects.get(pk=second.pk).superseded_at is None
+    assert collect_stale_computations(grace_period=GRACE) == 0
+    assert ChartComputation.objects.filter(pk=first.pk).exists()
+
+
+def test_superseded_set_is_collected_after_grace_period(chart):
+    first = chart.current_computation
+    second = calculate_natal_chart(chart, force=True)
+    ChartComputation.objects.filter(pk=first.pk).update(superseded_at=timezone.now() - 2 * GRACE)
+
+    assert collect_stale_computations(grace_period=GRACE) == 1
+    assert list(ChartComputation.objects.filter(chart=chart).values_list("pk", flat=True)) == [second.pk]
+    assert chart.current_planet_positions.exists()
@@ -0,0 +1,38 @@
+from rest_framework.test import APIClient
+
+
+def _client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def test_location_edit_invalidates_chart_etag(chart, user, django_capture_on_commit_callbacks):
+    client = _client(user)
+    url = f"/api/v1/charts/natal-charts/{chart.pk}/"
+    first = client.get(url)
+    assert first.status_code == 200
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+
+    location = chart.event_location
+    location.name = "Москва, центр"
+    with django_capture_on_commit_callbacks(execute=True):
+        location.save()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert response.status_code == 200
+    assert response.json()["event_location_detail"]["name"] == "Москва, центр"
+
+
+def test_location_edit_invalidates_chart_list_etag(chart, user, django_capture_on_commit_callbacks):
+    client = _client(user)
+    url = "/api/v1/charts/natal-charts/"
+    first = client.get(url)
+
+    location = chart.event_location
+    location.name = "Москва, центр"
+    with django_capture_on_commit_callbacks(execute=True):
+        location.save()
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
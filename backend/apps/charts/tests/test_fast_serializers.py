@@ -0,0 +1,64 @@
+import datetime as dt
+
+import pytest
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from apps.accounts.models import UserProfile
+from apps.charts.fast_serializers import NatalChartFastSerializer
+from apps.charts.models import NatalChart
+from apps.charts.serializers import NatalChartSerializer
+from apps.charts.views import COMPUTATION_PREFETCHES
+
+QUERIES = [
+    "",
+    "?fields=id,title,event_datetime",
+    "?fields=id,profile,profile_detail,event_location_detail",
+    "?fields=planet_positions,aspects",
+    "?fields=title,current_computation,metadata,strength_metrics,integral_indicators",
+    "?fields=unknown",
+]
+
+
+@pytest.fixture
+def charts(user, location, chart):
+    profile = UserProfile.objects.create(
+        user=user,
+        birth_datetime=dt.datetime(1990, 5, 17, 8, 30, tzinfo=dt.timezone.utc),
+        birth_location=location,
+        timezone="Europe/Moscow",
+    )
+    # Never computed: no current computation and no rows.
+    uncomputed = NatalChart.objects.create(
+        owner=user,
+        profile=profile,
+        title="Карта профиля",
+        event_datetime=dt.datetime(1985, 1, 2, 23, 59, tzinfo=dt.timezone.utc),
+        event_location=location,
+        notes="",
+    )
+    return [chart.pk, uncomputed.pk]
+
+
+def _request(query):
+    return Request(RequestFactory().get(f"/api/v1/charts/natal/{query}"))
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_fast_representation_matches_serializer(charts, query):
+    renderer = JSONRenderer()
+    request = _request(query)
+    fast = NatalChartFastSerializer(context={"request": request}).serialize_by_id(
+        NatalChart.objects.filter(pk__in=charts)
+    )
+    if not query:
+        assert fast[charts[0]]["planet_positions"] and fast[charts[1]]["profile_detail"]
+    for chart_id in charts:
+        chart = (
+            NatalChart.objects.select_related("event_location", "profile", "current_computation")
+            .prefetch_related(*COMPUTATION_PREFETCHES.values())
+            .get(pk=chart_id)
+        )
+        expected = NatalChartSerializer(chart, context={"request": request}).data
+        assert renderer.render(fast[chart_id]) == renderer.render(expected)
@@ -0,0 +1,41 @@
+import threading
+from concurrent.futures import TimeoutError
+
+import pytest
+from rest_framework.test import APIClient
+
+from apps.charts import preview
+
+PAYLOAD = {"event_datetime": "1990-05-17T10:30:00Z", "latitude": "55.75", "longitude": "37.62"}
+
+
+@pytest.fixture
+def blocked_worker(db, settings, monkeypatch):
+    settings.CHART_PREVIEW_WORKERS = 1
+    monkeypatch.setattr(preview, "_executor", None)
+    monkeypatch.setattr(preview, "_slots", None)
+    release = threading.Event()
+    monkeypatch.setattr(preview, "_build_in_worker", lambda kwargs: release.wait(5))
+    yield release
+    release.set()
+    if preview._executor is not None:
+        preview._executor.shutdown(wait=True)
+
+
+def test_full_pool_answers_503_without_queueing(blocked_worker):
+    with pytest.raises(TimeoutError):
+        preview.run_chart_preview(timeout_ms=10)
+
+    response = APIClient().post("/api/v1/charts/natal-charts/preview/", PAYLOAD, format="json")
+
+    assert response.status_code == 503
+    assert response.data["detail"].code == "preview_busy"
+
+
+def test_slot_is_freed_once_the_abandoned_preview_returns(blocked_worker):
+    with pytest.raises(TimeoutError):
+        preview.run_chart_preview(timeout_ms=10)
+    blocked_worker.set()
+    preview._executor.submit(lambda: None).result(timeout=5)
+
+    assert preview._slots.acquire(blocking=False)
@@ -0,0 +1,54 @@
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from apps.charts import representation_cache
+
+
+def _request(user):
+    request = RequestFactory().get("/api/v1/charts/natal/1/", HTTP_ACCEPT="application/json")
+    request.user = user
+    return request
+
+
+def _rendered(body=b'{"id": 1}'):
+    response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = '"v1"'
+    return response
+
+
+def test_stored_variant_is_served(user):
+    request = _request(user)
+    variant = representation_cache.variant_key(request)
+    generation = representation_cache.generation(1)
+
+    representation_cache.store_response(1, generation, variant, user.pk, _rendered())
+
+    cached = representation_cache.get_response(request, 1, representation_cache.generation(1), variant)
+    assert cached is not None
+    assert cached.content == b'{"id": 1}'
+    assert cached["X-Representation-Cache"] == "hit"
+
+
+def test_render_overtaken_by_invalidation_is_never_served(user):
+    request = _request(user)
+    variant = representation_cache.variant_key(request)
+    started = representation_cache.generation(1)
+
+    # The chart changes while the old representation is still rendering.
+    representation_cache.invalidate([1])
+    representation_cache.store_response(1, started, variant, user.pk, _rendered(b"stale"))
+
+    current = representation_cache.generation(1)
+    assert current != started
+    assert representation_cache.get_response(request, 1, current, variant) is None
+
+
+def test_variants_per_generation_are_capped(user):
+    request = _request(user)
+    generation = representation_cache.generation(1)
+    for index in range(representation_cache.MAX_VARIANTS_PER_CHART + 1):
+        representation_cache.store_response(1, generation, f"variant-{index}", user.pk, _rendered())
+
+    last = f"variant-{representation_cache.MAX_VARIANTS_PER_CHART}"
+    assert representation_cache.get_response(request, 1, generation, "variant-0") is not None
+    assert representation_cache.get_response(request, 1, generation, last) is None
@@ -1,29 +1,106 @@
+from concurrent.futures import TimeoutError as PreviewTimeout
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import APIException, PermissionDenied, ValidationError
+from rest_framework.throttling import AnonRateThrottle
 
+from apps.charts import representation_cache
+from apps.charts.fast_serializers import NatalChartFastSerializer
+from apps.charts.importers import import_natal_charts, iter_records, resolve_format
 from apps.charts.models import NatalChart
-from apps.charts.serializers import NatalChartSerializer
+from apps.charts.preview import PreviewBusy, run_chart_preview
+from apps.charts.returns import MAX_YEAR, MIN_YEAR, get_year_returns
+from apps.charts.serializers import (
+    ChartPreviewRequestSerializer,
+    ChartPreviewSerializer,
+    NatalChartSerializer,
+    NatalChartSummarySerializer,
+)
 from apps.charts.tasks import compute_natal_chart_async
+from apps.core.mixins import ConditionalGetMixin, FastRepresentationMixin
+from apps.core.pagination import KeysetPagination
+
+
+COMPUTATION_PREFETCHES = {
+    "planet_positions": "current_computation__planet_positions",
+    "aspects": "current_computation__aspects",
+    "strength_metrics": "current_computation__strength_metrics",
+    "integral_indicators": "current_computation__integral_indicators",
+}
+
+
+class NatalChartPagination(KeysetPagination):
+    ordering = ("-event_datetime", "-id")
+
+
+class ChartPreviewThrottle(AnonRateThrottle):
+    scope = "chart_preview"
 
 
-class NatalChartViewSet(viewsets.ModelViewSet):
+class ChartPreviewUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Предпросмотр карты временно недоступен, попробуйте позже."
+    default_code = "preview_timeout"
+
+
+class NatalChartViewSet(ConditionalGetMixin, FastRepresentationMixin, viewsets.ModelViewSet):
     serializer_class = NatalChartSerializer
+    fast_serializer_class = NatalChartFastSerializer
     permission_classes = (permissions.IsAuthenticated,)
+    pagination_class = NatalChartPagination
+    # Nested location and profile details change without touching the chart.
+    etag_fields = ("current_computation_id", "event_location__updated_at", "profile__updated_at")
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return NatalChartSummarySerializer
+        return super().get_serializer_class()
 
     def get_queryset(self):
-        return (
-            NatalChart.objects.select_related("owner", "profile", "event_location")
-            .prefetch_related(
-                "planet_positions__body",
-                "aspects__source_body",
-                "aspects__target_body",
-                "strength_metrics__body",
-                "integral_indicators",
+        queryset = NatalChart.objects.filter(owner=self.request.user)
+        if self.action == "returns":
+            return queryset.select_related("event_location", "profile__current_location")
+        selected = self.get_serializer_class().selected_fields(self.request)
+        if selected is None:
+            selected = set(NatalChartSerializer.Meta.fields)
+
+        related = ["event_location"]
+        if "profile_detail" in selected:
+            related.append("profile")
+        prefetches = [lookup for field, lookup in COMPUTATION_PREFETCHES.items() if field in selected]
+        if prefetches:
+            related.append("current_computation")
+        queryset = queryset.select_related(*related).prefetch_related(*prefetches)
+        if "metadata" not in selected:
+            queryset = queryset.defer("metadata")
+        return queryset
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            chart_id = int(kwargs[self.lookup_url_kwarg or self.lookup_field])
+        except (TypeError, ValueError):
+            return super().retrieve(request, *args, **kwargs)
+
+        variant = representation_cache.variant_key(request)
+        generation = representation_cache.generation(chart_id)
+        cached = representation_cache.get_response(request, chart_id, generation, variant)
+        if cached is not None:
+            return cached
+
+        response = super().retrieve(request, *args, **kwargs)
+        renderer = getattr(request, "accepted_renderer", None)
+        if response.status_code == 200 and renderer and renderer.format in settings.CHART_DETAIL_CACHE_FORMATS:
+            owner_id = request.user.pk
+            response.add_post_render_callback(
+                lambda rendered: representation_cache.store_response(
+                    chart_id, generation, variant, owner_id, rendered
+                )
             )
-            .filter(owner=self.request.user)
-        )
+        return response
 
     def perform_create(self, serializer):
         profile = serializer.validated_data.get("profile")
@@ -38,3 +115,102 @@ class NatalChartViewSet(viewsets.ModelViewSet):
         compute_natal_chart_async.delay(chart_id=chart.id, force=True)
         return Response({"status": "queued"}, status=status.HTTP_202_ACCEPTED)
 
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_charts(self, request):
+        explicit_format = request.query_params.get("input_format", "")
+        if request.content_type.startswith("multipart/"):
+            upload = request.FILES.get("file")
+            if upload is None:
+                raise ValidationError({"file": ["Файл с картами не передан."]})
+            fmt = resolve_format(upload.content_type or "", upload.name, explicit_format)
+            lines = upload
+        else:
+            fmt = resolve_format(request.content_type, explicit=explicit_format)
+            lines = request.stream or []
+        if fmt is None:
+            raise ValidationError("Поддерживаются только форматы CSV и NDJSON.")
+
+        report = import_natal_charts(owner=request.user, records=iter_records(lines, fmt))
+        response_status = (
+            status.HTTP_201_CREATED if report.created or not report.failed else status.HTTP_400_BAD_REQUEST
+        )
+        return Response(report.as_dict(), status=response_status)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        permission_classes=(permissions.AllowAny,),
+        throttle_classes=(ChartPreviewThrottle,),
+    )
+    def preview(self, request):
+        """
+        Compute a chart in-request without saving anything.
+        """
+        serializer = ChartPreviewRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            chart_preview = run_chart_preview(**serializer.validated_data)
+        except PreviewTimeout:
+            raise ChartPreviewUnavailable()
+        except PreviewBusy:
+            raise ChartPreviewUnavailable(code="preview_busy")
+        return Response(ChartPreviewSerializer(chart_preview).data)
+
+    @action(detail=True, methods=["get"])
+    def returns(self, request, pk=None):
+        """
+        Solar and lunar returns of ``?year=`` (current by default) at the profile's current location.
+        """
+        chart = self.get_object()
+        if chart.current_computation_id is None:
+            raise ValidationError({"detail": ["Натальная карта ещё не рассчитана."]})
+        year = self._parse_year(request.query_params.get("year"))
+        return Response(get_year_returns(chart, year))
+
+    @staticmethod
+    def _parse_year(raw):
+        if raw is None:
+            return timezone.now().year
+        try:
+            year = int(raw)
+        except ValueError:
+            raise ValidationError({"year": ["Год должен быть целым числом."]})
+        if not MIN_YEAR <= year <= MAX_YEAR:
+            raise ValidationError({"year": [f"Год должен быть в диапазоне {MIN_YEAR}–{MAX_YEAR}."]})
+        return year
+
+    @action(detail=False, methods=["get"])
+    def batch(self, request):
+        """
+        Several charts in one request, keyed by id; unknown or foreign ids are listed as missing.
+        """
+        chart_ids = self._parse_batch_ids(request.query_params.get("ids", ""))
+        queryset = self.filter_queryset(self.get_queryset()).filter(pk__in=chart_ids)
+        if self.fast_serializer_class is not None:
+            results = self.fast_serializer_class(
+                context=self.get_serializer_context()
+            ).serialize_by_id(queryset)
+        else:
+            charts = list(queryset)
+            data = self.get_serializer(charts, many=True).data
+            results = {chart.pk: item for chart, item in zip(charts, data)}
+        return Response(
+            {
+                "results": {str(chart_id): results[chart_id] for chart_id in chart_ids if chart_id in results},
+                "missing": [chart_id for chart_id in chart_ids if chart_id not in results],
+            }
+        )
+
+    @staticmethod
+    def _parse_batch_ids(raw: str):
+        try:
+            chart_ids = list(dict.fromkeys(int(value) for value in raw.split(",") if value.strip()))
+        except ValueError:
+            raise ValidationError({"ids": ["Идентификаторы карт должны быть целыми числами."]})
+        if not chart_ids:
+            raise ValidationError({"ids": ["Укажите хотя бы один идентификатор карты."]})
+        if len(chart_ids) > settings.CHART_BATCH_MAX_IDS:
+            raise ValidationError(
+                {"ids": [f"Можно запросить не более {settings.CHART_BATCH_MAX_IDS} карт за раз."]}
+            )
+        return chart_ids
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_read_alias: ContextVar[Optional[str]] = ContextVar("core_read_db_alias", default=None)
+
+
+@contextmanager
+def use_read_alias(alias: Optional[str]) -> Iterator[None]:
+    """
+    Route ORM reads to ``alias`` for the duration of the block.
+    """
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads to the alias chosen by ``ReplicaRoutingMiddleware`` and every
+    write to the primary. Outside of a routed request (Celery workers,
+    management commands) everything stays on ``default``.
+    """
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints) -> str:
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        return True
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import structlog
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = structlog.get_logger(__name__)
+
+try:
+    import redis
+    import redis.asyncio as redis_asyncio
+
+    HAS_REDIS = True
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    redis = None
+    redis_asyncio = None
+    HAS_REDIS = False
+
+SnapshotProvider = Callable[[int], Awaitable[List[dict]]]
+
+_snapshot_providers: List[SnapshotProvider] = []
+_broker: Optional["BaseEventBroker"] = None
+_broker_lock = threading.Lock()
+
+
+def user_channel(user_id: int) -> str:
+    return f"{settings.EVENTS_CHANNEL_PREFIX}:user:{user_id}"
+
+
+def publish_status(user_id: int, kind: str, object_id: int, status: str, **extra) -> None:
+    """
+    Announce a status transition of a background job to its owner.
+
+    Inside a transaction the event is sent after commit, so subscribers never
+    learn about a state they cannot read yet. Delivery is best effort.
+    """
+    event = {
+        "type": kind,
+        "id": object_id,
+        "status": status,
+        "at": timezone.now().isoformat(),
+        **extra,
+    }
+    transaction.on_commit(lambda: get_broker().publish(user_channel(user_id), event))
+
+
+def register_snapshot(provider: SnapshotProvider) -> None:
+    """
+    Register a coroutine returning the in-flight jobs of a user as events.
+
+    Subscribers receive these right after connecting, so work started before
+    the stream was opened is not missed.
+    """
+    _snapshot_providers.append(provider)
+
+
+async def snapshot(user_id: int) -> List[dict]:
+    events: List[dict] = []
+    for provider in _snapshot_providers:
+        events.extend(await provider(user_id))
+    return events
+
+
+class Subscription:
+    async def get(self, timeout: float) -> Optional[dict]:
+        """
+        Next event, or ``None`` if nothing arrived within ``timeout`` seconds.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+
+class BaseEventBroker:
+    def publish(self, channel: str, event: dict) -> None:
+        raise NotImplementedError
+
+    async def subscribe(self, channel: str) -> Subscription:
+        raise NotImplementedError
+
+
+class RedisEventBroker(BaseEventBroker):
+    """
+    Redis pub/sub: Celery workers publish, ASGI workers subscribe.
+    """
+
+    def __init__(self, url: str) -> None:
+        if not HAS_REDIS:
+            raise RuntimeError("redis is not installed")
+        self.url = url
+        self._client = redis.Redis.from_url(url)
+
+    def publish(self, channel: str, event: dict) -> None:
+        try:
+            self._client.publish(channel, json.dumps(event))
+        except redis.RedisError as exc:
+            logger.warning("core.events.publish_failed", channel=channel, error=str(exc))
+
+    async def subscribe(self, channel: str) -> Subscription:
+        client = redis_asyncio.Redis.from_url(self.url)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        return _RedisSubscription(client, pubsub)
+
+
+class _RedisSubscription(Subscription):
+    def __init__(self, client, pubsub) -> None:
+        self._client = client
+        self._pubsub = pubsub
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            message = await self._pubsub.get_message(timeout=remaining)
+            if message is not None and message["type"] == "message":
+                return json.loads(message["data"])
+
+    async def close(self) -> None:
+        await self._pubsub.aclose()
+        await self._client.aclose()
+
+
+class InMemoryEventBroker(BaseEventBroker):
+    """
+    Single-process broker for tests and local development without Redis.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    def publish(self, channel: str, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._queues.get(channel, ()))
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    async def subscribe(self, channel: str) -> Subscription:
+        entry = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._queues.setdefault(channel, set()).add(entry)
+        return _InMemorySubscription(self, channel, entry)
+
+    def _unsubscribe(self, channel: str, entry) -> None:
+        with self._lock:
+            subscribers = self._queues.get(channel, set())
+            subscribers.discard(entry)
+            if not subscribers:
+                self._queues.pop(channel, None)
+
+
+class _InMemorySubscription(Subscription):
+    def __init__(self, broker: InMemoryEventBroker, channel: str, entry) -> None:
+        self._broker = broker
+        self._channel = channel
+        self._entry = entry
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        try:
+            return await asyncio.wait_for(self._entry[1].get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self._broker._unsubscribe(self._channel, self._entry)
+
+
+def get_broker() -> BaseEventBroker:
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                if settings.EVENTS_BROKER == "memory":
+                    _broker = InMemoryEventBroker()
+                else:
+                    _broker = RedisEventBroker(settings.EVENTS_REDIS_URL)
+    return _broker
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+
+from apps.core.db_routers import use_read_alias
+
+try:
+    import brotli  # type: ignore
+
+    HAS_BROTLI = True
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    brotli = None
+    HAS_BROTLI = False
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve safe-method API reads from the read replica.
+
+    A client that has just written is pinned to the primary for
+    ``DATABASE_REPLICA_PIN_SECONDS`` so it reads its own writes despite
+    replication lag. Clients are identified by their credentials (token header
+    or session cookie), which keeps the check free of database queries.
+    Credentials issued by a response (a new session cookie after login) are
+    pinned too: the replica may not have that session or user yet. The
+    middleware sits above ``SessionMiddleware`` so it sees that cookie.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        alias = settings.DATABASE_READ_REPLICA_ALIAS
+        if not alias or alias not in connections.databases:
+            return self.get_response(request)
+
+        client_key = self._client_key(request)
+        if (
+            request.method in SAFE_METHODS
+            and request.path.startswith(settings.DATABASE_REPLICA_PATH_PREFIX)
+            and not (client_key and cache.get(client_key))
+        ):
+            with use_read_alias(alias):
+                response = self.get_response(request)
+        else:
+            response = self.get_response(request)
+
+        pinned = [self._issued_key(response)]
+        if request.method not in SAFE_METHODS:
+            pinned.append(client_key)
+        pinned = [key for key in pinned if key]
+        if pinned:
+            cache.set_many(dict.fromkeys(pinned, True), timeout=settings.DATABASE_REPLICA_PIN_SECONDS)
+        return response
+
+    @classmethod
+    def _client_key(cls, request) -> Optional[str]:
+        return cls._pin_key(
+            request.META.get("HTTP_AUTHORIZATION") or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        )
+
+    @classmethod
+    def _issued_key(cls, response) -> Optional[str]:
+        morsel = response.cookies.get(settings.SESSION_COOKIE_NAME)
+        return cls._pin_key(morsel.value) if morsel is not None else None
+
+    @staticmethod
+    def _pin_key(credentials: Optional[str]) -> Optional[str]:
+        if not credentials:
+            return None
+        digest = hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+        return f"db:primary-pin:{digest}"
+
+
+class CompressionMiddleware:
+    """
+    Brotli or gzip for API payloads, picked from ``Accept-Encoding``.
+
+    Only the content types in ``COMPRESSION_CONTENT_TYPES`` are compressed
+    (HTML with CSRF tokens is left alone), bodies under
+    ``COMPRESSION_MIN_SIZE`` are sent as is, and streaming responses such as
+    the event stream are never touched so they are not buffered.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        content_type = response.get("Content-Type", "").split(";")[0].strip()
+        if content_type not in settings.COMPRESSION_CONTENT_TYPES:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        encoding = self._choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if encoding == "br":
+            compressed = brotli.compress(response.content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+        else:
+            compressed = gzip.compress(response.content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = encoding
+        # A compressed body is a different byte sequence: the ETag becomes weak
+        # (RFC 9110 8.8.1); weak comparison still matches If-None-Match.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
+
+    @staticmethod
+    def _choose_encoding(header: str) -> Optional[str]:
+        accepted = {}
+        for item in header.split(","):
+            coding, _, params = item.strip().partition(";")
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            accepted[coding.strip().lower()] = quality
+        if HAS_BROTLI and accepted.get("br", 0) > 0:
+            return "br"
+        if accepted.get("gzip", 0) > 0:
+            return "gzip"
+        return None
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional, Tuple
+
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+VARIANT_HEADERS = ("HTTP_ACCEPT", "HTTP_ACCEPT_ENCODING")
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for ``retrieve`` and ``list``.
+
+    Validators are computed from ``updated_at`` (plus ``etag_fields``) with a
+    single ``values()`` lookup or aggregate, before the view builds its full
+    queryset with prefetches, so a ``304 Not Modified`` costs one indexed query.
+    Anything that changes a resource's representation must bump ``updated_at``
+    or one of ``etag_fields``.
+    """
+
+    etag_fields: Tuple[str, ...] = ()
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = (
+            self._validator_queryset()
+            .filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+            .values("updated_at", *self.etag_fields)
+            .first()
+        )
+        if row is None:
+            return super().retrieve(request, *args, **kwargs)
+        etag, last_modified = self._validators(
+            request,
+            row["updated_at"],
+            kwargs[lookup_url_kwarg],
+            *(row[field] for field in self.etag_fields),
+        )
+        return self._conditional(request, etag, last_modified, super().retrieve, args, kwargs)
+
+    def list(self, request, *args, **kwargs):
+        aggregate = self._validator_queryset().aggregate(
+            last_modified=Max("updated_at"),
+            total=Count("pk"),
+            **{f"max_{field}": Max(field) for field in self.etag_fields},
+        )
+        etag, last_modified = self._validators(
+            request,
+            aggregate["last_modified"],
+            "list",
+            aggregate["total"],
+            *(aggregate[f"max_{field}"] for field in self.etag_fields),
+        )
+        return self._conditional(request, etag, last_modified, super().list, args, kwargs)
+
+    def _validator_queryset(self):
+        return self.filter_queryset(self.get_queryset()).prefetch_related(None).order_by()
+
+    def _validators(self, request, updated_at, *parts: Any) -> Tuple[str, Optional[float]]:
+        fingerprint = [
+            type(self).__name__,
+            str(request.user.pk),
+            request.get_full_path(),
+            *(request.META.get(header, "") for header in VARIANT_HEADERS),
+            *(self._format_part(part) for part in (updated_at, *parts)),
+        ]
+        digest = hashlib.sha256("|".join(fingerprint).encode("utf-8")).hexdigest()[:32]
+        last_modified = updated_at.timestamp() if updated_at is not None else None
+        return quote_etag(digest), last_modified
+
+    def _conditional(self, request, etag, last_modified, handler, args, kwargs):
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    @staticmethod
+    def _format_part(part: Any) -> str:
+        if hasattr(part, "isoformat"):
+            return part.isoformat()
+        return str(part)
+
+
+class FastRepresentationMixin:
+    """
+    Opt-in ``retrieve`` through ``fast_serializer_class``.
+
+    The fast serializer receives the filtered queryset narrowed to the looked-up
+    object and returns one representation per row, identical to what
+    ``serializer_class`` would produce. Object-level permissions are not
+    checked, so only views that scope access in ``get_queryset`` should opt in.
+    """
+
+    fast_serializer_class = None
+
+    def retrieve(self, request, *args, **kwargs):
+        if self.fast_serializer_class is None:
+            return super().retrieve(request, *args, **kwargs)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: kwargs[lookup_url_kwarg]}
+        )
+        data = self.fast_serializer_class(context=self.get_serializer_context()).serialize(queryset)
+        if not data:
+            raise Http404
+        return Response(data[0])
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime as dt
+import json
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over ``(ordering field, pk)``.
+
+    Each page is a single ``WHERE (field, id) < (value, id) ... LIMIT n`` query,
+    so its cost depends on the page size only, never on how deep the client has
+    scrolled. Ties on the ordering field are broken by the primary key, which
+    keeps pages stable even when many rows share the same value.
+
+    The order is fixed by ``ordering``; a client ``?ordering=`` (from the
+    default ``OrderingFilter``) is rejected rather than silently overridden.
+    """
+
+    ordering: Tuple[str, str] = ("-created_at", "-id")
+    page_size = settings.REST_FRAMEWORK.get("PAGE_SIZE", 50)
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    ordering_query_param = api_settings.ORDERING_PARAM
+    ordering_not_supported_message = "Ordering is fixed for this endpoint"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        if request.query_params.get(self.ordering_query_param):
+            raise ValidationError({self.ordering_query_param: [self.ordering_not_supported_message]})
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        self.reverse = bool(cursor and cursor["r"])
+
+        ordering = self._ordering(reverse=self.reverse)
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(self._after(cursor, reverse=self.reverse))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = cursor is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, obj, reverse: bool) -> str:
+        field = self.ordering[0].lstrip("-")
+        value = getattr(obj, field)
+        if isinstance(value, (dt.date, dt.datetime)):
+            value = value.isoformat()
+        payload = json.dumps({"v": value, "id": obj.pk, "r": int(reverse)}, separators=(",", ":"))
+        token = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request) -> Optional[dict]:
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8"))
+            if not isinstance(cursor, dict) or not {"v", "id", "r"} <= cursor.keys():
+                raise ValueError(token)
+            int(cursor["id"])
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def _ordering(self, reverse: bool) -> Tuple[str, ...]:
+        if not reverse:
+            return tuple(self.ordering)
+        return tuple(name[1:] if name.startswith("-") else f"-{name}" for name in self.ordering)
+
+    def _after(self, cursor: dict, reverse: bool) -> Q:
+        field_ordering, pk_ordering = self._ordering(reverse)
+        field = field_ordering.lstrip("-")
+        field_op = "lt" if field_ordering.startswith("-") else "gt"
+        pk_op = "lt" if pk_ordering.startswith("-") else "gt"
+        value: Any = cursor["v"]
+        return Q(**{f"{field}__{field_op}": value}) | Q(
+            **{field: value, f"pk__{pk_op}": cursor["id"]}
+        )
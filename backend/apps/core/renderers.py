@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack  # type: ignore
+
+    HAS_MSGPACK = True
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    msgpack = None
+    HAS_MSGPACK = False
+
+try:
+    import cbor2  # type: ignore
+
+    HAS_CBOR = True
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    cbor2 = None
+    HAS_CBOR = False
+
+_json_encoder = JSONEncoder()
+
+
+def _encode_value(value):
+    # Same textual forms as JSONRenderer (dates, decimals, UUIDs, lazy strings, ...).
+    return _json_encoder.default(value)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    ``application/msgpack`` representation, selected with ``Accept`` or ``?format=msgpack``.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_encode_value, use_bin_type=True)
+
+
+class CBORRenderer(BaseRenderer):
+    """
+    ``application/cbor`` representation, selected with ``Accept`` or ``?format=cbor``.
+    """
+
+    media_type = "application/cbor"
+    format = "cbor"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return cbor2.dumps(data, default=lambda encoder, value: encoder.encode(_encode_value(value)))
@@ -1,7 +1,55 @@
+from typing import Iterable, Optional, Set
+
 from rest_framework import serializers
 
 from apps.core.models import Location
 
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def _parse_field_list(value: Optional[str]) -> Set[str]:
+    if not value:
+        return set()
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
+class SparseFieldsetsMixin:
+    """
+    Sparse fieldsets for read requests.
+
+    ``?fields=a,b`` limits the representation to the listed fields and
+    ``?expand=c`` opts into the heavy fields declared in
+    ``Meta.expandable_fields``, which are omitted by default. Views can call
+    ``selected_fields`` to trim their querysets to match.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.selected_fields(self.context.get("request"))
+        if selected is None:
+            return
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
+
+    @classmethod
+    def selected_fields(cls, request) -> Optional[Set[str]]:
+        """
+        Field names to render for ``request``; ``None`` means all fields.
+        """
+        field_names: Iterable[str] = cls.Meta.fields
+        expandable = set(getattr(cls.Meta, "expandable_fields", ()))
+        if request is None or request.method not in SAFE_METHODS:
+            return None if not expandable else set(field_names) - expandable
+
+        requested = _parse_field_list(request.query_params.get("fields"))
+        expanded = _parse_field_list(request.query_params.get("expand")) & expandable
+        expanded |= requested & expandable
+        selected = (set(field_names) - expandable) | expanded
+        if requested:
+            selected &= requested
+        return selected
+
 
 class LocationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -0,0 +1,82 @@
+import datetime as dt
+
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from rest_framework.authtoken.models import Token
+
+from apps.charts.models import NatalChart
+from apps.charts.tasks import compute_natal_chart_async
+from apps.core import events
+from apps.core.events import InMemoryEventBroker
+
+
+def test_in_memory_broker_delivers_to_channel_subscribers_only():
+    broker = InMemoryEventBroker()
+
+    async def scenario():
+        mine = await broker.subscribe("user:1")
+        other = await broker.subscribe("user:2")
+        broker.publish("user:1", {"type": "natal_chart", "id": 7, "status": "ready"})
+        received = await mine.get(timeout=1)
+        missed = await other.get(timeout=0.05)
+        await mine.close()
+        await other.close()
+        return received, missed
+
+    received, missed = async_to_sync(scenario)()
+    assert received == {"type": "natal_chart", "id": 7, "status": "ready"}
+    assert missed is None
+    assert broker._queues == {}
+
+
+def test_event_stream_sends_snapshot_then_published_events(user, location):
+    pending = NatalChart.objects.create(
+        owner=user,
+        title="Без расчёта",
+        event_datetime=dt.datetime(2000, 1, 1, tzinfo=dt.timezone.utc),
+        event_location=location,
+    )
+    token = Token.objects.create(user=user)
+
+    async def scenario():
+        response = await AsyncClient().get("/api/v1/core/events/", headers={"Authorization": f"Token {token.key}"})
+        stream = aiter(response.streaming_content)
+        chunks = [await anext(stream), await anext(stream)]
+        events.get_broker().publish(
+            events.user_channel(user.pk), {"type": "natal_chart", "id": pending.pk, "status": "ready"}
+        )
+        chunks.append(await anext(stream))
+        await stream.aclose()
+        return response, [chunk.decode() if isinstance(chunk, bytes) else chunk for chunk in chunks]
+
+    response, chunks = async_to_sync(scenario)()
+    assert response["Content-Type"] == "text/event-stream"
+    assert chunks[0].startswith("retry: ")
+    assert chunks[1].startswith("event: natal_chart\n")
+    assert f'"id": {pending.pk}, "status": "pending"' in chunks[1]
+    assert f'"id": {pending.pk}, "status": "ready"' in chunks[2]
+
+
+def test_event_stream_requires_authentication(db):
+    response = async_to_sync(AsyncClient().get)("/api/v1/core/events/")
+    assert response.status_code == 401
+
+
+def test_skipped_computation_publishes_nothing(chart, monkeypatch):
+    published = []
+    monkeypatch.setattr(events, "publish_status", lambda *args, **kwargs: published.append(args))
+
+    compute_natal_chart_async.apply(kwargs={"chart_id": chart.pk})
+
+    assert published == []
+
+
+def test_computation_publishes_processing_then_ready(chart, monkeypatch):
+    published = []
+    monkeypatch.setattr(events, "publish_status", lambda *args, **kwargs: published.append((args, kwargs)))
+
+    compute_natal_chart_async.apply(kwargs={"chart_id": chart.pk, "force": True})
+
+    chart.refresh_from_db()
+    assert [args[3] for args, _kwargs in published] == ["processing", "ready"]
+    assert published[-1][1] == {"computation_id": chart.current_computation_id}
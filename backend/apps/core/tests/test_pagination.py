@@ -0,0 +1,12 @@
+from rest_framework.test import APIClient
+
+
+def test_keyset_pages_reject_client_ordering(chart, user):
+    client = APIClient()
+    client.force_authenticate(user)
+
+    response = client.get("/api/v1/charts/natal-charts/", {"ordering": "created_at"})
+
+    assert response.status_code == 400
+    assert "ordering" in response.json()
+    assert client.get("/api/v1/charts/natal-charts/").json()["results"][0]["id"] == chart.pk
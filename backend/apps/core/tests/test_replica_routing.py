@@ -0,0 +1,84 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from apps.core.models import Location
+
+pytestmark = pytest.mark.django_db(databases=["default", "replica"])
+
+LOCATIONS_URL = "/api/v1/core/locations/"
+
+
+@pytest.fixture(autouse=True)
+def replica_routing(settings):
+    settings.DATABASE_READ_REPLICA_ALIAS = "replica"
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _location(name: str) -> dict:
+    return {
+        "name": name,
+        "city": name,
+        "state": "",
+        "country": "Россия",
+        "latitude": "55.750000",
+        "longitude": "37.620000",
+        "timezone": "Europe/Moscow",
+    }
+
+
+def _token_client(username: str, databases=("default", "replica")) -> APIClient:
+    # The same user and token exist on both sides, as after replication.
+    for alias in databases:
+        user = get_user_model().objects.db_manager(alias).create_user(username=username, password="secret")
+        token = Token.objects.using(alias).create(user=user, key=f"{username:0<40}"[:40])
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+    return client
+
+
+def test_reads_without_pin_are_served_by_replica():
+    Location.objects.using("replica").create(**_location("Реплика"))
+
+    response = APIClient().get(LOCATIONS_URL)
+
+    assert response.status_code == 200
+    assert "Реплика" in response.content.decode()
+
+
+def test_writer_reads_own_write_from_primary():
+    writer = _token_client("writer")
+
+    created = writer.post(LOCATIONS_URL, _location("Запись"), format="json")
+    assert created.status_code == 201, created.content
+    assert Location.objects.using("default").filter(name="Запись").exists()
+    assert not Location.objects.using("replica").filter(name="Запись").exists()
+
+    assert "Запись" in writer.get(LOCATIONS_URL).content.decode()
+    # Another client is not pinned and still sees the lagging replica.
+    assert "Запись" not in APIClient().get(LOCATIONS_URL).content.decode()
+
+
+def test_unsafe_request_is_never_routed_to_replica():
+    writer = _token_client("writer")
+    # Pin expired: the next write still lands on the primary.
+    cache.clear()
+
+    assert writer.post(LOCATIONS_URL, _location("Вторая"), format="json").status_code == 201
+    assert Location.objects.using("default").filter(name="Вторая").exists()
+
+
+def test_session_issued_by_login_is_pinned():
+    # The user and the new session exist on the primary only, as under lag.
+    get_user_model().objects.create_user(username="fresh", password="secret")
+    client = APIClient()
+
+    login = client.post("/api-auth/login/", {"username": "fresh", "password": "secret"})
+    assert login.status_code == 302
+
+    response = client.get("/api/v1/accounts/profiles/")
+    assert response.status_code == 200
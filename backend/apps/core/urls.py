@@ -1,9 +1,14 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from apps.core.views import LocationViewSet
+from apps.core.views import LocationViewSet, location_autocomplete, task_events
 
 router = DefaultRouter()
 router.register(r"locations", LocationViewSet, basename="location")
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("events/", task_events, name="task-events"),
+    path("autocomplete/", location_autocomplete, name="location-autocomplete"),
+    *router.urls,
+]
 
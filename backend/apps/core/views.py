@@ -1,7 +1,13 @@
+import json
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from rest_framework import permissions, viewsets
+from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
+from apps.core import events
 from apps.core.models import Location
 from apps.core.serializers import LocationSerializer
 from apps.integrations.geocoding import GeocodingService
@@ -21,19 +27,76 @@ class LocationViewSet(viewsets.ModelViewSet):
         if not query:
             return Response([])
         service = GeocodingService()
-        results = [
-            {
-                "id": result.location.id,
-                "name": result.location.name,
-                "city": result.location.city,
-                "state": result.location.state,
-                "country": result.location.country,
-                "latitude": float(result.location.latitude),
-                "longitude": float(result.location.longitude),
-                "timezone": result.location.timezone,
-                "score": result.score,
-            }
-            for result in service.autocomplete(query=query, limit=limit)
-        ]
+        results = _autocomplete_payload(service.autocomplete(query=query, limit=limit))
         return Response(results)
 
+
+async def location_autocomplete(request):
+    """
+    Async counterpart of ``LocationViewSet.autocomplete`` with hedged provider requests.
+    """
+    query = request.GET.get("q", "")
+    limit = int(request.GET.get("limit", 5))
+    if not query:
+        return JsonResponse([], safe=False)
+    results = await GeocodingService().aautocomplete(query=query, limit=limit)
+    return JsonResponse(_autocomplete_payload(results), safe=False)
+
+
+def _autocomplete_payload(results):
+    return [
+        {
+            "id": result.location.id,
+            "name": result.location.name,
+            "city": result.location.city,
+            "state": result.location.state,
+            "country": result.location.country,
+            "latitude": float(result.location.latitude),
+            "longitude": float(result.location.longitude),
+            "timezone": result.location.timezone,
+            "score": result.score,
+        }
+        for result in results
+    ]
+
+
+async def task_events(request):
+    """
+    Server-Sent Events stream of the current user's job status transitions.
+
+    Authenticates with the session or an ``Authorization: Token`` header.
+    """
+    user = await _authenticate(request)
+    if user is None:
+        return HttpResponse(status=401)
+    response = StreamingHttpResponse(_event_stream(user.pk), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def _authenticate(request):
+    keyword, _, key = request.headers.get("Authorization", "").partition(" ")
+    if keyword == "Token" and key:
+        token = await Token.objects.select_related("user").filter(key=key.strip()).afirst()
+        return token.user if token and token.user.is_active else None
+    user = await request.auser()
+    return user if user.is_authenticated else None
+
+
+async def _event_stream(user_id: int):
+    # Subscribe before taking the snapshot so no transition falls in between.
+    subscription = await events.get_broker().subscribe(events.user_channel(user_id))
+    try:
+        yield f"retry: {settings.EVENTS_RETRY_MS}\n\n"
+        for event in await events.snapshot(user_id):
+            yield _format_event(event)
+        while True:
+            event = await subscription.get(timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+            yield _format_event(event) if event is not None else ": keep-alive\n\n"
+    finally:
+        await subscription.close()
+
+
+def _format_event(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
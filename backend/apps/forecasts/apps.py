@@ -6,3 +6,11 @@ class ForecastsConfig(AppConfig):
     name = "apps.forecasts"
     verbose_name = "Forecasts"
 
+    def ready(self) -> None:
+        from apps.core import events
+        from apps.forecasts import transit_table
+        from apps.forecasts.tasks import in_flight_forecast_batches
+        from apps.integrations import ephemeris
+
+        events.register_snapshot(in_flight_forecast_batches)
+        ephemeris.register_series_source(transit_table.transit_series)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import datetime as dt
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import structlog
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.accounts.models import UserProfile
+from apps.charts.models import NatalChart
+from apps.forecasts.models import ForecastBatch
+
+logger = structlog.get_logger(__name__)
+
+SLOT_KEY = "forecasts:daily:slot:{index}"
+PROGRESS_KEY = "forecasts:daily:run:{run_id}:{field}"
+PROGRESS_FIELDS = ("total", "done", "failed")
+# Long enough for a morning's fan-out to be inspected after it finishes.
+PROGRESS_TIMEOUT = 24 * 60 * 60
+
+
+def zones_by_offset(zones: Iterable[str], now: dt.datetime) -> Dict[dt.timedelta, List[str]]:
+    """
+    Profile timezones grouped by their current UTC offset; unknown names are skipped.
+    """
+    offsets: List[Tuple[dt.timedelta, str]] = []
+    for name in zones:
+        try:
+            offsets.append((now.astimezone(ZoneInfo(name)).utcoffset(), name))
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning("forecasts.daily.unknown_timezone", timezone=name)
+    offsets.sort()
+    return {offset: [name for _offset, name in group] for offset, group in groupby(offsets, key=lambda item: item[0])}
+
+
+def due_offsets(now: dt.datetime) -> Dict[dt.timedelta, List[str]]:
+    """
+    Offset groups whose local time is within the lead window before the
+    daily forecast hour.
+    """
+    zones = UserProfile.objects.filter(user__is_active=True).values_list("timezone", flat=True).distinct()
+    ready_hour = settings.DAILY_FORECAST_LOCAL_HOUR
+    first_hour = ready_hour - settings.DAILY_FORECAST_LEAD_HOURS
+    return {
+        offset: names
+        for offset, names in zones_by_offset(zones, now).items()
+        if first_hour <= (now + offset).hour < ready_hour
+    }
+
+
+def create_daily_batches(zones: List[str], local_date: dt.date, offset: dt.timedelta) -> int:
+    """
+    Pending day batches for every computed own chart of active users in
+    ``zones``, covering ``local_date`` at ``offset``; existing batches are
+    left alone. Returns the number of charts.
+    """
+    chart_ids = NatalChart.objects.filter(
+        owner__is_active=True,
+        profile__user_id=F("owner_id"),
+        profile__timezone__in=zones,
+        current_computation__isnull=False,
+    ).values_list("id", flat=True)
+    chart_ids = list(chart_ids)
+    for chunk in _chunks(chart_ids, settings.FORECAST_ENTRY_BATCH_SIZE):
+        ForecastBatch.objects.bulk_create(
+            [
+                ForecastBatch(
+                    chart_id=chart_id,
+                    horizon=ForecastBatch.Horizon.DAY,
+                    start_date=local_date,
+                    end_date=local_date,
+                    utc_offset_minutes=int(offset.total_seconds() // 60),
+                )
+                for chart_id in chunk
+            ],
+            ignore_conflicts=True,
+        )
+    return len(chart_ids)
+
+
+def claim_daily_batches(zones: List[str], local_date: dt.date, run_id: str) -> List[int]:
+    """
+    Mark pending, not yet dispatched day batches of the same charts
+    ``create_daily_batches`` covers in ``zones`` with ``run_id``.
+
+    Each claim is a conditional update on the ``updated_at`` that was read, so
+    of two overlapping beats each batch goes to exactly one run, and the run
+    keys are merged into the existing metadata; ``updated_at`` moves with the
+    claim, keeping validators fresh.
+    """
+    candidates = ForecastBatch.objects.filter(
+        horizon=ForecastBatch.Horizon.DAY,
+        start_date=local_date,
+        status="pending",
+        metadata__daily_run__isnull=True,
+        chart__owner__is_active=True,
+        chart__profile__user_id=F("chart__owner_id"),
+        chart__profile__timezone__in=zones,
+        chart__current_computation__isnull=False,
+    ).values_list("pk", "metadata", "updated_at")
+    claimed = []
+    with transaction.atomic():
+        for pk, metadata, updated_at in list(candidates):
+            won = ForecastBatch.objects.filter(
+                pk=pk, status="pending", metadata__daily_run__isnull=True, updated_at=updated_at
+            ).update(metadata={**(metadata or {}), "daily_run": run_id}, updated_at=timezone.now())
+            if won:
+                claimed.append(pk)
+    return claimed
+
+
+def acquire_slot(owner: str) -> Optional[int]:
+    """
+    One of ``DAILY_FORECAST_MAX_CONCURRENCY`` cache-held slots, or ``None`` when all are taken.
+
+    Slots expire with the task time limit, so a killed worker cannot hold one forever.
+    """
+    for index in range(settings.DAILY_FORECAST_MAX_CONCURRENCY):
+        if cache.add(SLOT_KEY.format(index=index), owner, timeout=settings.DAILY_FORECAST_CHUNK_TIME_LIMIT):
+            return index
+    return None
+
+
+def release_slot(index: int) -> None:
+    cache.delete(SLOT_KEY.format(index=index))
+
+
+def start_progress(run_id: str, total: int) -> None:
+    cache.set_many(
+        {
+            PROGRESS_KEY.format(run_id=run_id, field="total"): total,
+            PROGRESS_KEY.format(run_id=run_id, field="done"): 0,
+            PROGRESS_KEY.format(run_id=run_id, field="failed"): 0,
+        },
+        timeout=PROGRESS_TIMEOUT,
+    )
+
+
+def record_progress(run_id: str, done: int, failed: int) -> Dict[str, int]:
+    for field, value in (("done", done), ("failed", failed)):
+        if value:
+            try:
+                cache.incr(PROGRESS_KEY.format(run_id=run_id, field=field), value)
+            except ValueError:
+                # The counters expired; the log line below still reports this chunk.
+                pass
+    return run_progress(run_id)
+
+
+def run_progress(run_id: str) -> Dict[str, int]:
+    """
+    ``total``, ``done`` and ``failed`` batch counts of one dispatch run.
+    """
+    values = cache.get_many([PROGRESS_KEY.format(run_id=run_id, field=field) for field in PROGRESS_FIELDS])
+    return {field: values.get(PROGRESS_KEY.format(run_id=run_id, field=field), 0) for field in PROGRESS_FIELDS}
+
+
+def run_id_for(now: dt.datetime, offset: dt.timedelta) -> str:
+    local = now + offset
+    sign = "-" if offset < dt.timedelta(0) else "+"
+    minutes = int(abs(offset).total_seconds() // 60)
+    return f"{local:%Y-%m-%dT%H}{sign}{minutes // 60:02d}{minutes % 60:02d}"
+
+
+def _chunks(items: List[int], size: int) -> Iterable[List[int]]:
+    for index in range(0, len(items), size):
+        yield items[index : index + size]
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import datetime as dt
+import io
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import structlog
+from django.conf import settings
+from django.utils import timezone
+
+from apps.forecasts.models import EphemerisTable
+from apps.integrations import solver
+from apps.integrations.ephemeris import SIGN_NAMES, datetime_from_julian_day, julian_day, longitude_series
+
+logger = structlog.get_logger(__name__)
+
+PHASE_NAMES = ("new_moon", "first_quarter", "full_moon", "last_quarter")
+# Bodies whose aspects end a void-of-course stretch.
+ASPECTED_BODIES = ("sun", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto")
+# Moon-to-body separations forming a major aspect, in 30° steps.
+ASPECT_STEPS = (0, 2, 3, 4, 6, 8, 9, 10)
+# The Moon moves ~1° in two hours; every bracket holds one crossing.
+SEARCH_STEP_HOURS = 2.0
+# A Moon sign lasts under three days, so a year's first void stretch
+# always starts inside the padding.
+PADDING_DAYS = 3.0
+ARRAYS = ("phase_times", "phase_kinds", "ingress_times", "ingress_signs", "void_starts", "void_ends")
+
+CALENDAR_NAME = "lunar_calendar"
+# How long a worker trusts its loaded calendar before asking for a newer build.
+RELOAD_CHECK_SECONDS = 60.0
+
+_loaded: Optional[Tuple[str, "LunarCalendar"]] = None
+_checked_at = -np.inf
+_load_lock = threading.Lock()
+
+
+@dataclass
+class LunarCalendar:
+    """
+    Global Moon events as sorted arrays of Julian days (UT).
+
+    Phases and sign ingresses are instants with an index into ``PHASE_NAMES``
+    or ``SIGN_NAMES``; void-of-course stretches run from the Moon's last major
+    aspect in a sign to its next ingress. Range lookups bisect the arrays.
+    """
+
+    phase_times: np.ndarray
+    phase_kinds: np.ndarray
+    ingress_times: np.ndarray
+    ingress_signs: np.ndarray
+    void_starts: np.ndarray
+    void_ends: np.ndarray
+    source: str
+
+    def covers(self, start: dt.datetime, end: dt.datetime) -> bool:
+        return bool(
+            len(self.ingress_times)
+            and self.ingress_times[0] <= julian_day(start)
+            and julian_day(end) <= self.ingress_times[-1]
+        )
+
+    def phases(self, start: dt.datetime, end: dt.datetime) -> List[dict]:
+        lower, upper = _bounds(self.phase_times, start, end)
+        return [
+            {"time": datetime_from_julian_day(moment), "phase": PHASE_NAMES[kind]}
+            for moment, kind in zip(
+                self.phase_times[lower:upper].tolist(), self.phase_kinds[lower:upper].tolist()
+            )
+        ]
+
+    def ingresses(self, start: dt.datetime, end: dt.datetime) -> List[dict]:
+        lower, upper = _bounds(self.ingress_times, start, end)
+        return [
+            {"time": datetime_from_julian_day(moment), "sign": SIGN_NAMES[sign]}
+            for moment, sign in zip(
+                self.ingress_times[lower:upper].tolist(), self.ingress_signs[lower:upper].tolist()
+            )
+        ]
+
+    def void_periods(self, start: dt.datetime, end: dt.datetime) -> List[dict]:
+        """
+        Void-of-course stretches overlapping ``[start, end)``.
+        """
+        # Stretches never overlap, so both boundary arrays are sorted.
+        lower = int(np.searchsorted(self.void_ends, julian_day(start), side="right"))
+        upper = int(np.searchsorted(self.void_starts, julian_day(end), side="left"))
+        return [
+            {"start": datetime_from_julian_day(first), "end": datetime_from_julian_day(last)}
+            for first, last in zip(
+                self.void_starts[lower:upper].tolist(), self.void_ends[lower:upper].tolist()
+            )
+        ]
+
+    def window(self, start: dt.datetime, end: dt.datetime) -> dict:
+        return {
+            "phases": self.phases(start, end),
+            "ingresses": self.ingresses(start, end),
+            "void_of_course": self.void_periods(start, end),
+        }
+
+
+def _bounds(times: np.ndarray, start: dt.datetime, end: dt.datetime) -> Tuple[int, int]:
+    return (
+        int(np.searchsorted(times, julian_day(start), side="left")),
+        int(np.searchsorted(times, julian_day(end), side="left")),
+    )
+
+
+def _crossings(
+    times: np.ndarray, func: Callable[[np.ndarray], np.ndarray], step: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Moments an increasing ``func`` passes a multiple of ``step``, with that multiple.
+    """
+    levels = np.floor(func(times) / step)
+    rows = np.nonzero(np.diff(levels))[0]
+    targets = levels[rows + 1] * step
+    moments = solver.bisect(lambda at: func(at) - targets, times[rows], times[rows + 1])
+    return moments, levels[rows + 1].astype(np.int64)
+
+
+def year_events(year: int) -> Tuple[Dict[str, np.ndarray], str]:
+    """
+    Phases, ingresses and void-of-course stretches of one calendar year.
+
+    Moon-minus-body separations only grow (the Moon outpaces every planet),
+    so each event is an upward crossing of a multiple of 30° or 90° on
+    unwrapped longitudes, refined by the shared solver.
+    """
+    first = julian_day(dt.datetime(year, 1, 1, tzinfo=dt.timezone.utc))
+    last = julian_day(dt.datetime(year + 1, 1, 1, tzinfo=dt.timezone.utc))
+    series = longitude_series(
+        ("moon",) + ASPECTED_BODIES,
+        datetime_from_julian_day(first - PADDING_DAYS),
+        datetime_from_julian_day(last + PADDING_DAYS),
+        SEARCH_STEP_HOURS,
+    )
+
+    def moon(at: np.ndarray) -> np.ndarray:
+        return series.position("moon", at)
+
+    phase_times, phase_levels = _crossings(series.times, lambda at: moon(at) - series.position("sun", at), 90.0)
+    ingress_times, ingress_levels = _crossings(series.times, moon, 30.0)
+
+    aspect_times: List[np.ndarray] = []
+    for slug in ASPECTED_BODIES:
+        moments, levels = _crossings(series.times, lambda at: moon(at) - series.position(slug, at), 30.0)
+        aspect_times.append(moments[np.isin(levels % 12, ASPECT_STEPS)])
+    aspects = np.sort(np.concatenate(aspect_times))
+
+    # Each stretch between two ingresses turns void at its last aspect; with
+    # none at all the whole stretch is void.
+    entered, left = ingress_times[:-1], ingress_times[1:]
+    last_aspect = np.searchsorted(aspects, left, side="left") - 1
+    candidate = aspects[np.maximum(last_aspect, 0)]
+    void_starts = np.where((last_aspect >= 0) & (candidate >= entered), candidate, entered)
+
+    def in_year(moments: np.ndarray) -> np.ndarray:
+        return (moments >= first) & (moments < last)
+
+    phases, ingresses, voids = in_year(phase_times), in_year(ingress_times), in_year(left)
+    return {
+        "phase_times": phase_times[phases],
+        "phase_kinds": (phase_levels[phases] % 4).astype(np.int8),
+        "ingress_times": ingress_times[ingresses],
+        "ingress_signs": (ingress_levels[ingresses] % 12).astype(np.int8),
+        "void_starts": void_starts[voids],
+        "void_ends": left[voids],
+    }, series.source
+
+
+def calendar_parameters() -> dict:
+    return {
+        "start_year": settings.LUNAR_CALENDAR_START_YEAR,
+        "end_year": settings.LUNAR_CALENDAR_END_YEAR,
+    }
+
+
+def read_metadata() -> Optional[dict]:
+    return EphemerisTable.objects.filter(name=CALENDAR_NAME).values_list("metadata", flat=True).first()
+
+
+def build_calendar() -> dict:
+    """
+    Search every configured year and store the calendar in the database,
+    where every worker picks it up.
+    """
+    parameters = calendar_parameters()
+    parts: Dict[str, List[np.ndarray]] = {name: [] for name in ARRAYS}
+    sources = set()
+    for year in range(parameters["start_year"], parameters["end_year"] + 1):
+        events, source = year_events(year)
+        sources.add(source)
+        for name in ARRAYS:
+            parts[name].append(events[name])
+    arrays = {name: np.concatenate(chunks) for name, chunks in parts.items()}
+
+    metadata = {
+        **parameters,
+        "source": ",".join(sorted(sources)),
+        "events": {name: len(arrays[name]) for name in ("phase_times", "ingress_times", "void_starts")},
+        "built_at": timezone.now().isoformat(),
+    }
+    payload = io.BytesIO()
+    np.savez_compressed(payload, **arrays)
+    EphemerisTable.objects.update_or_create(
+        name=CALENDAR_NAME, defaults={"metadata": metadata, "data": payload.getvalue()}
+    )
+    logger.info("forecasts.lunar_calendar.built", **metadata["events"], source=metadata["source"])
+    return metadata
+
+
+def get_calendar() -> Optional[LunarCalendar]:
+    """
+    The current calendar, reloaded after a rebuild; ``None`` until one is built.
+
+    The database is asked for the build stamp at most every
+    ``RELOAD_CHECK_SECONDS``.
+    """
+    global _loaded, _checked_at
+    now = time.monotonic()
+    if now - _checked_at < RELOAD_CHECK_SECONDS:
+        return _loaded[1] if _loaded is not None else None
+
+    with _load_lock:
+        if now - _checked_at < RELOAD_CHECK_SECONDS:
+            return _loaded[1] if _loaded is not None else None
+        metadata = read_metadata()
+        _checked_at = now
+        if metadata is None:
+            _loaded = None
+            return None
+        if _loaded is not None and _loaded[0] == metadata["built_at"]:
+            return _loaded[1]
+        row = EphemerisTable.objects.filter(name=CALENDAR_NAME).values("metadata", "data").first()
+        if row is None:
+            _loaded = None
+            return None
+        metadata = row["metadata"]
+        try:
+            with np.load(io.BytesIO(bytes(row["data"]))) as archive:
+                arrays = {name: archive[name] for name in ARRAYS}
+        except (KeyError, OSError, ValueError) as exc:
+            logger.warning("forecasts.lunar_calendar.unreadable", error=str(exc))
+            return None
+        calendar = LunarCalendar(**arrays, source=metadata["source"])
+        _loaded = (metadata["built_at"], calendar)
+        return calendar
+
+
+def lunar_window(start: dt.datetime, end: dt.datetime) -> Optional[dict]:
+    """
+    Moon events of ``[start, end)``; ``None`` when no calendar covers it.
+    """
+    calendar = get_calendar()
+    if calendar is None or not calendar.covers(start, end):
+        return None
+    return calendar.window(start, end)
+
+
+def is_current(metadata: Optional[dict]) -> bool:
+    if metadata is None:
+        return False
+    return all(metadata.get(key) == value for key, value in calendar_parameters().items())
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charts', '0006_keyset_pagination_indexes'),
+        ('forecasts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forecastbatch',
+            index=models.Index(fields=['-start_date', '-id'], name='forecasts_f_start_d_f329c5_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasts', '0002_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forecastentry',
+            index=models.Index(fields=['batch', 'timeframe_start', 'id'], name='forecasts_f_batch_i_f47929_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasts', '0003_forecast_entry_timeframe_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ForecastScoreSeries',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('theme', models.CharField(max_length=32)),
+                ('start_date', models.DateField()),
+                ('values', models.BinaryField()),
+                ('block_maxima', models.BinaryField()),
+                ('batch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='score_series', to='forecasts.forecastbatch')),
+            ],
+            options={
+                'unique_together': {('batch', 'theme')},
+            },
+        ),
+    ]
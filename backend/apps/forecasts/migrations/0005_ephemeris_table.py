@@ -0,0 +1,28 @@
+# Generated by Django 5.1.2 on 2026-10-19 17:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasts', '0004_forecast_score_series'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EphemerisTable',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=32, unique=True)),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+                ('data', models.BinaryField()),
+            ],
+            options={
+                'ordering': ('-created_at',),
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-19 17:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasts', '0005_ephemeris_table'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='forecastbatch',
+            name='utc_offset_minutes',
+            field=models.SmallIntegerField(default=0),
+        ),
+    ]
@@ -33,11 +33,14 @@ class ForecastBatch(TimeStampedModel):
         ),
         default="pending",
     )
+    # Days run from local midnight at this UTC offset; user batches stay on UTC.
+    utc_offset_minutes = models.SmallIntegerField(default=0)
     metadata = models.JSONField(default=dict, blank=True)
 
     class Meta:
         ordering = ("-start_date",)
         unique_together = ("chart", "horizon", "start_date", "end_date")
+        indexes = [models.Index(fields=["-start_date", "-id"])]
 
 
 class ForecastEntry(TimeStampedModel):
@@ -55,4 +58,33 @@ class ForecastEntry(TimeStampedModel):
 
     class Meta:
         ordering = ("timeframe_start",)
+        indexes = [models.Index(fields=["batch", "timeframe_start", "id"])]
 
+
+class ForecastScoreSeries(TimeStampedModel):
+    """
+    Daily scores of one theme over a batch window as packed float32 arrays,
+    with per-block maxima for range queries.
+    """
+
+    batch = models.ForeignKey(
+        ForecastBatch, on_delete=models.CASCADE, related_name="score_series"
+    )
+    theme = models.CharField(max_length=32)
+    start_date = models.DateField()
+    values = models.BinaryField()
+    block_maxima = models.BinaryField()
+
+    class Meta:
+        unique_together = ("batch", "theme")
+
+
+class EphemerisTable(TimeStampedModel):
+    """
+    A precomputed array shared by every worker: the packed NumPy payload and
+    the metadata it was built with.
+    """
+
+    name = models.CharField(max_length=32, unique=True)
+    metadata = models.JSONField(default=dict, blank=True)
+    data = models.BinaryField()
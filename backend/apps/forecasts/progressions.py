@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Dict, List, Tuple
+
+import numpy as np
+import structlog
+
+from apps.charts.models import Aspect
+from apps.forecasts import transits
+from apps.forecasts.models import ForecastBatch
+from apps.integrations.ephemeris import (
+    EphemerisClient,
+    LongitudeSeries,
+    datetime_from_julian_day,
+    julian_day,
+    longitude_series,
+    time_grid,
+)
+
+logger = structlog.get_logger(__name__)
+
+Horizon = ForecastBatch.Horizon
+
+# Day-for-a-year: one ephemeris day after birth per tropical year of life.
+YEAR_DAYS = 365.24219
+
+PROGRESSION_HORIZONS = (Horizon.FIVE_YEARS, Horizon.TEN_YEARS, Horizon.THIRTY_YEARS)
+PROGRESSED_BODIES = ("sun", "moon", "mercury", "venus", "mars")
+# Progressed and directed points move at most ~0.04°/day, so orb windows
+# last weeks at least.
+GRID_STEP_DAYS = 5.0
+
+PROGRESSION_ASPECTS = {
+    Aspect.AspectType.CONJUNCTION: {"angle": 0.0, "orb": 1.0, "weight": 1.0},
+    Aspect.AspectType.OPPOSITION: {"angle": 180.0, "orb": 1.0, "weight": 0.9},
+    Aspect.AspectType.SQUARE: {"angle": 90.0, "orb": 1.0, "weight": 0.9},
+    Aspect.AspectType.TRINE: {"angle": 120.0, "orb": 1.0, "weight": 0.7},
+    Aspect.AspectType.SEXTILE: {"angle": 60.0, "orb": 1.0, "weight": 0.5},
+}
+
+PROGRESSION_WEIGHTS = {
+    "sun": 0.9,
+    "moon": 0.7,
+    "mercury": 0.6,
+    "venus": 0.6,
+    "mars": 0.7,
+}
+SOLAR_ARC_WEIGHT = 0.8
+
+
+def progressed_series(
+    birth_jd: float, times: np.ndarray, client: EphemerisClient | None = None
+) -> LongitudeSeries:
+    """
+    Secondary progressed longitudes at each real moment of ``times``.
+
+    The ephemeris is read once for the progressed span (a month for thirty
+    years) and evaluated at all progressed moments in a single pass; speeds are
+    converted to degrees per real day so the solver can use them.
+    """
+    progressed_times = birth_jd + (times - birth_jd) / YEAR_DAYS
+    ephemeris = longitude_series(
+        PROGRESSED_BODIES,
+        datetime_from_julian_day(progressed_times[0] - 1.0),
+        datetime_from_julian_day(progressed_times[-1] + 1.0),
+        step_hours=6.0,
+        client=client,
+    )
+    longitudes: Dict[str, np.ndarray] = {}
+    speeds: Dict[str, np.ndarray] = {}
+    for slug in PROGRESSED_BODIES:
+        longitudes[slug] = ephemeris.position(slug, progressed_times)
+        speeds[slug] = np.interp(progressed_times, ephemeris.times, ephemeris.speeds[slug]) / YEAR_DAYS
+    return LongitudeSeries(times=times, longitudes=longitudes, speeds=speeds, source=ephemeris.source)
+
+
+def solar_arc_series(progressed: LongitudeSeries, points: Dict[str, float]) -> LongitudeSeries:
+    """
+    Every natal point directed by the arc the progressed Sun has travelled.
+    """
+    arc = progressed.longitudes["sun"] - points["sun"]
+    arc -= 360.0 * np.floor(arc[0] / 360.0)
+    return LongitudeSeries(
+        times=progressed.times,
+        longitudes={name: longitude + arc for name, longitude in points.items()},
+        speeds={name: progressed.speeds["sun"] for name in points},
+        source=progressed.source,
+    )
+
+
+def compute_progressions(
+    batch: ForecastBatch,
+    client: EphemerisClient | None = None,
+    window: Tuple[dt.datetime, dt.datetime] | None = None,
+) -> Tuple[List[transits.TransitEvent], LongitudeSeries | None]:
+    """
+    Progressed-to-natal and solar-arc-to-natal aspects for long horizons,
+    over ``window`` (the batch's own dates by default), with the progressed
+    series they were found in (``None`` for horizons without progressions).
+    """
+    if batch.horizon not in PROGRESSION_HORIZONS:
+        return [], None
+    points = transits.natal_points(batch.chart)
+    start, end = window or transits.batch_window(batch)
+    times = time_grid(julian_day(start), julian_day(end), GRID_STEP_DAYS)
+    progressed = progressed_series(julian_day(batch.chart.event_datetime), times, client)
+
+    events = transits.detect_transits(
+        progressed,
+        points,
+        aspects=PROGRESSION_ASPECTS,
+        body_weights=PROGRESSION_WEIGHTS,
+        technique="progression",
+    )
+    if "sun" in points:
+        # Every directed point aspects its own natal place at the same arc.
+        events += transits.detect_transits(
+            solar_arc_series(progressed, points),
+            points,
+            aspects=PROGRESSION_ASPECTS,
+            body_weights={name: SOLAR_ARC_WEIGHT for name in points},
+            technique="solar_arc",
+            exclude_same_point=True,
+        )
+    logger.info(
+        "forecasts.progressions.computed",
+        batch_id=batch.id,
+        horizon=batch.horizon,
+        events=len(events),
+        source=progressed.source,
+    )
+    return events, progressed
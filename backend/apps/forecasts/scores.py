@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from apps.forecasts import transits
+from apps.forecasts.models import ForecastBatch, ForecastScoreSeries
+
+# A theme collects the events touching any of its points, transiting or natal.
+THEMES: Dict[str, Tuple[str, ...]] = {
+    "general": (),
+    "love": ("venus", "moon"),
+    "career": ("sun", "saturn", "jupiter", "mc"),
+    "money": ("venus", "jupiter"),
+    "communication": ("mercury",),
+    "energy": ("mars", "sun", "asc"),
+}
+THEME_NAMES = {
+    "general": "Общий фон",
+    "love": "Любовь и отношения",
+    "career": "Карьера",
+    "money": "Деньги",
+    "communication": "Общение и учёба",
+    "energy": "Энергия и здоровье",
+}
+# Harmonious aspects help, tense ones hinder; a conjunction mostly amplifies.
+NATURE_SIGNS = {
+    "conjunction": 0.5,
+    "trine": 1.0,
+    "sextile": 1.0,
+    "square": -1.0,
+    "opposition": -1.0,
+}
+# Days an aspect is exact count twice.
+EXACT_BONUS = 1.0
+# Range maxima are kept per block, so a query skips whole blocks that
+# cannot beat what it has already found.
+BLOCK_DAYS = 32
+
+
+@dataclass
+class ScoreSeries:
+    start_date: dt.date
+    values: np.ndarray
+    block_maxima: np.ndarray
+
+    @classmethod
+    def from_row(cls, row: ForecastScoreSeries) -> "ScoreSeries":
+        return cls(
+            start_date=row.start_date,
+            values=np.frombuffer(bytes(row.values), dtype=np.float32),
+            block_maxima=np.frombuffer(bytes(row.block_maxima), dtype=np.float32),
+        )
+
+    def best_days(
+        self,
+        first: Optional[dt.date] = None,
+        last: Optional[dt.date] = None,
+        top: Optional[int] = None,
+        threshold: Optional[float] = None,
+    ) -> List[Tuple[dt.date, float]]:
+        """
+        Days of ``[first, last]`` scoring at least ``threshold``, best ``top`` of them.
+
+        With ``top`` the result is ordered by score (earlier day first on ties),
+        otherwise by date. Blocks whose maximum is below the threshold or the
+        current ``top``-th score are never read.
+        """
+        lower = 0 if first is None else max(0, (first - self.start_date).days)
+        upper = len(self.values) if last is None else min(len(self.values), (last - self.start_date).days + 1)
+        if lower >= upper:
+            return []
+
+        # Partial blocks at the edges are read directly; whole blocks go by their maxima.
+        first_block = -(-lower // BLOCK_DAYS)
+        last_block = upper // BLOCK_DAYS
+        if first_block >= last_block:
+            chunks = [np.arange(lower, upper)]
+            blocks = np.array([], dtype=np.int64)
+        else:
+            chunks = [
+                np.arange(lower, first_block * BLOCK_DAYS),
+                np.arange(last_block * BLOCK_DAYS, upper),
+            ]
+            blocks = np.arange(first_block, last_block)
+            blocks = blocks[np.argsort(-self.block_maxima[blocks], kind="stable")]
+
+        floor = -np.inf if threshold is None else threshold
+        days = np.concatenate(chunks)
+        days = days[self.values[days] >= floor]
+        for block in blocks.tolist():
+            bound = self.block_maxima[block]
+            if bound < floor:
+                break
+            if top is not None and len(days) >= top:
+                kth = np.partition(self.values[days], len(days) - top)[len(days) - top]
+                if bound < kth:
+                    break
+            span = np.arange(block * BLOCK_DAYS, (block + 1) * BLOCK_DAYS)
+            days = np.concatenate([days, span[self.values[span] >= floor]])
+
+        days = np.sort(days)
+        if top is not None:
+            days = days[np.argsort(-self.values[days], kind="stable")][:top]
+        return [
+            (self.start_date + dt.timedelta(days=day), round(float(self.values[day]), 3))
+            for day in days.tolist()
+        ]
+
+
+def block_maxima(values: np.ndarray) -> np.ndarray:
+    blocks = -(-len(values) // BLOCK_DAYS)
+    padded = np.full(blocks * BLOCK_DAYS, -np.inf, dtype=np.float32)
+    padded[: len(values)] = values
+    return padded.reshape(blocks, BLOCK_DAYS).max(axis=1)
+
+
+def daily_scores(
+    events: List[transits.TransitEvent], origin: dt.datetime, days: int
+) -> Dict[str, np.ndarray]:
+    """
+    One score per day from ``origin`` and theme: the signed intensity of every
+    event in orb that day, with the day of each exact pass counted once more.
+    """
+
+    def day_index(moment: dt.datetime) -> int:
+        return min(days - 1, max(0, (moment - origin).days))
+
+    scores = {theme: np.zeros(days + 1, dtype=np.float64) for theme in THEMES}
+    bonuses = {theme: np.zeros(days, dtype=np.float64) for theme in THEMES}
+    for event in events:
+        weight = NATURE_SIGNS[event.aspect] * event.intensity
+        first, last = day_index(event.start), day_index(event.end)
+        exact_days = [day_index(moment) for moment in event.exact_times]
+        for theme, points in THEMES.items():
+            if points and event.transiting not in points and event.natal not in points:
+                continue
+            # Running-sum form: +weight on the first day, -weight after the last.
+            scores[theme][first] += weight
+            scores[theme][last + 1] -= weight
+            for day in exact_days:
+                bonuses[theme][day] += EXACT_BONUS * weight
+    return {
+        theme: (np.cumsum(scores[theme])[:days] + bonuses[theme]).astype(np.float32)
+        for theme in THEMES
+    }
+
+
+def build_series(batch: ForecastBatch, events: List[transits.TransitEvent]) -> List[ForecastScoreSeries]:
+    days = (batch.end_date - batch.start_date).days + 1
+    origin, _end = transits.batch_window(batch)
+    rows = []
+    for theme, values in daily_scores(events, origin, days).items():
+        rows.append(
+            ForecastScoreSeries(
+                batch=batch,
+                theme=theme,
+                start_date=batch.start_date,
+                values=values.tobytes(),
+                block_maxima=block_maxima(values).tobytes(),
+            )
+        )
+    return rows
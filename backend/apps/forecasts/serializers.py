@@ -1,6 +1,9 @@
+from django.conf import settings
 from rest_framework import serializers
 
+from apps.forecasts.lunar_calendar import PHASE_NAMES
 from apps.forecasts.models import ForecastBatch, ForecastEntry
+from apps.forecasts.scores import THEME_NAMES
 
 
 class ForecastEntrySerializer(serializers.ModelSerializer):
@@ -21,7 +24,14 @@ class ForecastEntrySerializer(serializers.ModelSerializer):
 
 
 class ForecastBatchSerializer(serializers.ModelSerializer):
-    entries = ForecastEntrySerializer(many=True, read_only=True)
+    """
+    Counts and summary only; entries are paged through the ``entries`` action.
+    """
+
+    entries_count = serializers.SerializerMethodField()
+
+    def get_entries_count(self, obj):
+        return (obj.metadata or {}).get("entries")
 
     class Meta:
         model = ForecastBatch
@@ -33,9 +43,73 @@ class ForecastBatchSerializer(serializers.ModelSerializer):
             "end_date",
             "status",
             "metadata",
-            "entries",
+            "entries_count",
             "created_at",
             "updated_at",
         )
         read_only_fields = ("status", "metadata", "created_at", "updated_at")
 
+
+class ForecastEntryFilterSerializer(serializers.Serializer):
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        if "start" in attrs and "end" in attrs and attrs["start"] >= attrs["end"]:
+            raise serializers.ValidationError({"end": "Конец периода должен быть позже начала."})
+        return attrs
+
+
+class LunarCalendarQuerySerializer(serializers.Serializer):
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+    def validate(self, attrs):
+        if attrs["start"] >= attrs["end"]:
+            raise serializers.ValidationError({"end": "Конец периода должен быть позже начала."})
+        if (attrs["end"] - attrs["start"]).days > settings.LUNAR_CALENDAR_MAX_DAYS:
+            raise serializers.ValidationError(
+                {"end": f"Период не может быть длиннее {settings.LUNAR_CALENDAR_MAX_DAYS} дней."}
+            )
+        return attrs
+
+
+class LunarPhaseSerializer(serializers.Serializer):
+    time = serializers.DateTimeField()
+    phase = serializers.ChoiceField(choices=PHASE_NAMES)
+
+
+class MoonIngressSerializer(serializers.Serializer):
+    time = serializers.DateTimeField()
+    sign = serializers.CharField()
+
+
+class VoidOfCourseSerializer(serializers.Serializer):
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+
+class LunarCalendarSerializer(serializers.Serializer):
+    phases = LunarPhaseSerializer(many=True)
+    ingresses = MoonIngressSerializer(many=True)
+    void_of_course = VoidOfCourseSerializer(many=True)
+
+
+class BestDaysQuerySerializer(serializers.Serializer):
+    theme = serializers.ChoiceField(choices=list(THEME_NAMES.items()))
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    top = serializers.IntegerField(required=False, min_value=1, max_value=366)
+    threshold = serializers.FloatField(required=False)
+
+    def validate(self, attrs):
+        if "start" in attrs and "end" in attrs and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError({"end": "Конец периода не может быть раньше начала."})
+        if "top" not in attrs and "threshold" not in attrs:
+            attrs["top"] = 5
+        return attrs
+
+
+class BestDaySerializer(serializers.Serializer):
+    date = serializers.DateField()
+    score = serializers.FloatField()
@@ -1,15 +1,87 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Iterable
+from dataclasses import replace
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import structlog
+from django.conf import settings
 from django.utils import timezone
 
-from apps.forecasts.models import ForecastBatch, ForecastEntry
+from apps.charts.registry import celestial_bodies
+from apps.forecasts import lunar_calendar, progressions, scores, transits
+from apps.forecasts.models import ForecastBatch, ForecastEntry, ForecastScoreSeries
+from apps.forecasts.serializers import LunarCalendarSerializer
 
 logger = structlog.get_logger(__name__)
 
+Window = Tuple[dt.datetime, dt.datetime]
+
+# Moon phases, ingresses and void-of-course periods matter day by day only.
+LUNAR_HORIZONS = (ForecastBatch.Horizon.DAY, ForecastBatch.Horizon.WEEK)
+
+SUMMARY_HIGHLIGHTS = 5
+
+ANGLE_NAMES = {
+    "asc": "Асцендент",
+    "mc": "Середина неба",
+}
+
+TECHNIQUE_PREFIXES = {
+    "transit": "",
+    "progression": "Прогр. ",
+    "solar_arc": "Дир. ",
+}
+
+TECHNIQUE_PHRASES = {
+    "transit": "в транзите",
+    "progression": "во вторичной прогрессии",
+    "solar_arc": "в дирекции солнечной дуги",
+}
+
+ASPECT_LABELS = {
+    "conjunction": "соединение",
+    "opposition": "оппозиция",
+    "square": "квадрат",
+    "trine": "трин",
+    "sextile": "секстиль",
+}
+
+ASPECT_ACCUSATIVE = {
+    "conjunction": "соединение",
+    "opposition": "оппозицию",
+    "square": "квадрат",
+    "trine": "трин",
+    "sextile": "секстиль",
+}
+
+ASPECT_NATURE = {
+    "conjunction": "fusion",
+    "opposition": "tension",
+    "square": "tension",
+    "trine": "harmony",
+    "sextile": "harmony",
+}
+
+NATURE_TEXTS = {
+    "fusion": {
+        "opportunities": "Новый цикл в теме натальной точки: энергия транзита сливается с ней и усиливает её.",
+        "challenges": "Сильная концентрация на одной теме может вытеснять остальные сферы жизни.",
+        "recommendations": "Начинайте важное осознанно и задавайте направление на весь следующий цикл.",
+    },
+    "tension": {
+        "opportunities": "Напряжение подталкивает к решениям, которые давно откладывались.",
+        "challenges": "Возможны конфликты, внешнее давление и необходимость перестраивать планы.",
+        "recommendations": "Не форсируйте события, распределяйте нагрузку и оставляйте запас времени.",
+    },
+    "harmony": {
+        "opportunities": "Обстоятельства складываются благоприятно, усилия дают результат легче обычного.",
+        "challenges": "Поддержка периода легко проходит незамеченной, если её не использовать.",
+        "recommendations": "Используйте период для развития и договорённостей, проявляйте инициативу.",
+    },
+}
+
 
 def generate_forecast_batch(batch: ForecastBatch, force: bool = False) -> None:
     if batch.entries.exists() and not force:
@@ -20,34 +92,324 @@ def generate_forecast_batch(batch: ForecastBatch, force: bool = False) -> None:
     batch.status = "processing"
     batch.save(update_fields=["status", "updated_at"])
 
-    entries = _compute_entries(batch)
+    source = None if force else _find_overlapping_batch(batch)
+    if source is None:
+        events, ephemeris = _compute_events(batch, transits.batch_window(batch))
+        incremental = None
+    else:
+        events, ephemeris, incremental = _extend_events(batch, source)
+    events.sort(key=lambda event: (event.start, -event.intensity))
 
     batch.entries.all().delete()
-    ForecastEntry.objects.bulk_create(entries)
+    # Entries are built and written a chunk at a time, so a 30-year batch
+    # never holds all of its model instances in memory at once.
+    chunk_size = settings.FORECAST_ENTRY_BATCH_SIZE
+    for chunk in _chunks(events, chunk_size):
+        ForecastEntry.objects.bulk_create(
+            [_entry_from_event(batch, event) for event in chunk], batch_size=chunk_size
+        )
+    batch.score_series.all().delete()
+    ForecastScoreSeries.objects.bulk_create(scores.build_series(batch, events))
 
+    profile = transits.HORIZON_PROFILES[batch.horizon]
     batch.status = "ready"
-    batch.metadata = {"generated_at": timezone.now().isoformat()}
+    batch.metadata = {
+        "generated_at": timezone.now().isoformat(),
+        "engine": "transits",
+        "version": transits.ENGINE_VERSION,
+        "computation_id": batch.chart.current_computation_id,
+        "ephemeris": ephemeris,
+        "step_hours": profile.step_hours,
+        "bodies": list(profile.bodies),
+        "techniques": sorted({event.technique for event in events}),
+        "entries": len(events),
+        "summary": _summarize(events),
+    }
+    if incremental is not None:
+        batch.metadata["incremental"] = incremental
+    if batch.horizon in LUNAR_HORIZONS:
+        lunar = lunar_calendar.lunar_window(*transits.batch_window(batch))
+        if lunar is not None:
+            batch.metadata["lunar"] = LunarCalendarSerializer(lunar).data
     batch.save(update_fields=["status", "metadata", "updated_at"])
 
 
-def _compute_entries(batch: ForecastBatch) -> Iterable[ForecastEntry]:
-    logger.warning(
-        "forecasts.compute_entries.stub",
-        batch_id=batch.id,
-        chart_id=batch.chart_id,
-        horizon=batch.horizon,
+def _compute_events(batch: ForecastBatch, window: Window) -> Tuple[List[transits.TransitEvent], str]:
+    """
+    Transit and progression events over ``window`` and the ephemeris sources
+    both series came from.
+    """
+    events, series = transits.compute_transits(batch, window=window)
+    progressed_events, progressed = progressions.compute_progressions(batch, window=window)
+    events += progressed_events
+    return events, _ephemeris_label(series.source, progressed and progressed.source)
+
+
+def _ephemeris_label(*labels: Optional[str]) -> str:
+    """
+    Sorted, comma-separated distinct sources of ``labels``, each possibly a list already.
+    """
+    sources = {source for label in labels if label for source in label.split(",")}
+    return ",".join(sorted(sources))
+
+
+def _find_overlapping_batch(batch: ForecastBatch) -> Optional[ForecastBatch]:
+    """
+    Latest ready batch of the same chart and horizon overlapping ``batch``,
+    computed by this engine version from the chart's current natal data.
+
+    Batches computed in whole or in part on the mean-motion stub are never
+    reused, so a provider outage does not outlive the batch it hit.
+    """
+    return (
+        ForecastBatch.objects.filter(
+            chart_id=batch.chart_id,
+            horizon=batch.horizon,
+            status="ready",
+            start_date__lte=batch.end_date,
+            end_date__gte=batch.start_date,
+            metadata__version=transits.ENGINE_VERSION,
+            metadata__computation_id=batch.chart.current_computation_id,
+        )
+        .exclude(pk=batch.pk)
+        .exclude(metadata__ephemeris__icontains="stub")
+        .order_by("-end_date", "-id")
+        .first()
     )
-    timeframe = dt.datetime.combine(batch.start_date, dt.time(), tzinfo=timezone.utc)
-    entry = ForecastEntry(
-        batch=batch,
-        title=f"{batch.get_horizon_display()} forecast",
-        timeframe_start=timeframe,
-        timeframe_end=timeframe,
-        summary="Прогноз будет сформирован после интеграции с BioAstrology 2.0.",
-        opportunities="",
-        challenges="",
-        recommendations="",
-        metadata={"engine": "bioastro-2.0", "version": "0.1.0"},
+
+
+def _extend_events(
+    batch: ForecastBatch, source: ForecastBatch
+) -> Tuple[List[transits.TransitEvent], str, dict]:
+    """
+    Reuse ``source`` entries for the overlap and compute only the days outside it.
+
+    Stretches still in orb at a window edge are stored cut at that edge; where
+    a freshly computed piece continues one, the two are joined again. Reused
+    entries reaching outside the new window are recomputed over the part
+    inside it, since their orb, intensity and exact passes describe the
+    whole stretch.
+    """
+    start, end = transits.batch_window(batch)
+    source_start, source_end = transits.batch_window(source)
+    overlap = (max(start, source_start), min(end, source_end))
+
+    reused = source.entries.filter(timeframe_start__lt=overlap[1], timeframe_end__gte=overlap[0])
+    events: List[transits.TransitEvent] = []
+    cut: List[transits.TransitEvent] = []
+    for entry in reused.iterator(chunk_size=settings.FORECAST_ENTRY_BATCH_SIZE):
+        event = _event_from_entry(entry)
+        clipped = _clip(event, start, end)
+        (events if clipped is event else cut).append(clipped)
+    incremental = {"source_batch": source.id, "reused": len(events), "computed": []}
+    sources = [source.metadata.get("ephemeris")]
+
+    for window, group in _edge_windows(cut, start, end):
+        computed, ephemeris = _compute_events(batch, window)
+        events += _recomputed(group, computed)
+        sources.append(ephemeris)
+        incremental["computed"].append(_computed_window(window, ephemeris, recomputed=len(group)))
+
+    for gap, boundary in (((start, overlap[0]), overlap[0]), ((overlap[1], end), overlap[1])):
+        if gap[0] >= gap[1]:
+            continue
+        computed, ephemeris = _compute_events(batch, gap)
+        events = _join(events + computed, boundary)
+        sources.append(ephemeris)
+        incremental["computed"].append(_computed_window(gap, ephemeris))
+
+    logger.info("forecasts.generate_forecast_batch.incremental", batch_id=batch.id, **incremental)
+    return events, _ephemeris_label(*sources), incremental
+
+
+def _edge_windows(
+    cut: List[transits.TransitEvent], start: dt.datetime, end: dt.datetime
+) -> Iterator[Tuple[Window, List[transits.TransitEvent]]]:
+    """
+    Spans to recompute for stretches cut at the window start or end: from the
+    edge to the far end of the longest stretch cut there.
+    """
+    leading = [event for event in cut if event.start == start]
+    trailing = [event for event in cut if event.start != start]
+    if leading:
+        yield (start, max(event.end for event in leading)), leading
+    if trailing:
+        yield (min(event.start for event in trailing), end), trailing
+
+
+def _recomputed(
+    group: List[transits.TransitEvent], computed: List[transits.TransitEvent]
+) -> List[transits.TransitEvent]:
+    """
+    The freshly computed counterpart of each cut stretch in ``group``.
+    """
+    fresh: Dict[tuple, List[transits.TransitEvent]] = {}
+    for event in computed:
+        fresh.setdefault(_event_key(event), []).append(event)
+    result = []
+    for event in group:
+        matches = [
+            candidate
+            for candidate in fresh.get(_event_key(event), [])
+            if candidate.start < event.end and event.start < candidate.end
+        ]
+        if matches:
+            result.append(matches[0])
+        else:
+            # Too short to show up on the grid of the shorter span.
+            logger.debug("forecasts.generate_forecast_batch.edge_dropped", key=_event_key(event))
+    return result
+
+
+def _computed_window(window: Window, ephemeris: str, **extra) -> dict:
+    return {"start": window[0].isoformat(), "end": window[1].isoformat(), "ephemeris": ephemeris, **extra}
+
+
+def _event_key(event: transits.TransitEvent) -> tuple:
+    return (event.technique, event.transiting, event.natal, event.aspect)
+
+
+def _event_from_entry(entry: ForecastEntry) -> transits.TransitEvent:
+    metadata = entry.metadata
+    return transits.TransitEvent(
+        transiting=metadata["bodies"][0],
+        natal=metadata["bodies"][1],
+        aspect=metadata["aspect"],
+        start=entry.timeframe_start,
+        end=entry.timeframe_end,
+        exact=dt.datetime.fromisoformat(metadata["exact"]),
+        exact_times=[dt.datetime.fromisoformat(moment) for moment in metadata["exact_times"]],
+        orb=metadata["orb"],
+        intensity=metadata["intensity"],
+        retrograde=metadata["retrograde"],
+        technique=metadata["technique"],
+    )
+
+
+def _clip(event: transits.TransitEvent, start: dt.datetime, end: dt.datetime) -> transits.TransitEvent:
+    if start <= event.start and event.end <= end:
+        return event
+    exact_times = [moment for moment in event.exact_times if start <= moment <= end]
+    return replace(
+        event,
+        start=max(event.start, start),
+        end=min(event.end, end),
+        exact=exact_times[0] if exact_times else min(max(event.exact, start), end),
+        exact_times=exact_times,
     )
-    return [entry]
 
+
+def _join(events: List[transits.TransitEvent], boundary: dt.datetime) -> List[transits.TransitEvent]:
+    """
+    Join pieces of one in-orb stretch that were cut at ``boundary``.
+    """
+    ending: Dict[tuple, transits.TransitEvent] = {}
+    starting: Dict[tuple, transits.TransitEvent] = {}
+    rest: List[transits.TransitEvent] = []
+    for event in events:
+        if event.end == boundary and _event_key(event) not in ending:
+            ending[_event_key(event)] = event
+        elif event.start == boundary and _event_key(event) not in starting:
+            starting[_event_key(event)] = event
+        else:
+            rest.append(event)
+
+    for key, left in ending.items():
+        right = starting.pop(key, None)
+        if right is None:
+            rest.append(left)
+            continue
+        closer = left if left.orb <= right.orb else right
+        exact_times = left.exact_times + right.exact_times
+        rest.append(
+            replace(
+                left,
+                end=right.end,
+                exact=exact_times[0] if exact_times else closer.exact,
+                exact_times=exact_times,
+                orb=min(left.orb, right.orb),
+                intensity=max(left.intensity, right.intensity),
+                retrograde=closer.retrograde,
+            )
+        )
+    rest.extend(starting.values())
+    return rest
+
+
+def _summarize(events: List[transits.TransitEvent]) -> dict:
+    """
+    Counts and the strongest periods, so a batch can be shown without its entries.
+    """
+    by_technique: dict = {}
+    by_aspect: dict = {}
+    for event in events:
+        by_technique[event.technique] = by_technique.get(event.technique, 0) + 1
+        by_aspect[event.aspect] = by_aspect.get(event.aspect, 0) + 1
+    strongest = sorted(events, key=lambda event: -event.intensity)[:SUMMARY_HIGHLIGHTS]
+    return {
+        "by_technique": by_technique,
+        "by_aspect": by_aspect,
+        "highlights": [
+            {
+                "title": _entry_title(event),
+                "timeframe_start": event.start.isoformat(),
+                "timeframe_end": event.end.isoformat(),
+                "intensity": event.intensity,
+            }
+            for event in strongest
+        ],
+    }
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _point_name(slug: str) -> str:
+    if slug in ANGLE_NAMES:
+        return ANGLE_NAMES[slug]
+    body = celestial_bodies.get_by_slug(slug)
+    return body.name if body else slug
+
+
+def _entry_title(event: transits.TransitEvent) -> str:
+    transiting = _point_name(event.transiting)
+    natal = _point_name(event.natal)
+    return f"{TECHNIQUE_PREFIXES[event.technique]}{transiting} — {ASPECT_LABELS[event.aspect]} — {natal}"[:128]
+
+
+def _entry_from_event(batch: ForecastBatch, event: transits.TransitEvent) -> ForecastEntry:
+    transiting = _point_name(event.transiting)
+    natal = _point_name(event.natal)
+    nature = ASPECT_NATURE[event.aspect]
+    motion = " (ретроградно)" if event.retrograde and event.technique != "solar_arc" else ""
+    if event.exact_times:
+        dates = ", ".join(f"{moment:%d.%m.%Y %H:%M}" for moment in event.exact_times)
+        exactness = f"Точный аспект (UTC): {dates}."
+    else:
+        exactness = f"Аспект не становится точным, минимальный орбис {event.orb:.2f}°."
+    return ForecastEntry(
+        batch=batch,
+        title=_entry_title(event),
+        timeframe_start=event.start,
+        timeframe_end=event.end,
+        summary=(
+            f"{transiting}{motion} {TECHNIQUE_PHRASES[event.technique]} образует {ASPECT_ACCUSATIVE[event.aspect]} "
+            f"к натальной точке «{natal}». {exactness}"
+        ),
+        opportunities=NATURE_TEXTS[nature]["opportunities"],
+        challenges=NATURE_TEXTS[nature]["challenges"],
+        recommendations=NATURE_TEXTS[nature]["recommendations"],
+        metadata={
+            "technique": event.technique,
+            "bodies": [event.transiting, event.natal],
+            "aspect": event.aspect,
+            "exact": event.exact.isoformat(),
+            "exact_times": [moment.isoformat() for moment in event.exact_times],
+            "orb": event.orb,
+            "intensity": event.intensity,
+            "retrograde": event.retrograde,
+        },
+    )
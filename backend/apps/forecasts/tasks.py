@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import structlog
-from celery import shared_task
+from celery import group, shared_task
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
-from apps.forecasts import services
+from apps.core import events
+from apps.forecasts import daily, lunar_calendar, services, transit_table
 from apps.forecasts.models import ForecastBatch
+from apps.integrations.ephemeris import HAS_SWISSEPH, SwissEphemerisClient
 
 logger = structlog.get_logger(__name__)
 
@@ -13,8 +17,117 @@ logger = structlog.get_logger(__name__)
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
 def generate_forecast_batch_async(self, batch_id: int, force: bool = False) -> None:
     logger.info("forecasts.generate_forecast_batch_async.started", batch_id=batch_id, force=force)
-    with transaction.atomic():
-        batch = ForecastBatch.objects.select_for_update().get(pk=batch_id)
-        services.generate_forecast_batch(batch=batch, force=force)
+    owner_id = ForecastBatch.objects.values_list("chart__owner_id", flat=True).get(pk=batch_id)
+    events.publish_status(owner_id, "forecast_batch", batch_id, "processing")
+    try:
+        with transaction.atomic():
+            batch = ForecastBatch.objects.select_for_update().get(pk=batch_id)
+            services.generate_forecast_batch(batch=batch, force=force)
+    except Exception:
+        events.publish_status(
+            owner_id,
+            "forecast_batch",
+            batch_id,
+            "failed",
+            retrying=self.request.retries < self.max_retries,
+        )
+        raise
+    events.publish_status(owner_id, "forecast_batch", batch_id, batch.status)
     logger.info("forecasts.generate_forecast_batch_async.completed", batch_id=batch_id)
 
+
+@shared_task
+def schedule_daily_forecasts_async() -> int:
+    """
+    Create and dispatch day batches for timezones approaching the forecast hour.
+    """
+    now = timezone.now()
+    dispatched = 0
+    for offset, zones in daily.due_offsets(now).items():
+        local_date = (now + offset).date()
+        run_id = daily.run_id_for(now, offset)
+        daily.create_daily_batches(zones, local_date, offset)
+        batch_ids = daily.claim_daily_batches(zones, local_date, run_id)
+        if not batch_ids:
+            continue
+        daily.start_progress(run_id, len(batch_ids))
+        chunk_size = settings.DAILY_FORECAST_CHUNK_SIZE
+        group(
+            generate_forecast_batches_async.s(batch_ids[index : index + chunk_size], run_id)
+            for index in range(0, len(batch_ids), chunk_size)
+        ).apply_async()
+        dispatched += len(batch_ids)
+        logger.info(
+            "forecasts.schedule_daily_forecasts_async.dispatched",
+            run_id=run_id,
+            timezones=len(zones),
+            batches=len(batch_ids),
+            local_date=local_date.isoformat(),
+        )
+    return dispatched
+
+
+@shared_task(bind=True, max_retries=None, time_limit=settings.DAILY_FORECAST_CHUNK_TIME_LIMIT)
+def generate_forecast_batches_async(self, batch_ids: list[int], run_id: str) -> None:
+    slot = daily.acquire_slot(self.request.id)
+    if slot is None:
+        # Every slot is busy: wait instead of piling more load on the database.
+        raise self.retry(countdown=settings.DAILY_FORECAST_RETRY_SECONDS)
+    failed: list[int] = []
+    try:
+        owners = dict(ForecastBatch.objects.filter(pk__in=batch_ids).values_list("id", "chart__owner_id"))
+        for batch_id in batch_ids:
+            if batch_id not in owners:
+                continue
+            events.publish_status(owners[batch_id], "forecast_batch", batch_id, "processing")
+            try:
+                with transaction.atomic():
+                    batch = ForecastBatch.objects.select_for_update().select_related("chart").get(pk=batch_id)
+                    services.generate_forecast_batch(batch=batch)
+            except Exception:
+                logger.exception("forecasts.generate_forecast_batches_async.batch_failed", batch_id=batch_id)
+                failed.append(batch_id)
+                continue
+            events.publish_status(owners[batch_id], "forecast_batch", batch_id, batch.status)
+    finally:
+        daily.release_slot(slot)
+
+    progress = daily.record_progress(run_id, done=len(batch_ids) - len(failed), failed=len(failed))
+    logger.info("forecasts.generate_forecast_batches_async.progress", run_id=run_id, **progress)
+    # Failed batches fall back to the single-batch task, which retries with backoff.
+    for batch_id in failed:
+        generate_forecast_batch_async.delay(batch_id=batch_id)
+
+
+@shared_task(time_limit=60 * 30)
+def build_transit_table_async(force: bool = False) -> None:
+    if not force and transit_table.is_current(transit_table.read_metadata()):
+        logger.info("forecasts.build_transit_table_async.skipped")
+        return
+    if not HAS_SWISSEPH:
+        # A mean-motion table would be shared by every forecast; keep computing per batch.
+        logger.warning("forecasts.build_transit_table_async.no_ephemeris")
+        return
+    transit_table.build_table(SwissEphemerisClient())
+
+
+@shared_task(time_limit=60 * 30)
+def build_lunar_calendar_async(force: bool = False) -> None:
+    if not force and lunar_calendar.is_current(lunar_calendar.read_metadata()):
+        logger.info("forecasts.build_lunar_calendar_async.skipped")
+        return
+    if not HAS_SWISSEPH:
+        # Mean motion puts phases and ingresses hours off; better no calendar.
+        logger.warning("forecasts.build_lunar_calendar_async.no_ephemeris")
+        return
+    lunar_calendar.build_calendar()
+
+
+async def in_flight_forecast_batches(user_id: int) -> list[dict]:
+    queryset = ForecastBatch.objects.filter(
+        chart__owner_id=user_id, status__in=("pending", "processing")
+    ).values("id", "status")
+    return [
+        {"type": "forecast_batch", "id": row["id"], "status": row["status"]}
+        async for row in queryset[:100]
+    ]
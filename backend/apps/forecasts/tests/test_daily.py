@@ -0,0 +1,80 @@
+import datetime as dt
+
+import pytest
+
+from apps.accounts.models import UserProfile
+from apps.core import events
+from apps.forecasts import daily, transits
+from apps.forecasts.models import ForecastBatch
+from apps.forecasts.tasks import generate_forecast_batches_async
+
+LOCAL_DATE = dt.date(2024, 3, 10)
+TOKYO = dt.timedelta(hours=9)
+
+
+@pytest.fixture
+def tokyo_chart(chart, user, location):
+    chart.profile = UserProfile.objects.create(
+        user=user,
+        birth_datetime=chart.event_datetime,
+        birth_location=location,
+        timezone="Asia/Tokyo",
+    )
+    chart.save(update_fields=["profile"])
+    return chart
+
+
+def test_day_batch_covers_the_local_day(tokyo_chart):
+    assert daily.create_daily_batches(["Asia/Tokyo"], LOCAL_DATE, TOKYO) == 1
+
+    batch = ForecastBatch.objects.get(chart=tokyo_chart)
+    assert transits.batch_window(batch) == (
+        dt.datetime(2024, 3, 9, 15, tzinfo=dt.timezone.utc),
+        dt.datetime(2024, 3, 10, 15, tzinfo=dt.timezone.utc),
+    )
+
+
+def test_batches_are_claimed_once(tokyo_chart):
+    daily.create_daily_batches(["Asia/Tokyo"], LOCAL_DATE, TOKYO)
+    batch = ForecastBatch.objects.get(chart=tokyo_chart)
+
+    claimed = daily.claim_daily_batches(["Asia/Tokyo"], LOCAL_DATE, "run")
+
+    assert claimed == [batch.pk]
+    assert daily.claim_daily_batches(["Asia/Tokyo"], LOCAL_DATE, "run") == []
+    claimed_batch = ForecastBatch.objects.get(pk=batch.pk)
+    assert claimed_batch.metadata["daily_run"] == "run"
+    assert claimed_batch.updated_at > batch.updated_at
+
+
+def test_claim_keeps_existing_metadata(tokyo_chart):
+    daily.create_daily_batches(["Asia/Tokyo"], LOCAL_DATE, TOKYO)
+    ForecastBatch.objects.filter(chart=tokyo_chart).update(metadata={"requested_by": "support"})
+
+    daily.claim_daily_batches(["Asia/Tokyo"], LOCAL_DATE, "run")
+
+    assert ForecastBatch.objects.get(chart=tokyo_chart).metadata == {"requested_by": "support", "daily_run": "run"}
+
+
+def test_claim_skips_charts_the_daily_run_does_not_cover(tokyo_chart):
+    daily.create_daily_batches(["Asia/Tokyo"], LOCAL_DATE, TOKYO)
+    tokyo_chart.owner.is_active = False
+    tokyo_chart.owner.save(update_fields=["is_active"])
+
+    assert daily.claim_daily_batches(["Asia/Tokyo"], LOCAL_DATE, "run") == []
+
+
+def test_chunk_task_announces_each_batch(tokyo_chart, monkeypatch):
+    published = []
+    monkeypatch.setattr(events, "publish_status", lambda *args, **kwargs: published.append(args))
+    daily.create_daily_batches(["Asia/Tokyo"], LOCAL_DATE, TOKYO)
+    batch_ids = daily.claim_daily_batches(["Asia/Tokyo"], LOCAL_DATE, "run")
+
+    generate_forecast_batches_async.apply(args=(batch_ids, "run"))
+
+    batch = ForecastBatch.objects.get(pk=batch_ids[0])
+    assert batch.status == "ready"
+    assert published == [
+        (tokyo_chart.owner_id, "forecast_batch", batch.pk, "processing"),
+        (tokyo_chart.owner_id, "forecast_batch", batch.pk, "ready"),
+    ]
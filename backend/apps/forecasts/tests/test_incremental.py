@@ -0,0 +1,69 @@
+import datetime as dt
+from dataclasses import replace
+
+import pytest
+
+from apps.forecasts import progressions, services, transits
+from apps.forecasts.models import ForecastBatch
+from apps.integrations.ephemeris import HAS_SWISSEPH
+
+MINUTE = dt.timedelta(minutes=1)
+
+
+def _batch(chart, start, end, horizon=ForecastBatch.Horizon.MONTH):
+    return ForecastBatch.objects.create(chart=chart, horizon=horizon, start_date=start, end_date=end)
+
+
+def _summary(events):
+    return sorted(
+        (services._event_key(event), event.start, event.end, event.orb, event.intensity, event.exact_times)
+        for event in events
+    )
+
+
+@pytest.mark.skipif(not HAS_SWISSEPH, reason="needs the Swiss Ephemeris")
+def test_extended_batch_matches_a_full_computation(chart, settings):
+    settings.EPHEMERIS_PROVIDER = "swiss"
+    source = _batch(chart, dt.date(2024, 1, 1), dt.date(2024, 2, 29))
+    services.generate_forecast_batch(source)
+    batch = _batch(chart, dt.date(2024, 2, 1), dt.date(2024, 3, 31))
+
+    extended, ephemeris, incremental = services._extend_events(batch, services._find_overlapping_batch(batch))
+    full, _source = services._compute_events(batch, transits.batch_window(batch))
+
+    assert ephemeris == "swiss"
+    assert incremental["source_batch"] == source.id
+    assert any("recomputed" in window for window in incremental["computed"])
+    assert len(extended) == len(full)
+    for got, expected in zip(_summary(extended), _summary(full)):
+        assert got[0] == expected[0]
+        assert abs(got[1] - expected[1]) <= MINUTE and abs(got[2] - expected[2]) <= MINUTE
+        assert got[3] == pytest.approx(expected[3], abs=0.05)
+        assert got[4] == pytest.approx(expected[4], abs=0.05)
+        assert len(got[5]) == len(expected[5])
+
+
+def test_stub_batches_are_not_reused(chart):
+    source = _batch(chart, dt.date(2024, 1, 1), dt.date(2024, 1, 31))
+    services.generate_forecast_batch(source)
+    assert "stub" in source.metadata["ephemeris"]
+
+    assert services._find_overlapping_batch(_batch(chart, dt.date(2024, 1, 15), dt.date(2024, 2, 14))) is None
+
+
+def test_stub_progressions_are_recorded(chart, monkeypatch):
+    compute_transits = transits.compute_transits
+
+    def swiss_transits(*args, **kwargs):
+        events, series = compute_transits(*args, **kwargs)
+        return events, replace(series, source="swiss")
+
+    monkeypatch.setattr(transits, "compute_transits", swiss_transits)
+    batch = _batch(chart, dt.date(2024, 1, 1), dt.date(2028, 12, 31), horizon=ForecastBatch.Horizon.FIVE_YEARS)
+    start = transits.batch_window(batch)[0]
+    window = (start, start + dt.timedelta(days=60))
+
+    _events, ephemeris = services._compute_events(batch, window)
+
+    assert progressions.compute_progressions(batch, window=window)[1].source == "stub"
+    assert ephemeris == "stub,swiss"
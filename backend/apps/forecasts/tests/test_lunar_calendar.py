@@ -0,0 +1,38 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from apps.forecasts import lunar_calendar
+
+START = dt.datetime(2021, 3, 1, tzinfo=dt.timezone.utc)
+END = dt.datetime(2021, 4, 1, tzinfo=dt.timezone.utc)
+
+
+@pytest.fixture
+def calendar_settings(settings, db, monkeypatch):
+    settings.LUNAR_CALENDAR_START_YEAR = 2021
+    settings.LUNAR_CALENDAR_END_YEAR = 2021
+    monkeypatch.setattr(lunar_calendar, "_loaded", None)
+    monkeypatch.setattr(lunar_calendar, "_checked_at", -np.inf)
+    return settings
+
+
+def test_calendar_is_loaded_from_the_database(calendar_settings, monkeypatch):
+    metadata = lunar_calendar.build_calendar()
+    # Another worker: nothing loaded in this process yet.
+    monkeypatch.setattr(lunar_calendar, "_loaded", None)
+    monkeypatch.setattr(lunar_calendar, "_checked_at", -np.inf)
+
+    window = lunar_calendar.lunar_window(START, END)
+
+    assert lunar_calendar.is_current(lunar_calendar.read_metadata())
+    assert lunar_calendar._loaded[0] == metadata["built_at"]
+    assert len(window["phases"]) >= 3
+    assert len(window["ingresses"]) >= 12
+    assert all(START <= phase["time"] < END for phase in window["phases"])
+
+
+def test_no_calendar_until_one_is_built(calendar_settings):
+    assert lunar_calendar.get_calendar() is None
+    assert lunar_calendar.lunar_window(START, END) is None
@@ -0,0 +1,62 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from apps.forecasts import transit_table
+from apps.integrations.ephemeris import StubEphemerisClient
+
+START = dt.datetime(2021, 3, 1, tzinfo=dt.timezone.utc)
+END = dt.datetime(2021, 3, 11, tzinfo=dt.timezone.utc)
+
+
+@pytest.fixture
+def table_settings(settings, db):
+    settings.TRANSIT_TABLE_START_YEAR = 2020
+    settings.TRANSIT_TABLE_END_YEAR = 2021
+    return settings
+
+
+def _new_worker(monkeypatch, settings, path):
+    """
+    Forget everything this process loaded, as a freshly started worker would.
+    """
+    settings.TRANSIT_TABLE_PATH = str(path)
+    monkeypatch.setattr(transit_table, "_loaded", None)
+    monkeypatch.setattr(transit_table, "_checked_at", -np.inf)
+
+
+def test_table_built_by_one_worker_is_loaded_by_another(table_settings, monkeypatch, tmp_path):
+    _new_worker(monkeypatch, table_settings, tmp_path / "builder" / "transit_table.npy")
+    metadata = transit_table.build_table(StubEphemerisClient())
+    built = transit_table.transit_series(("sun", "moon"), START, END, 6.0)
+
+    _new_worker(monkeypatch, table_settings, tmp_path / "reader" / "transit_table.npy")
+    loaded = transit_table.transit_series(("sun", "moon"), START, END, 6.0)
+
+    assert transit_table.is_current(transit_table.read_metadata())
+    assert (tmp_path / "reader" / "transit_table.npy").exists()
+    assert loaded.source == built.source == "table:stub"
+    np.testing.assert_array_equal(loaded.longitudes["moon"], built.longitudes["moon"])
+    assert transit_table.get_table() is transit_table.get_table()
+    assert metadata["built_at"] == transit_table._loaded[0]
+
+
+def test_rebuild_is_picked_up_after_the_check_interval(table_settings, monkeypatch, tmp_path):
+    _new_worker(monkeypatch, table_settings, tmp_path / "transit_table.npy")
+    transit_table.build_table(StubEphemerisClient())
+    first = transit_table.get_table()
+
+    rebuilt = transit_table.build_table(StubEphemerisClient())
+    assert transit_table.get_table() is first
+
+    monkeypatch.setattr(transit_table, "_checked_at", -np.inf)
+    assert transit_table.get_table() is not first
+    assert transit_table._loaded[0] == rebuilt["built_at"]
+
+
+def test_no_table_until_one_is_built(table_settings, monkeypatch, tmp_path):
+    _new_worker(monkeypatch, table_settings, tmp_path / "transit_table.npy")
+
+    assert transit_table.get_table() is None
+    assert transit_table.transit_series(("sun",), START, END, 6.0) is None
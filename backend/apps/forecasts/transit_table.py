@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import datetime as dt
+import io
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+from django.conf import settings
+from django.utils import timezone
+
+from apps.forecasts.models import EphemerisTable
+from apps.integrations.ephemeris import (
+    BaseEphemerisClient,
+    LongitudeSeries,
+    hermite_interpolate,
+    julian_day,
+    time_grid,
+)
+
+logger = structlog.get_logger(__name__)
+
+TABLE_BODIES = (
+    "sun",
+    "moon",
+    "mercury",
+    "venus",
+    "mars",
+    "jupiter",
+    "saturn",
+    "uranus",
+    "neptune",
+    "pluto",
+    "north_node",
+)
+
+TABLE_NAME = "transit_table"
+# How long a worker trusts its loaded table before asking for a newer build.
+RELOAD_CHECK_SECONDS = 60.0
+
+_loaded: Optional[Tuple[str, "TransitTable"]] = None
+_checked_at = -np.inf
+_load_lock = threading.Lock()
+
+
+@dataclass
+class TransitTable:
+    """
+    Transiting positions shared by every forecast.
+
+    ``data`` has shape ``(rows, bodies, 2)``: longitude (0..360) and daily speed
+    as float32, one row every ``step_days`` from ``start_jd``. It is memory
+    mapped, so reading a window costs only the rows it spans.
+    """
+
+    data: np.ndarray
+    bodies: Tuple[str, ...]
+    start_jd: float
+    step_days: float
+    source: str
+
+    def series(
+        self,
+        slugs: Sequence[str],
+        start: dt.datetime,
+        end: dt.datetime,
+        step_hours: float,
+    ) -> Optional[LongitudeSeries]:
+        """
+        Same contract as ``EphemerisClient.get_longitude_series``; ``None`` when
+        the window or a body is not covered.
+        """
+        first, last = julian_day(start), julian_day(end)
+        if any(slug not in self.bodies for slug in slugs):
+            return None
+        lower = int((first - self.start_jd) // self.step_days)
+        upper = int(np.ceil((last - self.start_jd) / self.step_days))
+        if lower < 0 or upper >= len(self.data) or upper <= lower:
+            return None
+
+        times = time_grid(first, last, step_hours / 24.0)
+        samples = self.start_jd + self.step_days * np.arange(lower, upper + 1)
+        columns = [self.bodies.index(slug) for slug in slugs]
+        block = np.asarray(self.data[lower : upper + 1, columns], dtype=np.float64)
+        longitudes: Dict[str, np.ndarray] = {}
+        speeds: Dict[str, np.ndarray] = {}
+        for index, slug in enumerate(slugs):
+            unwrapped = np.unwrap(block[:, index, 0], period=360.0)
+            longitudes[slug] = hermite_interpolate(samples, unwrapped, block[:, index, 1], times)
+            speeds[slug] = np.interp(times, samples, block[:, index, 1])
+        return LongitudeSeries(
+            times=times, longitudes=longitudes, speeds=speeds, source=f"table:{self.source}"
+        )
+
+
+def local_paths() -> Tuple[Path, Path]:
+    """
+    This worker's copy of the shared table, memory mapped by ``get_table``.
+    """
+    data_path = Path(settings.TRANSIT_TABLE_PATH)
+    return data_path, data_path.with_suffix(".json")
+
+
+def table_parameters() -> dict:
+    start = dt.datetime(settings.TRANSIT_TABLE_START_YEAR, 1, 1, tzinfo=dt.timezone.utc)
+    end = dt.datetime(settings.TRANSIT_TABLE_END_YEAR + 1, 1, 1, tzinfo=dt.timezone.utc)
+    step_days = settings.TRANSIT_TABLE_STEP_HOURS / 24.0
+    return {
+        "bodies": list(TABLE_BODIES),
+        "start_jd": julian_day(start),
+        "step_days": step_days,
+        "rows": int(np.ceil((julian_day(end) - julian_day(start)) / step_days)) + 1,
+    }
+
+
+def read_metadata() -> Optional[dict]:
+    return EphemerisTable.objects.filter(name=TABLE_NAME).values_list("metadata", flat=True).first()
+
+
+def build_table(client: BaseEphemerisClient) -> dict:
+    """
+    Sample every table body over the configured years and store the table in
+    the database, where every worker picks it up.
+    """
+    parameters = table_parameters()
+    times = parameters["start_jd"] + parameters["step_days"] * np.arange(parameters["rows"])
+    data = np.empty((len(times), len(TABLE_BODIES), 2), dtype=np.float32)
+    for index, slug in enumerate(TABLE_BODIES):
+        longitudes, speeds = client.get_longitudes(slug, times)
+        data[:, index, 0] = longitudes
+        data[:, index, 1] = speeds
+
+    metadata = {
+        **parameters,
+        "source": client.provider,
+        "built_at": timezone.now().isoformat(),
+    }
+    payload = io.BytesIO()
+    np.save(payload, data)
+    EphemerisTable.objects.update_or_create(
+        name=TABLE_NAME, defaults={"metadata": metadata, "data": payload.getvalue()}
+    )
+    logger.info(
+        "forecasts.transit_table.built",
+        rows=len(times),
+        bodies=len(TABLE_BODIES),
+        bytes=data.nbytes,
+        source=client.provider,
+    )
+    return metadata
+
+
+def get_table() -> Optional[TransitTable]:
+    """
+    The current table, reloaded after a rebuild; ``None`` until one is built.
+
+    The database is asked for the build stamp at most every
+    ``RELOAD_CHECK_SECONDS``; a new build is copied to ``local_paths`` once
+    and memory mapped from there.
+    """
+    global _loaded, _checked_at
+    now = time.monotonic()
+    if now - _checked_at < RELOAD_CHECK_SECONDS:
+        return _loaded[1] if _loaded is not None else None
+
+    with _load_lock:
+        if now - _checked_at < RELOAD_CHECK_SECONDS:
+            return _loaded[1] if _loaded is not None else None
+        metadata = read_metadata()
+        _checked_at = now
+        if metadata is None:
+            _loaded = None
+            return None
+        if _loaded is not None and _loaded[0] == metadata["built_at"]:
+            return _loaded[1]
+        try:
+            data_path, metadata = _local_copy(metadata["built_at"])
+            data = np.load(data_path, mmap_mode="r")
+        except (OSError, ValueError) as exc:
+            logger.warning("forecasts.transit_table.unreadable", error=str(exc))
+            return None
+        if data.shape != (metadata["rows"], len(metadata["bodies"]), 2):
+            logger.warning("forecasts.transit_table.unreadable", error="shape mismatch")
+            return None
+        table = TransitTable(
+            data=data,
+            bodies=tuple(metadata["bodies"]),
+            start_jd=metadata["start_jd"],
+            step_days=metadata["step_days"],
+            source=metadata["source"],
+        )
+        _loaded = (metadata["built_at"], table)
+        return table
+
+
+def _local_copy(built_at: str) -> Tuple[Path, dict]:
+    """
+    This worker's copy of the build stamped ``built_at`` and its metadata,
+    downloaded when missing or stale.
+
+    Files are written next to the targets and renamed into place, so other
+    processes sharing the directory never map a partial table.
+    """
+    data_path, meta_path = local_paths()
+    try:
+        metadata = json.loads(meta_path.read_text())
+        if metadata.get("built_at") == built_at and data_path.exists():
+            return data_path, metadata
+    except (FileNotFoundError, ValueError):
+        pass
+
+    row = EphemerisTable.objects.filter(name=TABLE_NAME).values("metadata", "data").first()
+    if row is None:
+        raise FileNotFoundError("transit table is not built")
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_data = data_path.with_name(f".{data_path.name}.{os.getpid()}.partial")
+    partial_meta = meta_path.with_name(f".{meta_path.name}.{os.getpid()}.partial")
+    partial_data.write_bytes(bytes(row["data"]))
+    partial_meta.write_text(json.dumps(row["metadata"]))
+    os.replace(partial_data, data_path)
+    os.replace(partial_meta, meta_path)
+    return data_path, row["metadata"]
+
+
+def transit_series(
+    slugs: Sequence[str],
+    start: dt.datetime,
+    end: dt.datetime,
+    step_hours: float,
+) -> Optional[LongitudeSeries]:
+    table = get_table()
+    if table is None:
+        return None
+    return table.series(slugs, start, end, step_hours)
+
+
+def is_current(metadata: Optional[dict]) -> bool:
+    """
+    Whether a built table matches the configured bodies, years and step.
+    """
+    if metadata is None:
+        return False
+    return all(metadata.get(key) == value for key, value in table_parameters().items())
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+import structlog
+
+from apps.charts.models import Aspect, NatalChart
+from apps.forecasts.models import ForecastBatch
+from apps.integrations import solver
+from apps.integrations.ephemeris import (
+    EphemerisClient,
+    LongitudeSeries,
+    datetime_from_julian_day,
+    longitude_series,
+)
+
+logger = structlog.get_logger(__name__)
+
+ENGINE_VERSION = "1.1.0"
+
+Horizon = ForecastBatch.Horizon
+
+
+@dataclass(frozen=True)
+class HorizonProfile:
+    step_hours: float
+    bodies: Tuple[str, ...]
+
+
+PERSONAL_BODIES = ("sun", "mercury", "venus", "mars")
+SOCIAL_BODIES = ("jupiter", "saturn")
+OUTER_BODIES = ("uranus", "neptune", "pluto")
+
+# Grid step and transiting bodies per horizon: the longer the horizon, the
+# slower the bodies worth reporting. The grid only has to be finer than the
+# shortest orb window of its bodies; exact times come from the solver.
+HORIZON_PROFILES: Dict[str, HorizonProfile] = {
+    Horizon.DAY: HorizonProfile(1.0, ("moon",) + PERSONAL_BODIES + SOCIAL_BODIES + OUTER_BODIES),
+    Horizon.WEEK: HorizonProfile(1.0, ("moon",) + PERSONAL_BODIES + SOCIAL_BODIES + OUTER_BODIES),
+    Horizon.MONTH: HorizonProfile(4.0, PERSONAL_BODIES + SOCIAL_BODIES + OUTER_BODIES),
+    Horizon.QUARTER: HorizonProfile(6.0, PERSONAL_BODIES + SOCIAL_BODIES + OUTER_BODIES),
+    Horizon.YEAR: HorizonProfile(12.0, PERSONAL_BODIES + SOCIAL_BODIES + OUTER_BODIES),
+    Horizon.FIVE_YEARS: HorizonProfile(48.0, ("mars",) + SOCIAL_BODIES + OUTER_BODIES),
+    Horizon.TEN_YEARS: HorizonProfile(72.0, SOCIAL_BODIES + OUTER_BODIES),
+    Horizon.THIRTY_YEARS: HorizonProfile(72.0, SOCIAL_BODIES + OUTER_BODIES),
+}
+
+# Transits use major aspects only, with tighter orbs than the natal chart.
+TRANSIT_ASPECTS = {
+    Aspect.AspectType.CONJUNCTION: {"angle": 0.0, "orb": 2.0, "weight": 1.0},
+    Aspect.AspectType.OPPOSITION: {"angle": 180.0, "orb": 2.0, "weight": 0.9},
+    Aspect.AspectType.SQUARE: {"angle": 90.0, "orb": 2.0, "weight": 0.9},
+    Aspect.AspectType.TRINE: {"angle": 120.0, "orb": 2.0, "weight": 0.7},
+    Aspect.AspectType.SEXTILE: {"angle": 60.0, "orb": 1.5, "weight": 0.5},
+}
+
+# How much a transiting body colours a period; slow bodies dominate.
+BODY_WEIGHTS = {
+    "moon": 0.3,
+    "sun": 0.5,
+    "mercury": 0.4,
+    "venus": 0.4,
+    "mars": 0.6,
+    "jupiter": 0.75,
+    "saturn": 0.85,
+    "uranus": 0.9,
+    "neptune": 0.9,
+    "pluto": 1.0,
+}
+
+# The south node mirrors the north node, so it would only duplicate events.
+SKIPPED_NATAL_POINTS = ("south_node",)
+NATAL_ANGLES = ("asc", "mc")
+
+
+@dataclass
+class TransitEvent:
+    transiting: str
+    natal: str
+    aspect: str
+    start: dt.datetime
+    end: dt.datetime
+    exact: dt.datetime
+    exact_times: List[dt.datetime]
+    orb: float
+    intensity: float
+    retrograde: bool
+    technique: str = "transit"
+
+
+def natal_points(chart: NatalChart) -> Dict[str, float]:
+    """
+    Natal longitudes transits are measured against: bodies of the current
+    computation plus the ascendant and midheaven.
+    """
+    points = {
+        position.body.slug: float(position.absolute_degree)
+        for position in chart.current_planet_positions.select_related("body")
+        if position.body.slug not in SKIPPED_NATAL_POINTS
+    }
+    angles = (chart.metadata or {}).get("houses", {}).get("angles", {})
+    for name in NATAL_ANGLES:
+        if name in angles:
+            points[name] = float(angles[name])
+    return points
+
+
+def _aspect_table(rules: Dict[str, dict]) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    # Every aspect but conjunction and opposition can be formed from either side.
+    names, angles, orbs, weights = [], [], [], []
+    for aspect_type, rule in rules.items():
+        signed = (rule["angle"],) if rule["angle"] in (0.0, 180.0) else (rule["angle"], -rule["angle"])
+        for angle in signed:
+            names.append(aspect_type.value)
+            angles.append(angle)
+            orbs.append(rule["orb"])
+            weights.append(rule["weight"])
+    return names, np.array(angles), np.array(orbs), np.array(weights)
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Contiguous ``True`` runs down each column of a 2-D mask, as
+    ``(column, first_row, end_row)`` with ``end_row`` exclusive.
+    """
+    rows, columns = mask.shape
+    padded = np.zeros((columns, rows + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask.T
+    edges = np.diff(padded, axis=1)
+    start_columns, starts = np.nonzero(edges == 1)
+    _end_columns, ends = np.nonzero(edges == -1)
+    return start_columns, starts, ends
+
+
+def detect_transits(
+    series: LongitudeSeries,
+    points: Dict[str, float],
+    aspects: Dict[str, dict] = TRANSIT_ASPECTS,
+    body_weights: Dict[str, float] = BODY_WEIGHTS,
+    technique: str = "transit",
+    exclude_same_point: bool = False,
+) -> List[TransitEvent]:
+    """
+    Aspects of moving points in ``series`` to natal points, over the whole series.
+
+    Separations of every transiting body from every natal point and aspect
+    angle are evaluated on the grid at once. Each uninterrupted stretch within
+    orb becomes one event; the grid only brackets orb entry, exit and every
+    exact pass, which the solver then refines on interpolated positions.
+    """
+    aspect_names, aspect_angles, aspect_orbs, aspect_weights = _aspect_table(aspects)
+    point_names = list(points)
+    natal = np.array([points[name] for name in point_names])
+    targets = (natal[:, None] + aspect_angles[None, :]).ravel()
+    orbs = np.tile(aspect_orbs, len(point_names))
+    times = series.times
+    events: List[TransitEvent] = []
+
+    for slug, longitudes in series.longitudes.items():
+        signed = solver.signed_separation(longitudes[:, None], targets[None, :])
+        separation = np.abs(signed)
+        inside = separation <= orbs
+        if exclude_same_point and slug in points:
+            inside.reshape(len(times), len(point_names), -1)[:, point_names.index(slug)] = False
+        columns, starts, ends = _runs(inside)
+
+        # Orb entry and exit; runs touching the window edges are clipped to it.
+        start_times = times[starts]
+        entering = starts > 0
+        start_times[entering] = solver.orb_crossings(
+            series,
+            slug,
+            targets[columns[entering]],
+            orbs[columns[entering]],
+            times[starts[entering] - 1],
+            times[starts[entering]],
+        )
+        end_times = times[ends - 1]
+        leaving = ends < len(times)
+        end_times[leaving] = solver.orb_crossings(
+            series,
+            slug,
+            targets[columns[leaving]],
+            orbs[columns[leaving]],
+            times[ends[leaving] - 1],
+            times[ends[leaving]],
+        )
+
+        # Exact passes: sign changes between consecutive samples within orb.
+        # A retrograde station inside the orb yields several of them per run.
+        changes = inside[:-1] & inside[1:] & (np.signbit(signed[:-1]) != np.signbit(signed[1:]))
+        rows, change_columns = np.nonzero(changes)
+        passes = solver.exact_times(series, slug, targets[change_columns], times[rows], times[rows + 1])
+        run_keys = columns * len(times) + starts
+        owners = np.searchsorted(run_keys, change_columns * len(times) + rows, side="right") - 1
+        passes_by_run: Dict[int, List[float]] = {}
+        for owner, moment in sorted(zip(owners.tolist(), passes.tolist())):
+            passes_by_run.setdefault(owner, []).append(moment)
+
+        for run, (column, start, end) in enumerate(zip(columns.tolist(), starts.tolist(), ends.tolist())):
+            peak = start + int(np.argmin(separation[start:end, column]))
+            point_index, aspect_index = divmod(column, len(aspect_names))
+            exact = [datetime_from_julian_day(moment) for moment in passes_by_run.get(run, [])]
+            orb = 0.0 if exact else float(separation[peak, column])
+            closeness = 1.0 - orb / float(aspect_orbs[aspect_index])
+            events.append(
+                TransitEvent(
+                    transiting=slug,
+                    natal=point_names[point_index],
+                    aspect=aspect_names[aspect_index],
+                    start=datetime_from_julian_day(start_times[run]),
+                    end=datetime_from_julian_day(end_times[run]),
+                    exact=exact[0] if exact else datetime_from_julian_day(times[peak]),
+                    exact_times=exact,
+                    orb=round(orb, 3),
+                    intensity=round(
+                        closeness * float(aspect_weights[aspect_index]) * body_weights.get(slug, 0.5), 3
+                    ),
+                    retrograde=bool(series.speeds[slug][peak] < 0),
+                    technique=technique,
+                )
+            )
+
+    events.sort(key=lambda event: (event.start, -event.intensity))
+    return events
+
+
+def batch_window(batch: ForecastBatch) -> Tuple[dt.datetime, dt.datetime]:
+    """
+    UTC bounds of the batch days, counted from midnight at the batch's offset.
+    """
+    offset = dt.timedelta(minutes=batch.utc_offset_minutes)
+    start = dt.datetime.combine(batch.start_date, dt.time(), tzinfo=dt.timezone.utc) - offset
+    end = dt.datetime.combine(batch.end_date + dt.timedelta(days=1), dt.time(), tzinfo=dt.timezone.utc) - offset
+    return start, end
+
+
+def compute_transits(
+    batch: ForecastBatch,
+    client: EphemerisClient | None = None,
+    window: Tuple[dt.datetime, dt.datetime] | None = None,
+) -> Tuple[List[TransitEvent], LongitudeSeries]:
+    """
+    Transit events of ``batch`` over ``window`` (the batch's own dates by default).
+    """
+    profile = HORIZON_PROFILES[batch.horizon]
+    points = natal_points(batch.chart)
+    if not points:
+        raise ValueError(f"chart {batch.chart_id} has no computed positions")
+
+    start, end = window or batch_window(batch)
+    series = longitude_series(profile.bodies, start, end, profile.step_hours, client)
+    events = detect_transits(series, points)
+    logger.info(
+        "forecasts.transits.computed",
+        batch_id=batch.id,
+        horizon=batch.horizon,
+        points=len(series.times),
+        events=len(events),
+        source=series.source,
+    )
+    return events, series
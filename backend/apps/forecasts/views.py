@@ -1,21 +1,47 @@
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import APIException, NotFound, PermissionDenied
 
+from apps.core.mixins import ConditionalGetMixin
+from apps.core.pagination import KeysetPagination
+from apps.forecasts.lunar_calendar import lunar_window
 from apps.forecasts.models import ForecastBatch
-from apps.forecasts.serializers import ForecastBatchSerializer
+from apps.forecasts.scores import ScoreSeries
+from apps.forecasts.serializers import (
+    BestDaySerializer,
+    BestDaysQuerySerializer,
+    ForecastBatchSerializer,
+    ForecastEntryFilterSerializer,
+    ForecastEntrySerializer,
+    LunarCalendarQuerySerializer,
+    LunarCalendarSerializer,
+)
 from apps.forecasts.tasks import generate_forecast_batch_async
 
 
-class ForecastBatchViewSet(viewsets.ModelViewSet):
+class ForecastBatchPagination(KeysetPagination):
+    ordering = ("-start_date", "-id")
+
+
+class ForecastEntryPagination(KeysetPagination):
+    ordering = ("timeframe_start", "id")
+
+
+class LunarCalendarUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Лунный календарь для этого периода пока не построен."
+    default_code = "lunar_calendar_unavailable"
+
+
+class ForecastBatchViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = ForecastBatchSerializer
     permission_classes = (permissions.IsAuthenticated,)
+    pagination_class = ForecastBatchPagination
 
     def get_queryset(self):
         return (
             ForecastBatch.objects.select_related("chart", "chart__owner")
-            .prefetch_related("entries")
             .filter(chart__owner=self.request.user)
         )
 
@@ -32,3 +58,53 @@ class ForecastBatchViewSet(viewsets.ModelViewSet):
         generate_forecast_batch_async.delay(batch_id=batch.id, force=True)
         return Response({"status": "queued"}, status=status.HTTP_202_ACCEPTED)
 
+    @action(detail=True, methods=["get"], pagination_class=ForecastEntryPagination)
+    def entries(self, request, pk=None):
+        """
+        Entries in timeframe order; ``?start=`` / ``?end=`` keep those overlapping the period.
+        """
+        batch = self.get_object()
+        params = ForecastEntryFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = batch.entries.all()
+        if "start" in params.validated_data:
+            queryset = queryset.filter(timeframe_end__gte=params.validated_data["start"])
+        if "end" in params.validated_data:
+            queryset = queryset.filter(timeframe_start__lt=params.validated_data["end"])
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(ForecastEntrySerializer(page, many=True).data)
+
+    @action(detail=True, methods=["get"], url_path="best-days")
+    def best_days(self, request, pk=None):
+        """
+        Best days of ``?theme=`` between ``?start=`` and ``?end=``: the ``?top=``
+        highest scores and/or every day scoring at least ``?threshold=``.
+        """
+        batch = self.get_object()
+        params = BestDaysQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+        row = batch.score_series.filter(theme=query["theme"]).first()
+        if row is None:
+            raise NotFound("Оценки дней для этого прогноза ещё не рассчитаны.")
+        days = ScoreSeries.from_row(row).best_days(
+            query.get("start"), query.get("end"), top=query.get("top"), threshold=query.get("threshold")
+        )
+        return Response(
+            {
+                "theme": query["theme"],
+                "days": BestDaySerializer([{"date": day, "score": score} for day, score in days], many=True).data,
+            }
+        )
+
+    @action(detail=False, methods=["get"], url_path="lunar-calendar")
+    def lunar_calendar(self, request):
+        """
+        Moon phases, sign ingresses and void-of-course periods between ``?start=`` and ``?end=``.
+        """
+        params = LunarCalendarQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        window = lunar_window(params.validated_data["start"], params.validated_data["end"])
+        if window is None:
+            raise LunarCalendarUnavailable()
+        return Response(LunarCalendarSerializer(window).data)
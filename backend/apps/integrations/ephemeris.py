@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import datetime as dt
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import requests
 import structlog
 from django.conf import settings
@@ -44,6 +45,44 @@ SWISS_BODIES = {
     "lilith": "MEAN_APOG",
 }
 
+# Sampling step of time series per body, in hours; the grid in between is
+# interpolated, which keeps long horizons cheap for slow bodies.
+SERIES_SAMPLE_HOURS = {
+    "moon": 2.0,
+    "sun": 12.0,
+    "mercury": 12.0,
+    "venus": 12.0,
+    "mars": 24.0,
+    "jupiter": 72.0,
+    "saturn": 120.0,
+    "uranus": 120.0,
+    "neptune": 120.0,
+    "pluto": 120.0,
+    "north_node": 120.0,
+    "south_node": 120.0,
+    "lilith": 24.0,
+}
+
+# Mean longitude at J2000 and mean daily motion, used by the stub series.
+MEAN_MOTION = {
+    "sun": (280.460, 0.985647),
+    "moon": (218.316, 13.176396),
+    "mercury": (252.251, 4.092339),
+    "venus": (181.980, 1.602131),
+    "mars": (355.433, 0.524033),
+    "jupiter": (34.351, 0.083091),
+    "saturn": (50.077, 0.033460),
+    "uranus": (314.055, 0.011733),
+    "neptune": (304.349, 0.005981),
+    "pluto": (238.929, 0.003968),
+    "north_node": (125.045, -0.052954),
+    "south_node": (305.045, -0.052954),
+    "lilith": (263.353, 0.111404),
+}
+
+J2000 = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+
 try:
     import swisseph as swe  # type: ignore
 
@@ -79,6 +118,61 @@ def _resolve_house(longitude: float, cusps: Iterable[float]) -> int:
     return 12
 
 
+def julian_day(moment: dt.datetime) -> float:
+    return UNIX_EPOCH_JD + moment.timestamp() / 86400.0
+
+
+def datetime_from_julian_day(value: float) -> dt.datetime:
+    return dt.datetime.fromtimestamp(round((value - UNIX_EPOCH_JD) * 86400.0), tz=dt.timezone.utc)
+
+
+def hermite_interpolate(
+    times: np.ndarray, values: np.ndarray, derivatives: np.ndarray, at: np.ndarray
+) -> np.ndarray:
+    """
+    Cubic Hermite interpolation of samples with known daily rates of change.
+    """
+    index = np.clip(np.searchsorted(times, at, side="right") - 1, 0, len(times) - 2)
+    width = times[index + 1] - times[index]
+    s = (at - times[index]) / width
+    s2, s3 = s * s, s * s * s
+    return (
+        (2 * s3 - 3 * s2 + 1) * values[index]
+        + (s3 - 2 * s2 + s) * width * derivatives[index]
+        + (3 * s2 - 2 * s3) * values[index + 1]
+        + (s3 - s2) * width * derivatives[index + 1]
+    )
+
+
+def time_grid(first: float, last: float, step_days: float) -> np.ndarray:
+    """
+    Julian days from ``first`` every ``step_days``, always ending exactly at ``last``.
+    """
+    times = np.arange(first, last - 1e-9, step_days)
+    return np.append(times, last)
+
+
+@dataclass
+class LongitudeSeries:
+    """
+    Ecliptic longitudes of several bodies on a common grid of Julian days (UT).
+
+    Longitudes are unwrapped, i.e. continuous rather than reduced to 0..360,
+    so they can be interpolated and differenced directly.
+    """
+
+    times: np.ndarray
+    longitudes: Dict[str, np.ndarray]
+    speeds: Dict[str, np.ndarray]
+    source: str
+
+    def position(self, slug: str, at: np.ndarray) -> np.ndarray:
+        """
+        Unwrapped longitude of ``slug`` between grid points.
+        """
+        return hermite_interpolate(self.times, self.longitudes[slug], self.speeds[slug], at)
+
+
 def _format_body_payload(
     slug: str,
     longitude: float,
@@ -105,6 +199,12 @@ class BaseEphemerisClient:
     def get_natal_ephemeris(self, dt_utc: dt.datetime, location: Location) -> dict[str, Any]:
         raise NotImplementedError
 
+    def get_longitudes(self, slug: str, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Longitude and daily speed of ``slug`` at each Julian day of ``times``.
+        """
+        raise NotImplementedError
+
 
 class SwissEphemerisClient(BaseEphemerisClient):
     provider = "swiss"
@@ -138,11 +238,13 @@ class SwissEphemerisClient(BaseEphemerisClient):
                     }
                     continue
 
-            longitude, latitude, distance, speed = swe.calc_ut(julian_day, body_id)
+            (body_longitude, body_latitude, distance, speed, *_), _flags = swe.calc_ut(
+                julian_day, body_id, swe.FLG_SPEED
+            )
             bodies[slug] = _format_body_payload(
                 slug=slug,
-                longitude=longitude,
-                latitude=latitude,
+                longitude=body_longitude,
+                latitude=body_latitude,
                 distance_au=distance,
                 speed=speed,
                 cusps=cusps,
@@ -169,6 +271,19 @@ class SwissEphemerisClient(BaseEphemerisClient):
         logger.info("integrations.ephemeris.swiss.success", datetime=dt_utc.isoformat())
         return payload
 
+    def get_longitudes(self, slug: str, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if slug == "south_node":
+            longitudes, speeds = self.get_longitudes("north_node", times)
+            return _normalise_degree(longitudes + 180.0), speeds
+        body_id = getattr(swe, SWISS_BODIES[slug])
+        longitudes = np.empty(len(times))
+        speeds = np.empty(len(times))
+        for index, julian in enumerate(times.tolist()):
+            (longitudes[index], _lat, _dist, speeds[index], *_), _flags = swe.calc_ut(
+                julian, body_id, swe.FLG_SPEED
+            )
+        return longitudes, speeds
+
     @staticmethod
     def _calc_julian_day(dt_utc: dt.datetime) -> float:
         utc = dt_utc.replace(tzinfo=None)
@@ -248,6 +363,12 @@ class StubEphemerisClient(BaseEphemerisClient):
             "bodies": bodies,
         }
 
+    def get_longitudes(self, slug: str, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Mean motion only: no retrogrades, good to a few degrees for planets.
+        epoch_longitude, daily_motion = MEAN_MOTION[slug]
+        longitudes = _normalise_degree(epoch_longitude + daily_motion * (times - J2000))
+        return longitudes, np.full(len(times), daily_motion)
+
 
 @dataclass
 class EphemerisClient:
@@ -257,7 +378,7 @@ class EphemerisClient:
         self.provider = self.provider or settings.EPHEMERIS_PROVIDER
 
     def get_natal_ephemeris(self, dt_utc: dt.datetime, location: Location) -> dict[str, Any]:
-        cache_key = f"ephemeris:{self.provider}:{location.id}:{dt_utc.isoformat()}"
+        cache_key = f"ephemeris:{self.provider}:{self._location_key(location)}:{dt_utc.isoformat()}"
         cached = cache.get(cache_key)
         if cached:
             logger.debug("integrations.ephemeris.cache.hit", key=cache_key)
@@ -274,6 +395,54 @@ class EphemerisClient:
             cache.set(cache_key, fallback, timeout=24 * 60 * 60)
             return fallback
 
+    def get_longitude_series(
+        self,
+        slugs: Sequence[str],
+        start: dt.datetime,
+        end: dt.datetime,
+        step_hours: float,
+    ) -> LongitudeSeries:
+        """
+        Longitudes of ``slugs`` every ``step_hours`` from ``start`` through ``end``.
+
+        Each body is sampled at the coarser of the grid step and its own
+        ``SERIES_SAMPLE_HOURS`` and interpolated onto the grid.
+        """
+        first, last = julian_day(start), julian_day(end)
+        times = time_grid(first, last, step_hours / 24.0)
+        try:
+            client = self._get_client()
+            return self._sample_series(client, slugs, times)
+        except Exception as exc:
+            logger.exception("integrations.ephemeris.series.error", provider=self.provider, error=str(exc))
+            return self._sample_series(StubEphemerisClient(), slugs, times)
+
+    @staticmethod
+    def _sample_series(client: BaseEphemerisClient, slugs: Sequence[str], times: np.ndarray) -> LongitudeSeries:
+        grid_step = times[1] - times[0]
+        longitudes: Dict[str, np.ndarray] = {}
+        speeds: Dict[str, np.ndarray] = {}
+        for slug in slugs:
+            sample_step = max(grid_step, SERIES_SAMPLE_HOURS.get(slug, 24.0) / 24.0)
+            samples = np.arange(times[0], times[-1] + sample_step, sample_step)
+            sampled_longitudes, sampled_speeds = client.get_longitudes(slug, samples)
+            unwrapped = np.unwrap(sampled_longitudes, period=360.0)
+            longitudes[slug] = hermite_interpolate(samples, unwrapped, sampled_speeds, times)
+            speeds[slug] = np.interp(times, samples, sampled_speeds)
+        logger.debug(
+            "integrations.ephemeris.series",
+            provider=client.provider,
+            bodies=len(slugs),
+            points=len(times),
+        )
+        return LongitudeSeries(times=times, longitudes=longitudes, speeds=speeds, source=client.provider)
+
+    @staticmethod
+    def _location_key(location: Location) -> str:
+        if location.pk is not None:
+            return str(location.pk)
+        return f"{location.latitude},{location.longitude}"
+
     def _get_client(self) -> BaseEphemerisClient:
         if self.provider == "swiss" and HAS_SWISSEPH:
             return SwissEphemerisClient()
@@ -285,3 +454,35 @@ class EphemerisClient:
             return SwissEphemerisClient()
         return StubEphemerisClient()
 
+
+SeriesSource = Callable[[Sequence[str], dt.datetime, dt.datetime, float], Optional[LongitudeSeries]]
+
+_series_sources: List[SeriesSource] = []
+
+
+def register_series_source(source: SeriesSource) -> None:
+    """
+    Register a precomputed source of longitude series, such as a shared table.
+
+    A source returns ``None`` when it does not cover a request.
+    """
+    _series_sources.append(source)
+
+
+def longitude_series(
+    slugs: Tuple[str, ...],
+    start: dt.datetime,
+    end: dt.datetime,
+    step_hours: float,
+    client: EphemerisClient | None = None,
+) -> LongitudeSeries:
+    """
+    Read from the first registered source covering the window; sample the
+    ephemeris otherwise or when a client is given explicitly.
+    """
+    if client is None:
+        for source in _series_sources:
+            series = source(slugs, start, end, step_hours)
+            if series is not None:
+                return series
+    return (client or EphemerisClient()).get_longitude_series(slugs, start, end, step_hours)
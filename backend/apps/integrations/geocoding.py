@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Iterable, List
+from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 import requests
 import structlog
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
 from django.db import transaction
@@ -15,6 +18,8 @@ from apps.core.models import Location
 
 logger = structlog.get_logger(__name__)
 
+COORDINATE_QUANTUM = Decimal("0.000001")
+
 
 @dataclass
 class GeocodingResult:
@@ -22,20 +27,106 @@ class GeocodingResult:
     score: float
 
 
+@dataclass
+class GeocodingRequest:
+    url: str
+    params: Dict[str, Any]
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class PlaceCandidate:
+    """
+    A parsed provider hit that has not been stored yet.
+    """
+
+    latitude: Decimal
+    longitude: Decimal
+    defaults: Dict[str, str]
+    score: float
+
+
 class BaseGeocoder:
+    """
+    A provider is split into three steps: ``build_request`` (no I/O),
+    ``parse`` (no I/O) and ``store`` (database). The sync and async paths
+    share them and differ only in the HTTP client and the way they wait.
+    """
+
     name: str = "base"
     rate_limit_seconds: float = 1.0
     _last_call: float = 0.0
+    _next_async_slot: float = 0.0
 
-    def autocomplete(self, query: str, limit: int = 5) -> List[GeocodingResult]:
+    def build_request(self, query: str, limit: int) -> Optional[GeocodingRequest]:
+        """
+        HTTP request for ``query``; ``None`` when the provider is not configured.
+        """
         raise NotImplementedError
 
+    def parse(self, data: Any, limit: int) -> List[PlaceCandidate]:
+        raise NotImplementedError
+
+    def autocomplete(self, query: str, limit: int = 5) -> List[GeocodingResult]:
+        request = self.build_request(query, limit)
+        if request is None:
+            return []
+        self._respect_rate_limit()
+        response = requests.get(
+            request.url,
+            params=request.params,
+            headers=request.headers,
+            timeout=settings.GEOCODING_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        return self.store(self.parse(response.json(), limit))
+
+    async def afetch(self, query: str, limit: int, client: httpx.AsyncClient) -> List[PlaceCandidate]:
+        """
+        Query the provider without blocking the event loop; nothing is stored.
+        """
+        request = self.build_request(query, limit)
+        if request is None:
+            return []
+        await self._arespect_rate_limit()
+        response = await client.get(request.url, params=request.params, headers=request.headers)
+        response.raise_for_status()
+        return self.parse(response.json(), limit)
+
+    def store(self, candidates: List[PlaceCandidate]) -> List[GeocodingResult]:
+        results: List[GeocodingResult] = []
+        for candidate in candidates:
+            location, _ = Location.objects.get_or_create(
+                latitude=candidate.latitude,
+                longitude=candidate.longitude,
+                defaults=candidate.defaults,
+            )
+            results.append(GeocodingResult(location=location, score=candidate.score))
+        return results
+
     def _respect_rate_limit(self) -> None:
         delta = time.monotonic() - self._last_call
         if delta < self.rate_limit_seconds:
             time.sleep(self.rate_limit_seconds - delta)
         self._last_call = time.monotonic()
 
+    async def _arespect_rate_limit(self) -> None:
+        # Slots are reserved per provider class, so concurrent requests in one
+        # process queue up behind each other instead of bursting.
+        cls = type(self)
+        now = time.monotonic()
+        slot = max(now, cls._next_async_slot)
+        cls._next_async_slot = slot + self.rate_limit_seconds
+        if slot > now:
+            try:
+                await asyncio.sleep(slot - now)
+            except asyncio.CancelledError:
+                # A losing hedge never sent its request: hand the slot back,
+                # unless a later request has already queued behind it.
+                if cls._next_async_slot == slot + self.rate_limit_seconds:
+                    cls._next_async_slot = slot
+                raise
+
 
 class NominatimGeocoder(BaseGeocoder):
     name = "nominatim"
@@ -44,32 +135,31 @@ class NominatimGeocoder(BaseGeocoder):
     def __init__(self) -> None:
         self.base_url = settings.NOMINATIM_BASE_URL
 
-    def autocomplete(self, query: str, limit: int = 5) -> List[GeocodingResult]:
-        self._respect_rate_limit()
-        params = {
-            "q": query,
-            "format": "jsonv2",
-            "limit": limit,
-            "addressdetails": 1,
-            "extratags": 1,
-        }
-        headers = {"User-Agent": settings.NOMINATIM_USER_AGENT}
-
-        response = requests.get(self.base_url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        results: List[GeocodingResult] = []
+    def build_request(self, query: str, limit: int) -> Optional[GeocodingRequest]:
+        return GeocodingRequest(
+            url=self.base_url,
+            params={
+                "q": query,
+                "format": "jsonv2",
+                "limit": limit,
+                "addressdetails": 1,
+                "extratags": 1,
+            },
+            headers={"User-Agent": settings.NOMINATIM_USER_AGENT},
+        )
+
+    def parse(self, data: Any, limit: int) -> List[PlaceCandidate]:
+        candidates: List[PlaceCandidate] = []
         for item in data:
             try:
-                result = self._build_location(item)
+                candidate = self._build_candidate(item)
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("integrations.geocoding.nominatim.skip", reason=str(exc))
                 continue
-            results.append(result)
-        return results
+            candidates.append(candidate)
+        return candidates
 
-    def _build_location(self, payload: dict) -> GeocodingResult:
+    def _build_candidate(self, payload: dict) -> PlaceCandidate:
         lat = Decimal(payload["lat"])
         lon = Decimal(payload["lon"])
         address = payload.get("address", {})
@@ -80,134 +170,134 @@ class NominatimGeocoder(BaseGeocoder):
         timezone = payload.get("extratags", {}).get("timezone") or ""
         if not timezone:
             raise ValueError("timezone not provided")
-
-        with transaction.atomic():
-            location, _ = Location.objects.get_or_create(
-                latitude=lat.quantize(Decimal("0.000001")),
-                longitude=lon.quantize(Decimal("0.000001")),
-                defaults={
-                    "name": name[:255] or city or country,
-                    "city": city[:128],
-                    "state": state[:128],
-                    "country": country[:128],
-                    "timezone": timezone,
-                    "external_id": f"osm:{payload.get('osm_id')}",
-                },
-            )
-            # Refresh metadata if missing
-            updated_fields = []
-            if not location.name and name:
-                location.name = name[:255]
-                updated_fields.append("name")
-            if not location.state and state:
-                location.state = state[:128]
-                updated_fields.append("state")
-            if timezone and location.timezone != timezone:
-                location.timezone = timezone
-                updated_fields.append("timezone")
-            if updated_fields:
-                location.save(update_fields=updated_fields + ["updated_at"])
-
-        score = float(payload.get("importance", 0.0))
-        return GeocodingResult(location=location, score=score)
+        return PlaceCandidate(
+            latitude=lat.quantize(COORDINATE_QUANTUM),
+            longitude=lon.quantize(COORDINATE_QUANTUM),
+            defaults={
+                "name": name[:255] or city or country,
+                "city": city[:128],
+                "state": state[:128],
+                "country": country[:128],
+                "timezone": timezone,
+                "external_id": f"osm:{payload.get('osm_id')}",
+            },
+            score=float(payload.get("importance", 0.0)),
+        )
+
+    def store(self, candidates: List[PlaceCandidate]) -> List[GeocodingResult]:
+        results: List[GeocodingResult] = []
+        for candidate in candidates:
+            with transaction.atomic():
+                location, _ = Location.objects.get_or_create(
+                    latitude=candidate.latitude,
+                    longitude=candidate.longitude,
+                    defaults=candidate.defaults,
+                )
+                # Refresh metadata if missing
+                name = candidate.defaults["name"]
+                state = candidate.defaults["state"]
+                timezone = candidate.defaults["timezone"]
+                updated_fields = []
+                if not location.name and name:
+                    location.name = name
+                    updated_fields.append("name")
+                if not location.state and state:
+                    location.state = state
+                    updated_fields.append("state")
+                if timezone and location.timezone != timezone:
+                    location.timezone = timezone
+                    updated_fields.append("timezone")
+                if updated_fields:
+                    location.save(update_fields=updated_fields + ["updated_at"])
+            results.append(GeocodingResult(location=location, score=candidate.score))
+        return results
 
 
 class GeoapifyGeocoder(BaseGeocoder):
     name = "geoapify"
     rate_limit_seconds = 0.2
-    endpoint = "https://api.geoapify.com/v1/geocode/autocomplete"
 
-    def autocomplete(self, query: str, limit: int = 5) -> List[GeocodingResult]:
+    def build_request(self, query: str, limit: int) -> Optional[GeocodingRequest]:
         api_key = settings.GEOAPIFY_API_KEY
         if not api_key:
             logger.debug("integrations.geocoding.geoapify.disabled")
-            return []
-        self._respect_rate_limit()
-        params = {
-            "text": query,
-            "apiKey": api_key,
-            "limit": limit,
-        }
-        response = requests.get(self.endpoint, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        features = data.get("features", [])
-        results: List[GeocodingResult] = []
-        for feature in features:
+            return None
+        return GeocodingRequest(
+            url=settings.GEOAPIFY_ENDPOINT,
+            params={
+                "text": query,
+                "apiKey": api_key,
+                "limit": limit,
+            },
+        )
+
+    def parse(self, data: Any, limit: int) -> List[PlaceCandidate]:
+        candidates: List[PlaceCandidate] = []
+        for feature in data.get("features", []):
             properties = feature.get("properties", {})
             if "lat" not in properties or "lon" not in properties:
                 continue
-            timezone = properties.get("timezone") or "UTC"
-            location, _ = Location.objects.get_or_create(
-                latitude=Decimal(str(properties["lat"])).quantize(Decimal("0.000001")),
-                longitude=Decimal(str(properties["lon"])).quantize(Decimal("0.000001")),
-                defaults={
-                    "name": properties.get("formatted")[:255],
-                    "city": properties.get("city", "")[:128],
-                    "state": properties.get("state", "")[:128],
-                    "country": properties.get("country", "")[:128],
-                    "timezone": timezone,
-                    "external_id": f"geoapify:{properties.get('place_id')}",
-                },
-            )
-            results.append(
-                GeocodingResult(
-                    location=location,
+            candidates.append(
+                PlaceCandidate(
+                    latitude=Decimal(str(properties["lat"])).quantize(COORDINATE_QUANTUM),
+                    longitude=Decimal(str(properties["lon"])).quantize(COORDINATE_QUANTUM),
+                    defaults={
+                        "name": properties.get("formatted")[:255],
+                        "city": properties.get("city", "")[:128],
+                        "state": properties.get("state", "")[:128],
+                        "country": properties.get("country", "")[:128],
+                        "timezone": properties.get("timezone") or "UTC",
+                        "external_id": f"geoapify:{properties.get('place_id')}",
+                    },
                     score=float(properties.get("rank", {}).get("confidence", 0.0)),
                 )
             )
-        return results
+        return candidates
 
 
 class GoogleGeocoder(BaseGeocoder):
     name = "google"
-    endpoint = "https://maps.googleapis.com/maps/api/geocode/json"
 
-    def autocomplete(self, query: str, limit: int = 5) -> List[GeocodingResult]:
+    def build_request(self, query: str, limit: int) -> Optional[GeocodingRequest]:
         api_key = settings.GOOGLE_GEOCODING_API_KEY
         if not api_key:
             logger.debug("integrations.geocoding.google.disabled")
-            return []
-        self._respect_rate_limit()
-        params = {
-            "address": query,
-            "key": api_key,
-        }
-        response = requests.get(self.endpoint, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+            return None
+        return GeocodingRequest(
+            url=settings.GOOGLE_GEOCODING_ENDPOINT,
+            params={
+                "address": query,
+                "key": api_key,
+            },
+        )
+
+    def parse(self, data: Any, limit: int) -> List[PlaceCandidate]:
         if data.get("status") != "OK":
             logger.warning("integrations.geocoding.google.status", status=data.get("status"))
             return []
-        results: List[GeocodingResult] = []
+        candidates: List[PlaceCandidate] = []
         for result in data.get("results", [])[:limit]:
             geometry = result.get("geometry", {}).get("location", {})
             if not geometry:
                 continue
-            lat = Decimal(str(geometry["lat"])).quantize(Decimal("0.000001"))
-            lon = Decimal(str(geometry["lng"])).quantize(Decimal("0.000001"))
             address_components = {comp["types"][0]: comp["long_name"] for comp in result.get("address_components", []) if comp.get("types")}
             timezone = result.get("timezone") or "UTC"  # Requires additional API call; placeholder
-
-            location, _ = Location.objects.get_or_create(
-                latitude=lat,
-                longitude=lon,
-                defaults={
-                    "name": result.get("formatted_address", "")[:255],
-                    "city": address_components.get("locality", "")[:128],
-                    "state": address_components.get("administrative_area_level_1", "")[:128],
-                    "country": address_components.get("country", "")[:128],
-                    "timezone": timezone or "",
-                    "external_id": f"google:{result.get('place_id')}",
-                },
-            )
-            results.append(
-                GeocodingResult(
-                    location=location,
+            candidates.append(
+                PlaceCandidate(
+                    latitude=Decimal(str(geometry["lat"])).quantize(COORDINATE_QUANTUM),
+                    longitude=Decimal(str(geometry["lng"])).quantize(COORDINATE_QUANTUM),
+                    defaults={
+                        "name": result.get("formatted_address", "")[:255],
+                        "city": address_components.get("locality", "")[:128],
+                        "state": address_components.get("administrative_area_level_1", "")[:128],
+                        "country": address_components.get("country", "")[:128],
+                        "timezone": timezone or "",
+                        "external_id": f"google:{result.get('place_id')}",
+                    },
                     score=float(result.get("geometry", {}).get("location_type") == "ROOFTOP"),
                 )
             )
-        return results
+        return candidates
 
 
 class GeocodingService:
@@ -221,16 +311,12 @@ class GeocodingService:
         if not query_normalised:
             return []
 
-        cache_key = f"geocode:{query_normalised.lower()}:{limit}"
+        cache_key = self._cache_key(query_normalised, limit)
         cached_ids = cache.get(cache_key)
         if cached_ids:
             locations = Location.objects.in_bulk([item["id"] for item in cached_ids])
             logger.debug("integrations.geocoding.cache.hit", key=cache_key)
-            return [
-                GeocodingResult(location=locations[item["id"]], score=item["score"])
-                for item in cached_ids
-                if item["id"] in locations
-            ]
+            return self._from_cache(cached_ids, locations)
 
         for provider in self.providers:
             try:
@@ -250,13 +336,102 @@ class GeocodingService:
                 )
                 continue
             if results:
-                payload = [{"id": result.location.id, "score": result.score} for result in results]
-                cache.set(cache_key, payload, timeout=self.cache_timeout)
+                cache.set(cache_key, self._cache_payload(results), timeout=self.cache_timeout)
                 logger.info("integrations.geocoding.cache.store", provider=provider.name, key=cache_key)
                 return results
 
         return []
 
+    async def aautocomplete(self, query: str, limit: int = 5) -> List[GeocodingResult]:
+        """
+        Async variant of ``autocomplete`` with hedged provider requests.
+
+        The primary provider is queried first; if it has not answered after
+        ``GEOCODING_HEDGE_DELAY_MS`` (or fails, or finds nothing) the next one
+        is started as well. The first non-empty answer wins, the remaining
+        requests are cancelled, and only the winner's places are stored.
+        """
+        query_normalised = query.strip()
+        if not query_normalised:
+            return []
+
+        cache_key = self._cache_key(query_normalised, limit)
+        cached_ids = await cache.aget(cache_key)
+        if cached_ids:
+            locations = await Location.objects.ain_bulk([item["id"] for item in cached_ids])
+            logger.debug("integrations.geocoding.cache.hit", key=cache_key)
+            return self._from_cache(cached_ids, locations)
+
+        async with httpx.AsyncClient(timeout=settings.GEOCODING_TIMEOUT_SECONDS) as client:
+            winner = await self._hedged_fetch(query_normalised, limit, client)
+        if winner is None:
+            return []
+
+        provider, candidates = winner
+        results = await sync_to_async(provider.store)(candidates)
+        await cache.aset(cache_key, self._cache_payload(results), timeout=self.cache_timeout)
+        logger.info("integrations.geocoding.cache.store", provider=provider.name, key=cache_key)
+        return results
+
+    async def _hedged_fetch(
+        self, query: str, limit: int, client: httpx.AsyncClient
+    ) -> Optional[Tuple[BaseGeocoder, List[PlaceCandidate]]]:
+        waiting = [provider for provider in self.providers if provider.build_request(query, limit)]
+        hedge_delay = settings.GEOCODING_HEDGE_DELAY_MS / 1000
+        running: Dict[asyncio.Task, BaseGeocoder] = {}
+
+        def launch() -> None:
+            provider = waiting.pop(0)
+            running[asyncio.create_task(provider.afetch(query, limit, client))] = provider
+
+        try:
+            while waiting or running:
+                if not running:
+                    launch()
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=hedge_delay if waiting else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    logger.debug("integrations.geocoding.hedge", provider=waiting[0].name)
+                    launch()
+                    continue
+                for task in done:
+                    provider = running.pop(task)
+                    try:
+                        candidates = task.result()
+                    except Exception as exc:
+                        logger.warning(
+                            "integrations.geocoding.provider.error",
+                            provider=provider.name,
+                            error=str(exc),
+                        )
+                        continue
+                    if candidates:
+                        return provider, candidates
+            return None
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    @staticmethod
+    def _cache_key(query: str, limit: int) -> str:
+        return f"geocode:{query.lower()}:{limit}"
+
+    @staticmethod
+    def _cache_payload(results: List[GeocodingResult]) -> List[dict]:
+        return [{"id": result.location.id, "score": result.score} for result in results]
+
+    @staticmethod
+    def _from_cache(cached_ids: List[dict], locations: Dict[int, Location]) -> List[GeocodingResult]:
+        return [
+            GeocodingResult(location=locations[item["id"]], score=item["score"])
+            for item in cached_ids
+            if item["id"] in locations
+        ]
+
     def _build_providers(self) -> List[BaseGeocoder]:
         mapping = {
             "nominatim": NominatimGeocoder(),
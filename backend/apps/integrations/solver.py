@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from apps.integrations.ephemeris import LongitudeSeries
+
+# Solved times are good to about a minute.
+TOLERANCE_DAYS = 1.0 / 1440.0
+
+
+def signed_separation(longitudes: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Distance from ``targets`` in degrees, wrapped to [-180, 180).
+    """
+    return (longitudes - targets + 180.0) % 360.0 - 180.0
+
+
+def bisect(
+    func: Callable[[np.ndarray], np.ndarray],
+    lower: np.ndarray,
+    upper: np.ndarray,
+    tolerance: float = TOLERANCE_DAYS,
+) -> np.ndarray:
+    """
+    Refine brackets ``[lower, upper]``, each holding a sign change of ``func``.
+
+    ``func`` maps an array of times to an array of values, one per bracket, so
+    all brackets converge together in a fixed number of steps.
+    """
+    lower = np.asarray(lower, dtype=float).copy()
+    upper = np.asarray(upper, dtype=float).copy()
+    if not len(lower):
+        return lower
+    lower_values = func(lower)
+    widest = float(np.max(upper - lower))
+    for _ in range(max(0, int(np.ceil(np.log2(widest / tolerance))))):
+        middle = (lower + upper) / 2.0
+        values = func(middle)
+        # Same sign as the lower end: the root lies in the upper half.
+        upper_half = np.signbit(values) == np.signbit(lower_values)
+        lower = np.where(upper_half, middle, lower)
+        lower_values = np.where(upper_half, values, lower_values)
+        upper = np.where(upper_half, upper, middle)
+    return (lower + upper) / 2.0
+
+
+def exact_times(
+    series: LongitudeSeries,
+    slug: str,
+    targets: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> np.ndarray:
+    """
+    Moments ``slug`` reaches each target longitude inside its bracket.
+    """
+    return bisect(lambda at: signed_separation(series.position(slug, at), targets), lower, upper)
+
+
+def orb_crossings(
+    series: LongitudeSeries,
+    slug: str,
+    targets: np.ndarray,
+    orbs: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> np.ndarray:
+    """
+    Moments ``slug`` enters or leaves the orb around each target inside its bracket.
+    """
+    return bisect(
+        lambda at: np.abs(signed_separation(series.position(slug, at), targets)) - orbs,
+        lower,
+        upper,
+    )
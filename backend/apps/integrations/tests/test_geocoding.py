@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from apps.integrations.geocoding import GeoapifyGeocoder, GeocodingService, NominatimGeocoder
+
+NOMINATIM_PLACE = {
+    "lat": "55.7558",
+    "lon": "37.6173",
+    "display_name": "Москва, Россия",
+    "address": {"city": "Москва", "country": "Россия"},
+    "extratags": {"timezone": "Europe/Moscow"},
+    "osm_id": 1,
+    "importance": 0.9,
+}
+GEOAPIFY_PLACE = {
+    "properties": {
+        "lat": 59.9386,
+        "lon": 30.3141,
+        "formatted": "Санкт-Петербург, Россия",
+        "city": "Санкт-Петербург",
+        "country": "Россия",
+        "timezone": "Europe/Moscow",
+        "place_id": "spb",
+        "rank": {"confidence": 0.8},
+    }
+}
+
+
+class StandInProvider:
+    """
+    Local HTTP server answering for one geocoding provider.
+    """
+
+    def __init__(self, body, delay: float = 0.0, status: int = 200) -> None:
+        self.body, self.delay, self.status = body, delay, status
+        self.hits = 0
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                provider.hits += 1
+                time.sleep(provider.delay)
+                payload = json.dumps(provider.body).encode("utf-8")
+                self.send_response(provider.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                try:
+                    self.wfile.write(payload)
+                except OSError:
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def providers(settings, monkeypatch, db):
+    nominatim = StandInProvider([NOMINATIM_PLACE])
+    geoapify = StandInProvider({"features": [GEOAPIFY_PLACE]})
+    settings.GEOCODING_PRIMARY = "nominatim"
+    settings.GEOCODING_FALLBACK = "geoapify"
+    settings.GEOCODING_SECOND_FALLBACK = ""
+    settings.NOMINATIM_BASE_URL = nominatim.url
+    settings.GEOAPIFY_ENDPOINT = geoapify.url
+    settings.GEOAPIFY_API_KEY = "test"
+    settings.GEOCODING_HEDGE_DELAY_MS = 50
+    settings.GEOCODING_TIMEOUT_SECONDS = 5
+    monkeypatch.setattr(NominatimGeocoder, "_next_async_slot", 0.0)
+    monkeypatch.setattr(GeoapifyGeocoder, "_next_async_slot", 0.0)
+    yield nominatim, geoapify
+    nominatim.close()
+    geoapify.close()
+
+
+def _autocomplete(query):
+    return async_to_sync(GeocodingService().aautocomplete)(query)
+
+
+def test_primary_answer_is_stored_without_hedging(providers):
+    nominatim, geoapify = providers
+
+    results = _autocomplete("Москва")
+
+    assert [result.location.city for result in results] == ["Москва"]
+    assert (nominatim.hits, geoapify.hits) == (1, 0)
+
+
+def test_slow_primary_is_hedged_and_loses(providers):
+    nominatim, geoapify = providers
+    nominatim.delay = 1.0
+
+    started = time.monotonic()
+    results = _autocomplete("Петербург")
+
+    assert time.monotonic() - started < 1.0
+    assert [result.location.city for result in results] == ["Санкт-Петербург"]
+    assert geoapify.hits == 1
+
+
+def test_failing_primary_falls_back(providers):
+    nominatim, geoapify = providers
+    nominatim.status = 500
+
+    results = _autocomplete("Петербург")
+
+    assert [result.location.city for result in results] == ["Санкт-Петербург"]
+    assert nominatim.hits == 1
+
+
+def test_cancelled_request_releases_its_rate_limit_slot(providers):
+    nominatim, geoapify = providers
+    # An earlier request holds the Nominatim slot for the next half second.
+    held_until = time.monotonic() + 0.5
+    NominatimGeocoder._next_async_slot = held_until
+
+    results = _autocomplete("Петербург")
+
+    assert [result.location.city for result in results] == ["Санкт-Петербург"]
+    assert nominatim.hits == 0
+    assert NominatimGeocoder._next_async_slot == held_until
@@ -6,3 +6,8 @@ class ReportsConfig(AppConfig):
     name = "apps.reports"
     verbose_name = "Reports"
 
+    def ready(self) -> None:
+        from apps.core import events
+        from apps.reports.tasks import in_flight_reports
+
+        events.register_snapshot(in_flight_reports)
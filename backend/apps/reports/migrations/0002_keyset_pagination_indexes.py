@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['owner', '-created_at', '-id'], name='reports_rep_owner_i_2ab1e1_idx'),
+        ),
+    ]
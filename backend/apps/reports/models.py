@@ -36,4 +36,5 @@ class Report(TimeStampedModel):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [models.Index(fields=["owner", "-created_at", "-id"])]
 
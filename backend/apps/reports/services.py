@@ -61,19 +61,19 @@ def _build_context(report: Report) -> Dict[str, Any]:
     if chart:
         chart = (
             NatalChart.objects.prefetch_related(
-                "planet_positions__body",
-                "aspects__source_body",
-                "aspects__target_body",
-                "strength_metrics__body",
-                "integral_indicators",
+                "current_computation__planet_positions__body",
+                "current_computation__aspects__source_body",
+                "current_computation__aspects__target_body",
+                "current_computation__strength_metrics__body",
+                "current_computation__integral_indicators",
             )
-            .select_related("owner")
+            .select_related("owner", "current_computation")
             .get(pk=chart.pk)
         )
-        positions = chart.planet_positions.all()
-        aspects = chart.aspects.all()
-        strengths = chart.strength_metrics.all()
-        indicators = chart.integral_indicators.all()
+        positions = chart.current_planet_positions
+        aspects = chart.current_aspects
+        strengths = chart.current_strength_metrics
+        indicators = chart.current_integral_indicators
 
     return {
         "report": report,
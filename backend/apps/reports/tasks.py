@@ -4,6 +4,7 @@ import structlog
 from celery import shared_task
 from django.db import transaction
 
+from apps.core import events
 from apps.reports import services
 from apps.reports.models import Report
 
@@ -13,8 +14,27 @@ logger = structlog.get_logger(__name__)
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
 def generate_report_async(self, report_id: int, force: bool = False) -> None:
     logger.info("reports.generate_report_async.started", report_id=report_id, force=force)
-    with transaction.atomic():
-        report = Report.objects.select_for_update().get(pk=report_id)
-        services.generate_report(report=report, force=force)
+    owner_id = Report.objects.values_list("owner_id", flat=True).get(pk=report_id)
+    events.publish_status(owner_id, "report", report_id, Report.Status.GENERATING)
+    try:
+        with transaction.atomic():
+            report = Report.objects.select_for_update().get(pk=report_id)
+            services.generate_report(report=report, force=force)
+    except Exception:
+        events.publish_status(
+            owner_id,
+            "report",
+            report_id,
+            Report.Status.FAILED,
+            retrying=self.request.retries < self.max_retries,
+        )
+        raise
+    events.publish_status(owner_id, "report", report_id, report.status)
     logger.info("reports.generate_report_async.completed", report_id=report_id)
 
+
+async def in_flight_reports(user_id: int) -> list[dict]:
+    queryset = Report.objects.filter(
+        owner_id=user_id, status__in=(Report.Status.PENDING, Report.Status.GENERATING)
+    ).values("id", "status")
+    return [{"type": "report", "id": row["id"], "status": row["status"]} async for row in queryset[:100]]
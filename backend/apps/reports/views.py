@@ -3,14 +3,21 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError, PermissionDenied
 
+from apps.core.mixins import ConditionalGetMixin
+from apps.core.pagination import KeysetPagination
 from apps.reports.models import Report
 from apps.reports.serializers import ReportSerializer
 from apps.reports.tasks import generate_report_async
 
 
-class ReportViewSet(viewsets.ModelViewSet):
+class ReportPagination(KeysetPagination):
+    ordering = ("-created_at", "-id")
+
+
+class ReportViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = ReportSerializer
     permission_classes = (permissions.IsAuthenticated,)
+    pagination_class = ReportPagination
 
     def get_queryset(self):
         return Report.objects.filter(owner=self.request.user).order_by("-created_at")
@@ -0,0 +1,46 @@
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from apps.charts.models import NatalChart
+from apps.charts.services import calculate_natal_chart
+from apps.core.models import Location
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def user(db):
+    return get_user_model().objects.create_user(username="astro", password="secret")
+
+
+@pytest.fixture
+def location(db):
+    return Location.objects.create(
+        name="Москва",
+        city="Москва",
+        country="Россия",
+        latitude=Decimal("55.755800"),
+        longitude=Decimal("37.617300"),
+        timezone="Europe/Moscow",
+    )
+
+
+@pytest.fixture
+def chart(user, location):
+    chart = NatalChart.objects.create(
+        owner=user,
+        title="Натальная карта",
+        event_datetime=dt.datetime(1990, 5, 17, 8, 30, tzinfo=dt.timezone.utc),
+        event_location=location,
+    )
+    calculate_natal_chart(chart)
+    return chart
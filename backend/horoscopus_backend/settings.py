@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import importlib.util
 from pathlib import Path
 import environ
 import os
@@ -65,7 +66,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    "apps.core.middleware.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "apps.core.middleware.ReplicaRoutingMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -106,6 +109,16 @@ DATABASES = {
     )
 }
 
+# Optional read replica for safe-method API traffic (see apps.core.middleware).
+DATABASE_READ_REPLICA_ALIAS = None
+if env("DATABASE_REPLICA_URL", default=""):
+    DATABASES["replica"] = env.db("DATABASE_REPLICA_URL")
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+    DATABASE_READ_REPLICA_ALIAS = "replica"
+DATABASE_ROUTERS = ["apps.core.db_routers.PrimaryReplicaRouter"]
+DATABASE_REPLICA_PATH_PREFIX = "/api/"
+DATABASE_REPLICA_PIN_SECONDS = env.int("DATABASE_REPLICA_PIN_SECONDS", default=5)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -166,8 +179,23 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
         "rest_framework.filters.SearchFilter",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+        *(
+            renderer
+            for module, renderer in (
+                ("msgpack", "apps.core.renderers.MessagePackRenderer"),
+                ("cbor2", "apps.core.renderers.CBORRenderer"),
+            )
+            if importlib.util.find_spec(module)
+        ),
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 50,
+    "DEFAULT_THROTTLE_RATES": {
+        "chart_preview": env("CHART_PREVIEW_THROTTLE_RATE", default="30/min"),
+    },
 }
 
 CORS_ALLOWED_ORIGINS = env.list(
@@ -184,6 +212,24 @@ CELERY_RESULT_BACKEND = CELERY_BROKER_URL
 CELERY_TASK_DEFAULT_QUEUE = "horoscopus"
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 60 * 5
+CELERY_BEAT_SCHEDULE = {
+    "charts.collect_stale_computations": {
+        "task": "apps.charts.tasks.collect_stale_computations_async",
+        "schedule": 60 * 60,
+    },
+    "forecasts.build_transit_table": {
+        "task": "apps.forecasts.tasks.build_transit_table_async",
+        "schedule": 24 * 60 * 60,
+    },
+    "forecasts.build_lunar_calendar": {
+        "task": "apps.forecasts.tasks.build_lunar_calendar_async",
+        "schedule": 24 * 60 * 60,
+    },
+    "forecasts.schedule_daily_forecasts": {
+        "task": "apps.forecasts.tasks.schedule_daily_forecasts_async",
+        "schedule": 60 * 60,
+    },
+}
 
 LOGGING = {
     "version": 1,
@@ -240,7 +286,65 @@ NOMINATIM_DETAILS_URL = env(
 NOMINATIM_USER_AGENT = env("NOMINATIM_USER_AGENT", default="HoroscopusBot/1.0 (+contact@example.com)")
 GEOAPIFY_API_KEY = env("GEOAPIFY_API_KEY", default="")
 GOOGLE_GEOCODING_API_KEY = env("GOOGLE_GEOCODING_API_KEY", default="")
+GEOAPIFY_ENDPOINT = env("GEOAPIFY_ENDPOINT", default="https://api.geoapify.com/v1/geocode/autocomplete")
+GOOGLE_GEOCODING_ENDPOINT = env(
+    "GOOGLE_GEOCODING_ENDPOINT",
+    default="https://maps.googleapis.com/maps/api/geocode/json",
+)
+GEOCODING_TIMEOUT_SECONDS = env.float("GEOCODING_TIMEOUT_SECONDS", default=10.0)
+GEOCODING_HEDGE_DELAY_MS = env.int("GEOCODING_HEDGE_DELAY_MS", default=300)
 
 REPORTS_PDF_ENGINE = env("REPORTS_PDF_ENGINE", default="weasyprint")
 REPORTS_STORAGE = env("REPORTS_STORAGE", default="local")
 
+
+CELESTIAL_BODY_REGISTRY_CHECK_INTERVAL = env.int("CELESTIAL_BODY_REGISTRY_CHECK_INTERVAL", default=30)
+
+CHART_COMPUTATION_GC_GRACE_SECONDS = env.int("CHART_COMPUTATION_GC_GRACE_SECONDS", default=15 * 60)
+
+CHART_REPRESENTATION_VERSION = 1
+CHART_DETAIL_CACHE_TIMEOUT = env.int("CHART_DETAIL_CACHE_TIMEOUT", default=24 * 60 * 60)
+CHART_DETAIL_CACHE_FORMATS = ("json", "msgpack", "cbor")
+CHART_BATCH_MAX_IDS = env.int("CHART_BATCH_MAX_IDS", default=100)
+
+CHART_IMPORT_CHUNK_SIZE = env.int("CHART_IMPORT_CHUNK_SIZE", default=500)
+CHART_IMPORT_TASK_CHUNK_SIZE = env.int("CHART_IMPORT_TASK_CHUNK_SIZE", default=100)
+CHART_IMPORT_MAX_REPORTED_ERRORS = env.int("CHART_IMPORT_MAX_REPORTED_ERRORS", default=1000)
+
+CHART_PREVIEW_BUDGET_MS = env.int("CHART_PREVIEW_BUDGET_MS", default=50)
+CHART_PREVIEW_TIMEOUT_MS = env.int("CHART_PREVIEW_TIMEOUT_MS", default=250)
+CHART_PREVIEW_WORKERS = env.int("CHART_PREVIEW_WORKERS", default=4)
+CHART_RETURNS_CACHE_TIMEOUT = env.int("CHART_RETURNS_CACHE_TIMEOUT", default=30 * 24 * 60 * 60)
+
+EVENTS_BROKER = env("EVENTS_BROKER", default="redis")
+EVENTS_REDIS_URL = env("EVENTS_REDIS_URL", default=CELERY_BROKER_URL)
+EVENTS_CHANNEL_PREFIX = env("EVENTS_CHANNEL_PREFIX", default="horoscopus:events")
+EVENTS_HEARTBEAT_SECONDS = env.int("EVENTS_HEARTBEAT_SECONDS", default=15)
+EVENTS_RETRY_MS = env.int("EVENTS_RETRY_MS", default=3000)
+
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)
+COMPRESSION_GZIP_LEVEL = env.int("COMPRESSION_GZIP_LEVEL", default=6)
+COMPRESSION_BROTLI_QUALITY = env.int("COMPRESSION_BROTLI_QUALITY", default=5)
+COMPRESSION_CONTENT_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "application/cbor",
+)
+
+TRANSIT_TABLE_PATH = env("TRANSIT_TABLE_PATH", default=str(BASE_DIR / "data" / "transit_table.npy"))
+TRANSIT_TABLE_START_YEAR = env.int("TRANSIT_TABLE_START_YEAR", default=1950)
+TRANSIT_TABLE_END_YEAR = env.int("TRANSIT_TABLE_END_YEAR", default=2100)
+TRANSIT_TABLE_STEP_HOURS = env.int("TRANSIT_TABLE_STEP_HOURS", default=12)
+
+LUNAR_CALENDAR_START_YEAR = env.int("LUNAR_CALENDAR_START_YEAR", default=1950)
+LUNAR_CALENDAR_END_YEAR = env.int("LUNAR_CALENDAR_END_YEAR", default=2100)
+LUNAR_CALENDAR_MAX_DAYS = env.int("LUNAR_CALENDAR_MAX_DAYS", default=366)
+
+FORECAST_ENTRY_BATCH_SIZE = env.int("FORECAST_ENTRY_BATCH_SIZE", default=500)
+
+DAILY_FORECAST_LOCAL_HOUR = env.int("DAILY_FORECAST_LOCAL_HOUR", default=6)
+DAILY_FORECAST_LEAD_HOURS = env.int("DAILY_FORECAST_LEAD_HOURS", default=3)
+DAILY_FORECAST_CHUNK_SIZE = env.int("DAILY_FORECAST_CHUNK_SIZE", default=200)
+DAILY_FORECAST_MAX_CONCURRENCY = env.int("DAILY_FORECAST_MAX_CONCURRENCY", default=4)
+DAILY_FORECAST_CHUNK_TIME_LIMIT = env.int("DAILY_FORECAST_CHUNK_TIME_LIMIT", default=15 * 60)
+DAILY_FORECAST_RETRY_SECONDS = env.int("DAILY_FORECAST_RETRY_SECONDS", default=30)
@@ -0,0 +1,21 @@
+"""
+Settings for the pytest suite: local SQLite databases, in-process cache and events.
+"""
+
+from horoscopus_backend.settings import *  # noqa: F401,F403
+from horoscopus_backend.settings import BASE_DIR
+
+# Two separate SQLite databases, so replica routing is observable; routing
+# itself stays off unless a test turns it on.
+DATABASES = {
+    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "test-default.sqlite3"},
+    "replica": {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "test-replica.sqlite3"},
+}
+DATABASE_READ_REPLICA_ALIAS = None
+
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+ALLOWED_HOSTS = ["testserver", "localhost"]
+EVENTS_BROKER = "memory"
+EPHEMERIS_PROVIDER = "stub"
+CELERY_TASK_ALWAYS_EAGER = True